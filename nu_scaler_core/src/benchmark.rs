@@ -209,6 +209,7 @@ fn generate_test_pattern(width: u32, height: u32) -> Vec<u8> {
 /// Python-friendly benchmark function
 #[pyfunction]
 pub fn py_benchmark_upscaler(
+    py: Python<'_>,
     technology: &str,
     quality: &str,
     input_width: u32,
@@ -233,19 +234,21 @@ pub fn py_benchmark_upscaler(
         _ => UpscalingQuality::Quality,
     };
 
-    // Generate test pattern
-    let test_data = generate_test_pattern(input_width, input_height);
-
-    // Run benchmark
-    match benchmark_upscaler(
-        tech,
-        qual,
-        input_width,
-        input_height,
-        scale_factor,
-        frame_count,
-        &test_data,
-    ) {
+    // Generate the test pattern and run the benchmark without holding the GIL, so the GUI thread
+    // keeps running while the frames are timed
+    let outcome = py.allow_threads(|| {
+        let test_data = generate_test_pattern(input_width, input_height);
+        benchmark_upscaler(
+            tech,
+            qual,
+            input_width,
+            input_height,
+            scale_factor,
+            frame_count,
+            &test_data,
+        )
+    });
+    match outcome {
         Ok(result) => Ok(result.into()),
         Err(e) => Err(pyo3::exceptions::PyRuntimeError::new_err(format!(
             "Benchmark error: {}",
@@ -257,12 +260,14 @@ pub fn py_benchmark_upscaler(
 /// Python-friendly comparison benchmark
 #[pyfunction]
 pub fn py_run_comparison_benchmark(
+    py: Python<'_>,
     input_width: u32,
     input_height: u32,
     scale_factor: f32,
     frame_count: u32,
 ) -> PyResult<Vec<PyBenchmarkResult>> {
-    match run_upscaler_comparison(input_width, input_height, scale_factor, frame_count) {
+    let outcome = py.allow_threads(|| run_upscaler_comparison(input_width, input_height, scale_factor, frame_count));
+    match outcome {
         Ok(results) => Ok(results.into_iter().map(Into::into).collect()),
         Err(e) => Err(pyo3::exceptions::PyRuntimeError::new_err(format!(
             "Benchmark error: {}",
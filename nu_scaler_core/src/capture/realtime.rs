@@ -6,8 +6,8 @@ use std::io::ErrorKind;
 use std::sync::mpsc::{self, Receiver as StdReceiver, Sender as StdSender};
 // use std::sync::Mutex; // This was unused, removing for now. Add back if needed for other parts.
 use std::thread::{self, JoinHandle};
-use std::time::Instant;
-use std::sync::Arc;
+use std::time::{Duration, Instant};
+use std::sync::{Arc, Condvar, Mutex};
 use std::sync::atomic::Ordering;
 
 // +++ Added imports +++
@@ -38,7 +38,7 @@ use windows::{
 // Removed BOOL from this import as it's defined above in the cfg block
 use windows::Win32::Foundation::{HWND, LPARAM}; 
 use windows::Win32::UI::WindowsAndMessaging::{
-    EnumWindows, GetWindowTextW, IsWindowVisible, /*, FindWindowW*/
+    EnumWindows, GetWindowTextLengthW, GetWindowTextW, GetWindowThreadProcessId, IsWindowVisible, /*, FindWindowW*/
 }; // FindWindowW unused
 
 // windows-capture integration (v1.4)
@@ -65,6 +65,49 @@ const WORKER_CORE_ID: Option<usize> = None;  // Example: Some(3) to pin to core
 // Channel packet type update
 type FramePacket = (Vec<u8>, u32, u32); // (data, width, height)
 
+/// Wakes a consumer when the WGC worker has forwarded a new frame, so it doesn't have to poll get_frame().
+/// Notifications coalesce: any number of frames arriving before the next wait() produce a single wake-up.
+#[derive(Default)]
+pub struct FrameSignal {
+    state: Mutex<(bool, bool)>, // (frame pending, closed)
+    cv: Condvar,
+}
+
+impl FrameSignal {
+    pub fn notify(&self) {
+        let mut state = self.state.lock().unwrap();
+        if !state.0 {
+            state.0 = true;
+            self.cv.notify_all();
+        }
+    }
+
+    /// Wake any waiter for good; wait() returns None until reopen() is called.
+    pub fn close(&self) {
+        self.state.lock().unwrap().1 = true;
+        self.cv.notify_all();
+    }
+
+    pub fn reopen(&self) {
+        *self.state.lock().unwrap() = (false, false);
+    }
+
+    /// Some(true) if a frame arrived, Some(false) on timeout, None once the capture has stopped.
+    pub fn wait(&self, timeout: Duration) -> Option<bool> {
+        let guard = self.state.lock().unwrap();
+        let (mut state, _) = self
+            .cv
+            .wait_timeout_while(guard, timeout, |s| !s.0 && !s.1)
+            .unwrap();
+        if state.1 {
+            return None;
+        }
+        let pending = state.0;
+        state.0 = false;
+        Some(pending)
+    }
+}
+
 #[derive(Debug, Clone)]
 pub enum CaptureTarget {
     FullScreen,
@@ -179,6 +222,7 @@ pub struct ScreenCapture {
     // Store the crossbeam sender if needed to signal worker to stop, or rely on channel disconnect
     wgc_control_sender: Option<CrossbeamSender<FramePacket>>, // This is the cb_sender from start_wgc_capture
     stop_event: Arc<std::sync::atomic::AtomicBool>, // For graceful shutdown signal
+    frame_signal: Arc<FrameSignal>, // Notified by the WGC worker for every forwarded frame
 
     width: usize, // Note: scrap uses usize, WGC uses u32. Consider consistency or conversion.
     height: usize,
@@ -196,6 +240,7 @@ impl ScreenCapture {
             python_frame_receiver: None, 
             wgc_control_sender: None,
             stop_event: Arc::new(std::sync::atomic::AtomicBool::new(false)),
+            frame_signal: Arc::new(FrameSignal::default()),
             width: 0,
             height: 0,
             target: None,
@@ -241,10 +286,101 @@ impl ScreenCapture {
         ScreenCapture::enum_windows_internal()
     }
 
+    /// Title of the first visible, titled top-level window owned by `pid`.
+    /// The whole enumeration runs natively; only windows of that process have their title copied.
+    #[cfg(target_os = "windows")]
+    pub fn window_title_for_pid(pid: u32) -> Option<String> {
+        struct PidSearch {
+            pid: u32,
+            title: Option<String>,
+        }
+        unsafe extern "system" fn enum_pid_proc(hwnd: HWND, lparam: LPARAM) -> BOOL {
+            let search = &mut *(lparam.0 as *mut PidSearch);
+            if !IsWindowVisible(hwnd).as_bool() {
+                return BOOL(1);
+            }
+            let mut owner_pid: u32 = 0;
+            GetWindowThreadProcessId(hwnd, Some(&mut owner_pid as *mut u32));
+            if owner_pid != search.pid {
+                return BOOL(1);
+            }
+            let title_len = GetWindowTextLengthW(hwnd);
+            if title_len <= 0 {
+                return BOOL(1);
+            }
+            let mut title_buffer: Vec<u16> = vec![0; title_len as usize + 1];
+            let copied = GetWindowTextW(hwnd, &mut title_buffer);
+            if copied <= 0 {
+                return BOOL(1);
+            }
+            search.title = Some(String::from_utf16_lossy(&title_buffer[..copied as usize]));
+            BOOL(0) // Found one, stop enumerating
+        }
+        let mut search = PidSearch { pid, title: None };
+        unsafe {
+            // EnumWindows reports an error when the callback stops it early, so the result is ignored
+            let _ = EnumWindows(
+                Some(enum_pid_proc),
+                LPARAM(&mut search as *mut _ as isize),
+            );
+        }
+        search.title
+    }
+    #[cfg(not(target_os = "windows"))]
+    pub fn window_title_for_pid(_pid: u32) -> Option<String> {
+        None
+    }
+
+    /// Shared frame-arrival signal. Only window (WGC) captures notify it; FullScreen frames come from
+    /// scrap, which can only be polled.
+    pub fn frame_signal(&self) -> Arc<FrameSignal> {
+        self.frame_signal.clone()
+    }
+
     pub fn debug_print(&self, msg: &str) {
         println!("[ScreenCapture] {}", msg);
     }
 
+    /// Borrow the latest frame instead of returning an owned RGBA copy.
+    /// The closure receives the raw pixels, width, height and whether they are BGRA (still need a swizzle).
+    /// For FullScreen this hands over scrap's frame memory directly, so no per-frame Vec is allocated.
+    pub fn with_frame<R>(&mut self, f: impl FnOnce(&[u8], usize, usize, bool) -> R) -> Option<R> {
+        if !self.is_capturing.load(Ordering::Relaxed) {
+            return None;
+        }
+
+        match self.target.as_ref() {
+            Some(CaptureTarget::FullScreen) => {
+                let (width, height) = (self.width, self.height);
+                let capturer = self.scrap_capturer.as_mut()?;
+                match capturer.frame() {
+                    Ok(frame) => {
+                        if width == 0 || height == 0 {
+                            eprintln!("[ScreenCapture] Fullscreen dimensions not set!");
+                            return None;
+                        }
+                        if frame.len() != width * height * 4 {
+                            eprintln!("[ScreenCapture] Frame size mismatch (FullScreen)! Expected: {}, Got: {}", width * height * 4, frame.len());
+                            return None;
+                        }
+                        Some(f(&frame[..], width, height, true))
+                    }
+                    Err(ref e) if e.kind() == ErrorKind::WouldBlock => None, // No new frame
+                    Err(e) => {
+                        eprintln!("[ScreenCapture] Frame capture error (FullScreen): {}", e);
+                        self.stop();
+                        None
+                    }
+                }
+            }
+            // Window (GDI/WGC) frames already arrive as owned buffers in BGRA
+            _ => {
+                let (data, width, height) = self.get_frame()?;
+                Some(f(&data, width, height, true))
+            }
+        }
+    }
+
     fn stop_wgc_threads(&mut self) { // Renamed from stop_wgc for clarity
         self.debug_print("Stopping WGC threads...");
 
@@ -301,7 +437,7 @@ impl ScreenCapture {
                 };
                 
                 let (worker_handle, cb_sender_for_handler_flags, wgc_settings) = 
-                    start_wgc_capture_internal_setup(window, py_sender)?;
+                    start_wgc_capture_internal_setup(window, py_sender, self.frame_signal.clone())?;
                     
                 self.wgc_worker_thread_handle = Some(worker_handle);
                 self.wgc_control_sender = Some(cb_sender_for_handler_flags); // This is the cb_sender
@@ -342,7 +478,7 @@ impl ScreenCapture {
 
                 // Need a separate function to handle Monitor
                 let (worker_handle, cb_sender, wgc_settings) = 
-                    start_wgc_capture_monitor(monitor, py_sender)?;
+                    start_wgc_capture_monitor(monitor, py_sender, self.frame_signal.clone())?;
                     
                 self.wgc_worker_thread_handle = Some(worker_handle);
                 self.wgc_control_sender = Some(cb_sender);
@@ -407,6 +543,7 @@ impl RealTimeCapture for ScreenCapture {
         
         self.target = Some(target.clone());
         self.stop_event.store(false, Ordering::SeqCst); // Reset stop event
+        self.frame_signal.reopen();
 
         match target {
             CaptureTarget::FullScreen => {
@@ -448,6 +585,7 @@ impl RealTimeCapture for ScreenCapture {
         }
         
         self.stop_wgc_threads(); // Handles WGC related threads and sender
+        self.frame_signal.close(); // Release anyone blocked waiting for the next frame
         
         self.is_capturing.store(false, Ordering::SeqCst);
         self.running = false; // old flag
@@ -473,13 +611,9 @@ impl RealTimeCapture for ScreenCapture {
                                 eprintln!("[ScreenCapture] Frame size mismatch (FullScreen)! Expected: {}, Got: {}", expected_len, frame.len());
                                 return None;
                             }
-                            let mut rgba = Vec::with_capacity(expected_len);
-                            for chunk in frame.chunks_exact(4) {
-                                rgba.push(chunk[2]); // B
-                                rgba.push(chunk[1]); // G
-                                rgba.push(chunk[0]); // R
-                                rgba.push(chunk[3]); // A
-                            }
+                            // Swap R/B per pixel into a pre-sized buffer (no per-byte push bounds checks)
+                            let mut rgba = vec![0u8; expected_len];
+                            super::bgra_to_rgba(&mut rgba, &frame[..]);
                             Some((rgba, self.width, self.height))
                         }
                         Err(ref e) if e.kind() == ErrorKind::WouldBlock => None, // No new frame
@@ -564,6 +698,7 @@ mod x11_capture {
 fn start_wgc_capture_internal_setup(
     capture_item: windows_capture::window::Window,
     python_frame_sender: StdSender<Option<FramePacket>>,
+    frame_signal: Arc<FrameSignal>,
 ) -> Result<(JoinHandle<()>, CrossbeamSender<FramePacket>, Settings<CrossbeamSender<FramePacket>, windows_capture::window::Window>), String> {
     let (cb_sender, cb_receiver): (
         CrossbeamSender<FramePacket>,
@@ -583,6 +718,7 @@ fn start_wgc_capture_internal_setup(
                             eprintln!("[WGC Worker Thread] Python mpsc receiver disconnected. Stopping.");
                             break;
                         }
+                        frame_signal.notify();
                     }
                     Err(_) => {
                         eprintln!("[WGC Worker Thread] Crossbeam channel disconnected. Stopping worker.");
@@ -613,6 +749,7 @@ fn start_wgc_capture_internal_setup(
 fn start_wgc_capture_monitor(
     monitor: windows_capture::monitor::Monitor,
     python_frame_sender: StdSender<Option<FramePacket>>,
+    frame_signal: Arc<FrameSignal>,
 ) -> Result<(JoinHandle<()>, CrossbeamSender<FramePacket>, Settings<CrossbeamSender<FramePacket>, windows_capture::monitor::Monitor>), String> {
     let (cb_sender, cb_receiver): (
         CrossbeamSender<FramePacket>,
@@ -631,6 +768,7 @@ fn start_wgc_capture_monitor(
                             eprintln!("[WGC Worker Thread] Python mpsc receiver disconnected. Stopping.");
                             break;
                         }
+                        frame_signal.notify();
                     }
                     Err(_) => {
                         eprintln!("[WGC Worker Thread] Crossbeam channel disconnected. Stopping worker.");
@@ -10,6 +10,7 @@ use crate::gpu::GpuResources;
 use crate::upscale::{Upscaler, UpscalerFactory, UpscalingQuality, UpscalingTechnology};
 use crate::wgpu_interpolator::WgpuFrameInterpolator;
 use anyhow::{anyhow, Result};
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
 use pyo3::types::PyBytes;
 use std::sync::Arc;
@@ -24,7 +25,7 @@ pub mod upscale;
 // pub mod frame_interpolator; // CPU based, will be superseded
 pub mod wgpu_interpolator; // Added new GPU based module
 
-use capture::realtime::{CaptureTarget, ScreenCapture};
+use capture::realtime::{CaptureTarget, FrameSignal, ScreenCapture};
 use gpu::detector::{GpuInfo, GpuVendor};
 use upscale::{UpscaleAlgorithm, WgpuUpscaler};
 
@@ -101,14 +102,83 @@ impl PyWgpuUpscaler {
         Ok(())
     }
 
-    /// Upscale a frame (input: bytes, returns: bytes)
-    pub fn upscale<'py>(&self, py: Python<'py>, input: &PyBytes) -> PyResult<&'py PyBytes> {
-        let input_bytes = input.as_bytes();
-        let out = self
-            .inner
-            .upscale(input_bytes)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
-        Ok(PyBytes::new(py, &out))
+    /// Upscale a frame (input: any C-contiguous buffer such as bytes, bytearray, memoryview or
+    /// a numpy array; returns: bytes). The input must not be modified while the call runs.
+    pub fn upscale<'py>(&self, py: Python<'py>, input: &PyAny) -> PyResult<&'py PyBytes> {
+        // Read the caller's memory through the buffer protocol instead of requiring a bytes copy
+        let buffer = PyBuffer::<u8>::get(input)?;
+        if !buffer.is_c_contiguous() {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "Input buffer must be C-contiguous",
+            ));
+        }
+        // Safety: the buffer is contiguous and `buffer` keeps the exporting object alive until it
+        // is dropped at the end of this function.
+        let input_bytes = unsafe {
+            std::slice::from_raw_parts(buffer.buf_ptr() as *const u8, buffer.len_bytes())
+        };
+        let inner = &self.inner;
+        let (out_w, out_h) = inner.output_size();
+        // The GPU readback is copied straight into the new bytes object's buffer; the GIL is
+        // released while waiting on the GPU so other Python threads (e.g. the GUI) keep running
+        PyBytes::new_with(py, (out_w * out_h * 4) as usize, |out| {
+            py.allow_threads(|| inner.upscale_into(input_bytes, out))
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
+        })
+    }
+
+    /// Upscale a frame into a caller-provided writable buffer (bytearray, numpy array, ...) of
+    /// output_width * output_height * 4 bytes. Reusing the output buffer across frames avoids
+    /// allocating a new full-resolution bytes object per call.
+    pub fn upscale_into(&self, py: Python<'_>, input: &PyAny, output: &PyAny) -> PyResult<()> {
+        let in_buffer = PyBuffer::<u8>::get(input)?;
+        let out_buffer = PyBuffer::<u8>::get(output)?;
+        if out_buffer.readonly() {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "Output buffer must be writable",
+            ));
+        }
+        if !in_buffer.is_c_contiguous() || !out_buffer.is_c_contiguous() {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "Input and output buffers must be C-contiguous",
+            ));
+        }
+        let in_start = in_buffer.buf_ptr() as usize;
+        let out_start = out_buffer.buf_ptr() as usize;
+        if in_start < out_start + out_buffer.len_bytes() && out_start < in_start + in_buffer.len_bytes() {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "Input and output buffers must not overlap",
+            ));
+        }
+        // Safety: both buffers are contiguous, non-overlapping, and kept alive by their PyBuffer
+        // guards until the end of this function; the output was checked to be writable.
+        let input_bytes = unsafe {
+            std::slice::from_raw_parts(in_buffer.buf_ptr() as *const u8, in_buffer.len_bytes())
+        };
+        let output_bytes = unsafe {
+            std::slice::from_raw_parts_mut(out_buffer.buf_ptr() as *mut u8, out_buffer.len_bytes())
+        };
+        let inner = &self.inner;
+        py.allow_threads(|| inner.upscale_into(input_bytes, output_bytes))
+            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
+    }
+
+    /// Compile (or fetch from cache) the pipeline specialized for the given dimensions.
+    /// Returns True if a new pipeline was compiled, False on a cache hit.
+    /// The GIL is released during shader compilation, so a prebuild on a worker thread doesn't stall the GUI.
+    pub fn get_or_build_pipeline(
+        &mut self,
+        py: Python<'_>,
+        input_width: u32,
+        input_height: u32,
+        output_width: u32,
+        output_height: u32,
+    ) -> PyResult<bool> {
+        let inner = &mut self.inner;
+        py.allow_threads(|| {
+            inner.get_or_build_pipeline(input_width, input_height, output_width, output_height)
+        })
+        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
     }
 
     /// Reload the WGSL shader from a file path
@@ -223,6 +293,11 @@ impl PyScreenCapture {
     pub fn list_windows() -> Vec<String> {
         ScreenCapture::list_windows()
     }
+    /// Title of the first visible, titled window owned by `pid` (None if there is none or not on Windows).
+    #[staticmethod]
+    pub fn window_title_for_pid(pid: u32) -> Option<String> {
+        ScreenCapture::window_title_for_pid(pid)
+    }
     pub fn start(
         &mut self,
         target: PyCaptureTarget,
@@ -237,46 +312,54 @@ impl PyScreenCapture {
     pub fn stop(&mut self) {
         self.inner.stop();
     }
+    /// Handle that can be waited on from another thread until the next window (WGC) frame arrives.
+    pub fn frame_signal(&self) -> PyFrameSignal {
+        PyFrameSignal {
+            inner: self.inner.frame_signal(),
+        }
+    }
     pub fn get_frame<'py>(
         &mut self,
         py: Python<'py>,
     ) -> PyResult<Option<(PyObject, usize, usize)>> {
-        match self.inner.get_frame() {
-            Some((frame_data, width, height)) => {
-                // Check the target to see if conversion is needed
-                let rgba_data = match self.inner.target {
-                    // FullScreen capture (scrap) already returns RGBA (based on our conversion in realtime.rs)
-                    Some(CaptureTarget::FullScreen) => frame_data,
-                    // Window capture (GDI) returns BGRA, needs conversion
-                    Some(CaptureTarget::WindowByTitle(_)) | Some(CaptureTarget::Region { .. }) => {
-                        // Assume Region uses GDI too if implemented
-                        if frame_data.len() == width * height * 4 {
-                            let mut rgba = Vec::with_capacity(width * height * 4);
-                            for chunk in frame_data.chunks_exact(4) {
-                                // BGRA -> RGBA
-                                rgba.push(chunk[2]); // R
-                                rgba.push(chunk[1]); // G
-                                rgba.push(chunk[0]); // B
-                                rgba.push(chunk[3]); // A
-                            }
-                            rgba // Return the converted RGBA data
-                        } else {
-                            // Return original data if size is wrong (shouldn't happen often)
-                            println!(
-                                "[FFI] Warning: GDI frame size mismatch, skipping conversion."
-                            );
-                            frame_data
-                        }
-                    }
-                    None => frame_data, // Should not happen if capture started
-                };
-
-                // Return the (potentially converted) RGBA data as PyBytes
-                let py_bytes = PyBytes::new(py, &rgba_data);
-                Ok(Some((py_bytes.into(), width, height)))
-            }
-            None => Ok(None),
-        }
+        self.inner
+            .with_frame(|frame_data, width, height, is_bgra| {
+                if is_bgra && frame_data.len() == width * height * 4 {
+                    // BGRA -> RGBA written straight into the Python bytes buffer (one pass, no temporary Vec)
+                    let py_bytes = PyBytes::new_with(py, frame_data.len(), |out| {
+                        capture::bgra_to_rgba(out, frame_data);
+                        Ok(())
+                    })?;
+                    return Ok((py_bytes.into(), width, height));
+                }
+                if is_bgra {
+                    // Return original data if size is wrong (shouldn't happen often)
+                    println!("[FFI] Warning: GDI frame size mismatch, skipping conversion.");
+                }
+                let py_bytes = PyBytes::new(py, frame_data);
+                Ok((py_bytes.into(), width, height))
+            })
+            .transpose()
+    }
+}
+
+/// Frame-arrival notification for a PyScreenCapture, safe to use from any thread.
+#[pyclass]
+pub struct PyFrameSignal {
+    inner: Arc<FrameSignal>,
+}
+
+#[pymethods]
+impl PyFrameSignal {
+    /// Block (without holding the GIL) until a new frame arrives or `timeout_ms` passes.
+    /// Returns True for a frame, False on timeout and None once the capture has stopped.
+    pub fn wait(&self, py: Python<'_>, timeout_ms: u64) -> Option<bool> {
+        let inner = self.inner.clone();
+        py.allow_threads(move || inner.wait(std::time::Duration::from_millis(timeout_ms)))
+    }
+    /// Wake any waiter immediately, e.g. when the consumer shuts down.
+    pub fn close(&self) {
+        self.inner.close();
     }
 }
 
@@ -548,6 +631,19 @@ impl PyAdvancedWgpuUpscaler {
         }
     }
 
+    /// VRAM (used_mb, total_mb) as a plain tuple, for callers polling it periodically
+    pub fn get_vram_usage(&self) -> PyResult<(f32, f32)> {
+        match &self.gpu_resources {
+            Some(res) => {
+                let stats = res.get_vram_stats();
+                Ok((stats.used_mb, stats.total_mb))
+            }
+            None => Err(pyo3::exceptions::PyRuntimeError::new_err(
+                "No GPU resources available",
+            )),
+        }
+    }
+
     /// Set the memory allocation strategy
     pub fn set_memory_strategy(&self, strategy: &str) -> PyResult<()> {
         if let Some(resources) = &self.gpu_resources {
@@ -763,6 +859,7 @@ fn nu_scaler_core(_py: Python, m: &PyModule) -> PyResult<()> {
     // Add Python wrapper classes
     m.add_class::<PyWgpuUpscaler>()?;
     m.add_class::<PyScreenCapture>()?;
+    m.add_class::<PyFrameSignal>()?;
     m.add_class::<PyCaptureTarget>()?;
     m.add_class::<PyWindowByTitle>()?;
     m.add_class::<PyRegion>()?;
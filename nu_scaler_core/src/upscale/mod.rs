@@ -4,14 +4,14 @@ use crate::gpu::{
 };
 use anyhow::{anyhow, Result};
 use pyo3::prelude::*;
-use rayon::prelude::*;
 use std::any::Any;
+use std::collections::{HashMap, VecDeque};
 use std::fs::OpenOptions;
 use std::fs::{/*OpenOptions,*/ File};
 use std::io::{/*Write,*/ BufWriter};
 use std::path::PathBuf;
 use std::sync::atomic::{AtomicUsize, Ordering};
-use std::sync::Arc;
+use std::sync::{Arc, Mutex};
 use std::time::Instant;
 use wgpu::util::DeviceExt;
 use wgpu::{
@@ -180,7 +180,8 @@ impl Upscaler for MockUpscaler {
     }
 }
 
-/// WGSL compute shader with dynamic dimensions via uniform buffer (Nearest Neighbor)
+/// WGSL compute shader (Nearest Neighbor).
+/// Dimensions are pipeline-overridable constants so each cached pipeline has its scale factors inlined.
 const NN_UPSCALE_SHADER: &str = r#"
 struct Dimensions {
     in_width: u32,
@@ -192,20 +193,25 @@ struct Dimensions {
 @group(0) @binding(1) var<storage, read_write> output_img: array<u32>;
 @group(0) @binding(2) var<uniform> dims: Dimensions;
 
-@compute @workgroup_size(8, 8)
+override IN_WIDTH: u32 = 1u;
+override IN_HEIGHT: u32 = 1u;
+override OUT_WIDTH: u32 = 1u;
+override OUT_HEIGHT: u32 = 1u;
+
+@compute @workgroup_size(16, 16)
 fn main(@builtin(global_invocation_id) gid: vec3<u32>) {
-    if (gid.x >= dims.out_width || gid.y >= dims.out_height) {
+    if (gid.x >= OUT_WIDTH || gid.y >= OUT_HEIGHT) {
         return;
     }
-    let src_x = (gid.x * dims.in_width) / dims.out_width;
-    let src_y = (gid.y * dims.in_height) / dims.out_height;
-    let src_idx = src_y * dims.in_width + src_x;
-    let dst_idx = gid.y * dims.out_width + gid.x;
+    let src_x = (gid.x * IN_WIDTH) / OUT_WIDTH;
+    let src_y = (gid.y * IN_HEIGHT) / OUT_HEIGHT;
+    let src_idx = src_y * IN_WIDTH + src_x;
+    let dst_idx = gid.y * OUT_WIDTH + gid.x;
     output_img[dst_idx] = input_img[src_idx];
 }
 "#;
 
-/// WGSL compute shader for bilinear upscaling (RGBA8, dynamic dimensions)
+/// WGSL compute shader for bilinear upscaling (RGBA8, dimensions as pipeline-overridable constants)
 const BILINEAR_UPSCALE_SHADER: &str = r#"
 struct Dimensions {
     in_width: u32,
@@ -217,51 +223,110 @@ struct Dimensions {
 @group(0) @binding(1) var<storage, read_write> output_img: array<u32>;
 @group(0) @binding(2) var<uniform> dims: Dimensions;
 
-fn unpack_rgba8(p: u32) -> vec4<f32> {
-    return vec4<f32>(
-        f32((p >> 0) & 0xFF),
-        f32((p >> 8) & 0xFF),
-        f32((p >> 16) & 0xFF),
-        f32((p >> 24) & 0xFF)
-    ) / 255.0;
+override IN_WIDTH: u32 = 1u;
+override IN_HEIGHT: u32 = 1u;
+override OUT_WIDTH: u32 = 1u;
+override OUT_HEIGHT: u32 = 1u;
+// Input pixels per output pixel, folded to a constant at pipeline creation
+override SCALE_X: f32 = 1.0;
+override SCALE_Y: f32 = 1.0;
+
+// Channels stay as integers; weights are 8.8 fixed point so no float math is needed per channel
+fn unpack_rgba8(p: u32) -> vec4<u32> {
+    return vec4<u32>(p & 0xFFu, (p >> 8u) & 0xFFu, (p >> 16u) & 0xFFu, p >> 24u);
 }
-fn pack_rgba8(v: vec4<f32>) -> u32 {
-    let r = u32(clamp(v.x, 0.0, 1.0) * 255.0);
-    let g = u32(clamp(v.y, 0.0, 1.0) * 255.0);
-    let b = u32(clamp(v.z, 0.0, 1.0) * 255.0);
-    let a = u32(clamp(v.w, 0.0, 1.0) * 255.0);
-    return (a << 24) | (b << 16) | (g << 8) | r;
+fn pack_rgba8(v: vec4<u32>) -> u32 {
+    let c = min(v, vec4<u32>(255u));
+    return (c.w << 24u) | (c.z << 16u) | (c.y << 8u) | c.x;
 }
 
-@compute @workgroup_size(8, 8)
-fn main(@builtin(global_invocation_id) gid: vec3<u32>) {
-    if (gid.x >= dims.out_width || gid.y >= dims.out_height) {
+// Each 16x16 output tile reads at most (16 / scale + 2)^2 input texels; for scale >= 1 that is 18x18
+const TILE: u32 = 16u;
+const TILE_IN: u32 = 18u;
+var<workgroup> tile: array<u32, 324>;
+
+// Fetch an input texel from the shared tile, falling back to global memory when it lies outside
+// (only happens when downscaling)
+fn fetch(x: u32, y: u32, base_x: u32, base_y: u32) -> u32 {
+    let lx = x - base_x;
+    let ly = y - base_y;
+    if (lx < TILE_IN && ly < TILE_IN) {
+        return tile[ly * TILE_IN + lx];
+    }
+    return input_img[y * IN_WIDTH + x];
+}
+
+@compute @workgroup_size(16, 16)
+fn main(
+    @builtin(global_invocation_id) gid: vec3<u32>,
+    @builtin(workgroup_id) wid: vec3<u32>,
+    @builtin(local_invocation_index) lidx: u32,
+) {
+    // Top-left input texel covered by this workgroup
+    let base_x = u32(f32(wid.x * TILE) * SCALE_X);
+    let base_y = u32(f32(wid.y * TILE) * SCALE_Y);
+
+    // Cooperative load of the input neighborhood: 256 threads, 324 texels, two uniform passes
+    for (var k = 0u; k < 2u; k = k + 1u) {
+        let i = lidx + k * TILE * TILE;
+        if (i < TILE_IN * TILE_IN) {
+            let sx = min(base_x + i % TILE_IN, IN_WIDTH - 1u);
+            let sy = min(base_y + i / TILE_IN, IN_HEIGHT - 1u);
+            tile[i] = input_img[sy * IN_WIDTH + sx];
+        }
+    }
+    workgroupBarrier();
+
+    if (gid.x >= OUT_WIDTH || gid.y >= OUT_HEIGHT) {
         return;
     }
-    let fx = f32(gid.x) * f32(dims.in_width) / f32(dims.out_width);
-    let fy = f32(gid.y) * f32(dims.in_height) / f32(dims.out_height);
+    let fx = f32(gid.x) * SCALE_X;
+    let fy = f32(gid.y) * SCALE_Y;
     let x0 = u32(fx);
     let y0 = u32(fy);
-    let x1 = min(x0 + 1, dims.in_width - 1);
-    let y1 = min(y0 + 1, dims.in_height - 1);
-    let dx = fx - f32(x0);
-    let dy = fy - f32(y0);
-    let idx00 = y0 * dims.in_width + x0;
-    let idx10 = y0 * dims.in_width + x1;
-    let idx01 = y1 * dims.in_width + x0;
-    let idx11 = y1 * dims.in_width + x1;
-    let c00 = unpack_rgba8(input_img[idx00]);
-    let c10 = unpack_rgba8(input_img[idx10]);
-    let c01 = unpack_rgba8(input_img[idx01]);
-    let c11 = unpack_rgba8(input_img[idx11]);
-    let c0 = mix(c00, c10, dx);
-    let c1 = mix(c01, c11, dx);
-    let c = mix(c0, c1, dy);
-    let dst_idx = gid.y * dims.out_width + gid.x;
+    let x1 = min(x0 + 1u, IN_WIDTH - 1u);
+    let y1 = min(y0 + 1u, IN_HEIGHT - 1u);
+    let wx = u32((fx - f32(x0)) * 256.0);
+    let wy = u32((fy - f32(y0)) * 256.0);
+    let c00 = unpack_rgba8(fetch(x0, y0, base_x, base_y));
+    let c10 = unpack_rgba8(fetch(x1, y0, base_x, base_y));
+    let c01 = unpack_rgba8(fetch(x0, y1, base_x, base_y));
+    let c11 = unpack_rgba8(fetch(x1, y1, base_x, base_y));
+    // Horizontal pass fits in 16 bits per channel (255 * 256), vertical pass in 24 bits
+    let c0 = c00 * (256u - wx) + c10 * wx;
+    let c1 = c01 * (256u - wx) + c11 * wx;
+    let c = (c0 * (256u - wy) + c1 * wy + 32768u) >> vec4<u32>(16u);
+    let dst_idx = gid.y * OUT_WIDTH + gid.x;
     output_img[dst_idx] = pack_rgba8(c);
 }
 "#;
 
+/// Specialized pipelines kept per upscaler; the oldest (other than the active one) is evicted past this
+const PIPELINE_CACHE_LIMIT: usize = 8;
+
+/// Workgroup edge length used by the built-in upscale shaders
+const UPSCALE_WORKGROUP_SIZE: u32 = 16;
+/// Workgroup size assumed for custom shaders whose `@workgroup_size` can't be read (the original 8x8 contract)
+const CUSTOM_SHADER_WORKGROUP_SIZE: (u32, u32) = (8, 8);
+
+/// Read the x/y workgroup size from the first `@workgroup_size(...)` attribute of a WGSL source.
+/// Returns None if it is missing or not given as integer literals (e.g. override constants).
+fn wgsl_workgroup_size(source: &str) -> Option<(u32, u32)> {
+    let start = source.find("@workgroup_size(")? + "@workgroup_size(".len();
+    let args = &source[start..start + source[start..].find(')')?];
+    let mut dims = args.split(',').map(|d| d.trim().trim_end_matches(|c| c == 'u' || c == 'i'));
+    let x = dims.next()?.parse().ok()?;
+    let y = match dims.next() {
+        Some(d) if !d.is_empty() => d.parse().ok()?,
+        _ => 1,
+    };
+    Some((x, y))
+}
+
+// Device and queue shared by every self-managed WgpuUpscaler in the process. Opening an adapter
+// and device is the most expensive setup step, so it is done once rather than per upscaler.
+static SHARED_DEVICE: Mutex<Option<(Arc<Device>, Arc<Queue>)>> = Mutex::new(None);
+
 /// GPU-accelerated upscaler using WGPU
 pub struct WgpuUpscaler {
     quality: UpscalingQuality,
@@ -279,7 +344,14 @@ pub struct WgpuUpscaler {
     gpu_resources: Option<Arc<GpuResources>>,
     // Upscaler resources
     shader: Option<ShaderModule>,
-    pipeline: Option<ComputePipeline>,
+    shader_is_builtin: bool,
+    // Workgroup size of the loaded shader; dispatches are sized from it
+    workgroup_size: (u32, u32),
+    pipeline_layout: Option<wgpu::PipelineLayout>,
+    // Compute pipelines specialized per (in_w, in_h, out_w, out_h)
+    pipeline_cache: HashMap<(u32, u32, u32, u32), ComputePipeline>,
+    // Keys of pipeline_cache, least recently built/used first
+    pipeline_order: VecDeque<(u32, u32, u32, u32)>,
     input_buffer: Option<Buffer>,
     output_buffer: Option<Buffer>,
     dimensions_buffer: Option<Buffer>,
@@ -314,7 +386,11 @@ impl WgpuUpscaler {
             queue: None,
             gpu_resources: None,
             shader: None,
-            pipeline: None,
+            shader_is_builtin: true,
+            workgroup_size: (UPSCALE_WORKGROUP_SIZE, UPSCALE_WORKGROUP_SIZE),
+            pipeline_layout: None,
+            pipeline_cache: HashMap::new(),
+            pipeline_order: VecDeque::new(),
             input_buffer: None,
             output_buffer: None,
             dimensions_buffer: None,
@@ -342,6 +418,11 @@ impl WgpuUpscaler {
         self.use_memory_pool = true; // Assume memory pool usage with shared resources
     }
 
+    /// Current output dimensions (width, height)
+    pub fn output_size(&self) -> (u32, u32) {
+        (self.output_width, self.output_height)
+    }
+
     pub fn set_adaptive_quality(&mut self, enabled: bool) {
         self.adaptive_quality = enabled;
     }
@@ -507,7 +588,8 @@ impl WgpuUpscaler {
         Ok(())
     }
 
-    // Blocking version for non-async contexts
+    // Blocking version for non-async contexts. Reuses the process-wide shared device if one has
+    // already been created, otherwise creates it and publishes it for later upscalers.
     fn ensure_wgpu_initialized(&mut self) -> Result<()> {
         if self.device.is_some() && self.queue.is_some() {
             return Ok(());
@@ -516,7 +598,21 @@ impl WgpuUpscaler {
             return Ok(());
         } // Already using shared resources
 
-        pollster::block_on(self.ensure_wgpu_initialized_async())
+        let mut shared = SHARED_DEVICE
+            .lock()
+            .map_err(|_| anyhow!("Shared WGPU device lock poisoned"))?;
+        if let Some((device, queue)) = shared.as_ref() {
+            self.device = Some(device.clone());
+            self.queue = Some(queue.clone());
+            self.use_memory_pool = false;
+            return Ok(());
+        }
+
+        pollster::block_on(self.ensure_wgpu_initialized_async())?;
+        if let (Some(device), Some(queue)) = (&self.device, &self.queue) {
+            *shared = Some((device.clone(), queue.clone()));
+        }
+        Ok(())
     }
 
     // Set GPU allocator preset
@@ -552,12 +648,15 @@ impl WgpuUpscaler {
         }
     }
 
-    // Load shader from path or use default
-    fn load_shader_module(&self, device: &Device) -> ShaderModule {
+    // Load shader from path or use default. Also returns whether the built-in shader was used and the
+    // workgroup size to dispatch with (read from the WGSL for custom shaders).
+    fn load_shader_module(&self, device: &Device) -> (ShaderModule, bool, (u32, u32)) {
+        let mut is_builtin = true;
         let shader_code = if !self.shader_path.is_empty() {
             match std::fs::read_to_string(&self.shader_path) {
                 Ok(code) => {
                     println!("[WgpuUpscaler] Loaded shader from: {}", self.shader_path);
+                    is_builtin = false;
                     code
                 }
                 Err(e) => {
@@ -580,22 +679,44 @@ impl WgpuUpscaler {
             }
         };
 
-        device.create_shader_module(ShaderModuleDescriptor {
+        let workgroup_size = if is_builtin {
+            (UPSCALE_WORKGROUP_SIZE, UPSCALE_WORKGROUP_SIZE)
+        } else {
+            wgsl_workgroup_size(&shader_code).unwrap_or_else(|| {
+                println!(
+                    "[WgpuUpscaler] Could not read @workgroup_size from '{}', assuming {}x{}",
+                    self.shader_path, CUSTOM_SHADER_WORKGROUP_SIZE.0, CUSTOM_SHADER_WORKGROUP_SIZE.1
+                );
+                CUSTOM_SHADER_WORKGROUP_SIZE
+            })
+        };
+
+        let module = device.create_shader_module(ShaderModuleDescriptor {
             label: Some(if self.algorithm == UpscaleAlgorithm::Bilinear {
                 "Bilinear Upscale Shader"
             } else {
                 "Nearest Neighbor Upscale Shader"
             }),
             source: ShaderSource::Wgsl(shader_code.into()),
-        })
+        });
+        (module, is_builtin, workgroup_size)
+    }
+
+    // Workgroup counts covering the whole output with the loaded shader's workgroup size
+    fn dispatch_size(&self) -> (u32, u32) {
+        let (wx, wy) = self.workgroup_size;
+        (
+            (self.output_width + wx - 1) / wx,
+            (self.output_height + wy - 1) / wy,
+        )
     }
 
     // Reload shader from a given path
     pub fn reload_shader(&mut self, path: &str) -> anyhow::Result<()> {
         self.shader_path = path.to_string();
-        // Invalidate current shader and pipeline to force re-creation on next upscale
+        // Invalidate current shader and pipelines to force re-creation on next upscale
         self.shader = None;
-        self.pipeline = None;
+        self.clear_pipelines();
         self.initialized = false; // Force re-init to rebuild pipeline
         println!(
             "[WgpuUpscaler] Shader path set to: '{}'. Will reload on next upscale.",
@@ -604,29 +725,127 @@ impl WgpuUpscaler {
         Ok(())
     }
 
-    // Batch upscale multiple frames. This is a simple parallel map over upscale().
-    // For true batching on GPU, a different shader/pipeline structure would be needed.
+    // Batch upscale multiple frames with one queue submission (and one readback map) per chunk.
+    // All inputs are uploaded into a single staging buffer; for each frame the encoder records a
+    // copy into the input buffer, the dispatch, and a copy of the result into a shared readback
+    // buffer, so the submit/map/poll round-trip of upscale() is paid once per chunk, not per frame.
     pub fn upscale_batch(&self, frames: &[&[u8]]) -> Result<Vec<Vec<u8>>> {
         if !self.initialized {
             return Err(anyhow!(
                 "Upscaler not initialized. Call initialize() first."
             ));
         }
+        if frames.is_empty() {
+            return Ok(Vec::new());
+        }
+
+        let (device, queue) = match (self.device(), self.queue()) {
+            (Some(d), Some(q)) => (d, q),
+            _ => return Err(anyhow!("WGPU device or queue not available")),
+        };
+        let pipeline = self
+            .pipeline_cache
+            .get(&(
+                self.input_width,
+                self.input_height,
+                self.output_width,
+                self.output_height,
+            ))
+            .ok_or_else(|| anyhow!("Upscale pipeline not created"))?;
+        let (bind_group, input_buffer, output_buffer) = self.select_bind_group()?;
+
+        let input_buffer_size = (self.input_width * self.input_height * 4) as u64;
+        let output_buffer_size = (self.output_width * self.output_height * 4) as u64;
+        for (i, frame) in frames.iter().enumerate() {
+            if frame.len() as u64 != input_buffer_size {
+                return Err(anyhow!(
+                    "Input data size ({}) of frame {} does not match expected input buffer size ({} for {}x{})",
+                    frame.len(),
+                    i,
+                    input_buffer_size,
+                    self.input_width,
+                    self.input_height
+                ));
+            }
+        }
 
         let start_time = Instant::now();
 
-        // Use Rayon for parallel processing of frames
-        let results: Vec<Result<Vec<u8>>> = frames
-            .par_iter()
-            .map(|frame_data| {
-                self.upscale(frame_data) // This reuses the single-frame upscale logic
-            })
-            .collect();
+        // Keep the upload/readback buffers within the device's maximum buffer size
+        let max_buffer_size = device.limits().max_buffer_size;
+        let frames_per_submit =
+            (max_buffer_size / input_buffer_size.max(output_buffer_size)).max(1) as usize;
 
-        // Check for errors and collect results
         let mut outputs = Vec::with_capacity(frames.len());
-        for result in results {
-            outputs.push(result?);
+        for chunk in frames.chunks(frames_per_submit) {
+            let count = chunk.len() as u64;
+            let upload_buffer = device.create_buffer(&BufferDescriptor {
+                label: Some("Batch Upload Buffer"),
+                size: input_buffer_size * count,
+                usage: BufferUsages::COPY_SRC | BufferUsages::COPY_DST,
+                mapped_at_creation: false,
+            });
+            let readback_buffer = device.create_buffer(&BufferDescriptor {
+                label: Some("Batch Readback Buffer"),
+                size: output_buffer_size * count,
+                usage: BufferUsages::MAP_READ | BufferUsages::COPY_DST,
+                mapped_at_creation: false,
+            });
+            for (i, frame) in chunk.iter().enumerate() {
+                queue.write_buffer(&upload_buffer, i as u64 * input_buffer_size, frame);
+            }
+
+            let mut encoder = device.create_command_encoder(&CommandEncoderDescriptor {
+                label: Some("Batch Upscale Command Encoder"),
+            });
+            for i in 0..count {
+                encoder.copy_buffer_to_buffer(
+                    &upload_buffer,
+                    i * input_buffer_size,
+                    input_buffer,
+                    0,
+                    input_buffer_size,
+                );
+                {
+                    let mut compute_pass =
+                        encoder.begin_compute_pass(&wgpu::ComputePassDescriptor {
+                            label: Some("Batch Upscale Compute Pass"),
+                            timestamp_writes: None,
+                        });
+                    compute_pass.set_pipeline(pipeline);
+                    compute_pass.set_bind_group(0, bind_group, &[]);
+                    let (groups_x, groups_y) = self.dispatch_size();
+                    compute_pass.dispatch_workgroups(groups_x, groups_y, 1);
+                }
+                encoder.copy_buffer_to_buffer(
+                    output_buffer,
+                    0,
+                    &readback_buffer,
+                    i * output_buffer_size,
+                    output_buffer_size,
+                );
+            }
+            queue.submit(Some(encoder.finish()));
+
+            let buffer_slice = readback_buffer.slice(..);
+            let (sender, receiver) = std::sync::mpsc::channel();
+            buffer_slice.map_async(MapMode::Read, move |result| {
+                sender.send(result).unwrap();
+            });
+            device.poll(wgpu::Maintain::Wait);
+            receiver
+                .recv()
+                .map_err(|e| anyhow!("Failed to receive map_async result: {}", e))??;
+
+            {
+                let mapped = buffer_slice.get_mapped_range();
+                outputs.extend(
+                    mapped
+                        .chunks_exact(output_buffer_size as usize)
+                        .map(|frame| frame.to_vec()),
+                );
+            }
+            readback_buffer.unmap();
         }
 
         let elapsed_time = start_time.elapsed();
@@ -639,38 +858,167 @@ impl WgpuUpscaler {
         Ok(outputs)
     }
 
-    // Initialize buffers, pipeline, etc.
-    fn initialize_with_resources(
-        &mut self,
-        input_width: u32,
-        input_height: u32,
-        output_width: u32,
-        output_height: u32,
-    ) -> Result<()> {
-        // Get a *clone* of the Arc<Device> if available, ending the borrow of self immediately.
-        let device_arc = self
-            .get_device_clone()
-            .ok_or_else(|| anyhow!("WGPU device not available for initialization"))?;
-        // `self` is no longer borrowed by `device_arc` at this point.
+    // Pick the bind group and input/output buffers for the next dispatch: the next buffer pool
+    // slot when pooling is active, otherwise the individually allocated fallback buffers.
+    fn select_bind_group(&self) -> Result<(&BindGroup, &Buffer, &Buffer)> {
+        if self.use_memory_pool
+            && !self.buffer_pool_bind_groups.is_empty()
+            && self.gpu_resources.is_some()
+        {
+            let pool_idx = self.buffer_pool_index.fetch_add(1, Ordering::Relaxed)
+                % self.buffer_pool_size as usize;
+            // Pooled buffers are in pairs: input, output, input, output ...
+            Ok((
+                &self.buffer_pool_bind_groups[pool_idx],
+                &self.buffer_pool[pool_idx * 2],
+                &self.buffer_pool[pool_idx * 2 + 1],
+            ))
+        } else if let Some(bg) = &self.fallback_bind_group {
+            let input = self
+                .input_buffer
+                .as_ref()
+                .ok_or_else(|| anyhow!("Input buffer not available for fallback path"))?;
+            let output = self
+                .output_buffer
+                .as_ref()
+                .ok_or_else(|| anyhow!("Output buffer not available for fallback path"))?;
+            Ok((bg, input, output))
+        } else {
+            Err(anyhow!(
+                "No valid bind group or buffers available for upscaling"
+            ))
+        }
+    }
 
-        // Now update self fields
-        self.input_width = input_width;
-        self.input_height = input_height;
-        self.output_width = output_width;
-        self.output_height = output_height;
+    /// Upscale a frame directly into a caller-provided output slice (e.g. the memory of a Python
+    /// bytes object), avoiding an intermediate Vec<u8> for the readback.
+    pub fn upscale_into(&self, input: &[u8], output: &mut [u8]) -> Result<()> {
+        if !self.initialized {
+            return Err(anyhow!(
+                "Upscaler not initialized. Call initialize() first."
+            ));
+        }
 
-        let input_buffer_size = (input_width * input_height * 4) as u64; // RGBA8
-        let output_buffer_size = (output_width * output_height * 4) as u64;
+        let (device, queue) = match (self.device(), self.queue()) {
+            (Some(d), Some(q)) => (d, q),
+            _ => return Err(anyhow!("WGPU device or queue not available")),
+        };
 
-        // Use the cloned Arc, getting a reference (&Device) when needed for wgpu calls.
-        let device_ref: &Device = &*device_arc;
+        let pipeline = self
+            .pipeline_cache
+            .get(&(
+                self.input_width,
+                self.input_height,
+                self.output_width,
+                self.output_height,
+            ))
+            .ok_or_else(|| anyhow!("Upscale pipeline not created"))?;
+        let staging_buffer = self
+            .staging_buffer
+            .as_ref()
+            .ok_or_else(|| anyhow!("Staging buffer not created"))?;
+
+        let input_buffer_size = (self.input_width * self.input_height * 4) as u64;
+        let output_buffer_size = (self.output_width * self.output_height * 4) as u64;
+
+        if output.len() as u64 != output_buffer_size {
+            return Err(anyhow!(
+                "Output slice size ({}) does not match expected output buffer size ({} for {}x{})",
+                output.len(),
+                output_buffer_size,
+                self.output_width,
+                self.output_height
+            ));
+        }
+
+        if input.len() as u64 != input_buffer_size {
+            return Err(anyhow!(
+                "Input data size ({}) does not match expected input buffer size ({} for {}x{})",
+                input.len(),
+                input_buffer_size,
+                self.input_width,
+                self.input_height
+            ));
+        }
+
+        let (bind_group_to_use, current_input_buffer, current_output_buffer) =
+            self.select_bind_group()?;
+
+        // Write input data to the selected input GPU buffer
+        queue.write_buffer(current_input_buffer, 0, input);
+
+        // Adaptive quality check and potential adjustment (conceptual, needs proper handling of re-init)
+        if self.adaptive_quality {
+            // This call is problematic if it tries to mutate self.quality directly.
+            // It should signal if a change is *recommended*.
+            // The actual quality change and re-init should happen at a higher level (e.g., PyAdvancedWgpuUpscaler).
+            // For now, let's assume it just prints a recommendation or influences internal heuristics not yet implemented.
+            let _recommended_quality_change = self.update_adaptive_quality();
+            // if recommended_quality_change {
+            //    println!("[WgpuUpscaler] Adaptive quality suggests a change. Consider re-initializing with new quality.");
+            // }
+        }
+
+        let mut encoder = device.create_command_encoder(&CommandEncoderDescriptor {
+            label: Some("Upscale Command Encoder"),
+        });
+
+        {
+            let mut compute_pass = encoder.begin_compute_pass(&wgpu::ComputePassDescriptor {
+                label: Some("Upscale Compute Pass"),
+                timestamp_writes: None,
+            });
+            compute_pass.set_pipeline(pipeline);
+            compute_pass.set_bind_group(0, bind_group_to_use, &[]);
+            // Round up so the right/bottom edges are covered when the output isn't a multiple of the tile
+            let (groups_x, groups_y) = self.dispatch_size();
+            compute_pass.dispatch_workgroups(groups_x, groups_y, 1);
+        }
+
+        // Copy output from GPU buffer to staging buffer
+        encoder.copy_buffer_to_buffer(
+            current_output_buffer, // Source: the output buffer used in the bind group
+            0,
+            staging_buffer,
+            0,
+            output_buffer_size,
+        );
+
+        queue.submit(Some(encoder.finish()));
+
+        // Map staging buffer to read results back to CPU
+        let buffer_slice = staging_buffer.slice(..);
+        let (sender, receiver) = std::sync::mpsc::channel();
+        buffer_slice.map_async(MapMode::Read, move |result| {
+            sender.send(result).unwrap();
+        });
+
+        device.poll(wgpu::Maintain::Wait); // Wait for GPU to finish and map operation
+
+        // Receive the result of map_async
+        let _map_result = receiver
+            .recv()
+            .map_err(|e| anyhow!("Failed to receive map_async result: {}", e))??;
+
+        {
+            // Copy straight from the mapped staging memory; the view must be dropped before unmap
+            let mapped = buffer_slice.get_mapped_range();
+            output.copy_from_slice(&mapped);
+        }
+        staging_buffer.unmap(); // Unmap the buffer
+
+        Ok(())
+    }
 
-        // Create or re-create shader module if not already done or if algorithm changed
+    // Create the shader module, bind group layout and pipeline layout if not already done
+    fn ensure_shader_and_layout(&mut self, device_ref: &Device) {
         if self.shader.is_none() {
-            // Also consider if algorithm changed
-            self.shader = Some(self.load_shader_module(device_ref));
+            let (shader, is_builtin, workgroup_size) = self.load_shader_module(device_ref);
+            self.shader = Some(shader);
+            self.shader_is_builtin = is_builtin;
+            self.workgroup_size = workgroup_size;
+            self.clear_pipelines();
         }
-        let shader = self.shader.as_ref().unwrap();
 
         // Create bind group layout if not already done or if it needs to change
         if self.bind_group_layout.is_none() {
@@ -715,31 +1063,176 @@ impl WgpuUpscaler {
                 },
             ));
         }
-        let bind_group_layout = self.bind_group_layout.as_ref().unwrap();
+        if self.pipeline_layout.is_none() {
+            self.pipeline_layout = Some(device_ref.create_pipeline_layout(
+                &PipelineLayoutDescriptor {
+                    label: Some("Upscale Pipeline Layout"),
+                    bind_group_layouts: &[self.bind_group_layout.as_ref().unwrap()],
+                    push_constant_ranges: &[],
+                },
+            ));
+        }
+    }
 
-        // Create pipeline if not already done or if it needs to change
-        if self.pipeline.is_none() {
-            // Also consider if shader or layout changed
-            let pipeline_layout = device_ref.create_pipeline_layout(&PipelineLayoutDescriptor {
-                label: Some("Upscale Pipeline Layout"),
-                bind_group_layouts: &[bind_group_layout],
-                push_constant_ranges: &[],
-            });
-            self.pipeline = Some(
-                device_ref.create_compute_pipeline(&ComputePipelineDescriptor {
-                    label: Some(if self.algorithm == UpscaleAlgorithm::Bilinear {
-                        "Bilinear Upscale Pipeline"
-                    } else {
-                        "Nearest Neighbor Upscale Pipeline"
-                    }),
-                    layout: Some(&pipeline_layout),
-                    module: shader,
-                    entry_point: "main",
-                    compilation_options: wgpu::PipelineCompilationOptions::default(),
-                }),
-            );
+    fn clear_pipelines(&mut self) {
+        self.pipeline_cache.clear();
+        self.pipeline_order.clear();
+    }
+
+    // Mark a cached pipeline as most recently used
+    fn touch_pipeline(&mut self, key: (u32, u32, u32, u32)) {
+        if let Some(pos) = self.pipeline_order.iter().position(|k| *k == key) {
+            self.pipeline_order.remove(pos);
+        }
+        self.pipeline_order.push_back(key);
+    }
+
+    // Make room for one more pipeline. The one for the current dimensions is never evicted, since
+    // upscale()/upscale_into() look it up on every frame.
+    fn evict_pipelines(&mut self) {
+        let active = (
+            self.input_width,
+            self.input_height,
+            self.output_width,
+            self.output_height,
+        );
+        while self.pipeline_cache.len() >= PIPELINE_CACHE_LIMIT {
+            match self.pipeline_order.iter().position(|k| *k != active) {
+                Some(pos) => {
+                    let evicted = self.pipeline_order.remove(pos).unwrap();
+                    self.pipeline_cache.remove(&evicted);
+                }
+                None => break,
+            }
+        }
+    }
+
+    // Build the compute pipeline specialized for the given dimensions unless it is already cached.
+    // Returns true if a new pipeline was compiled.
+    fn build_pipeline(
+        &mut self,
+        device_ref: &Device,
+        input_width: u32,
+        input_height: u32,
+        output_width: u32,
+        output_height: u32,
+    ) -> bool {
+        let key = (input_width, input_height, output_width, output_height);
+        if self.pipeline_cache.contains_key(&key) {
+            self.touch_pipeline(key);
+            return false;
         }
 
+        // Custom shaders loaded from disk are not required to declare the override constants
+        let mut constants = HashMap::new();
+        if self.shader_is_builtin {
+            constants.insert("IN_WIDTH".to_string(), input_width as f64);
+            constants.insert("IN_HEIGHT".to_string(), input_height as f64);
+            constants.insert("OUT_WIDTH".to_string(), output_width as f64);
+            constants.insert("OUT_HEIGHT".to_string(), output_height as f64);
+            if self.algorithm == UpscaleAlgorithm::Bilinear {
+                constants.insert(
+                    "SCALE_X".to_string(),
+                    input_width as f64 / output_width as f64,
+                );
+                constants.insert(
+                    "SCALE_Y".to_string(),
+                    input_height as f64 / output_height as f64,
+                );
+            }
+        }
+
+        let pipeline = device_ref.create_compute_pipeline(&ComputePipelineDescriptor {
+            label: Some(if self.algorithm == UpscaleAlgorithm::Bilinear {
+                "Bilinear Upscale Pipeline"
+            } else {
+                "Nearest Neighbor Upscale Pipeline"
+            }),
+            layout: self.pipeline_layout.as_ref(),
+            module: self.shader.as_ref().unwrap(),
+            entry_point: "main",
+            compilation_options: wgpu::PipelineCompilationOptions {
+                constants: &constants,
+                ..Default::default()
+            },
+        });
+        self.evict_pipelines();
+        self.pipeline_cache.insert(key, pipeline);
+        self.pipeline_order.push_back(key);
+        println!(
+            "[WgpuUpscaler] Compiled pipeline for {}x{} -> {}x{} ({} cached)",
+            input_width,
+            input_height,
+            output_width,
+            output_height,
+            self.pipeline_cache.len()
+        );
+        true
+    }
+
+    /// Pre-build (or fetch from cache) the pipeline for the given dimensions so that a later
+    /// initialize() with the same shape does not pay for shader specialization.
+    pub fn get_or_build_pipeline(
+        &mut self,
+        input_width: u32,
+        input_height: u32,
+        output_width: u32,
+        output_height: u32,
+    ) -> Result<bool> {
+        if self.gpu_resources.is_none() {
+            self.ensure_wgpu_initialized()?;
+        }
+        let device_arc = self
+            .get_device_clone()
+            .ok_or_else(|| anyhow!("WGPU device not available for pipeline creation"))?;
+        let device_ref: &Device = &*device_arc;
+        self.ensure_shader_and_layout(device_ref);
+        Ok(self.build_pipeline(
+            device_ref,
+            input_width,
+            input_height,
+            output_width,
+            output_height,
+        ))
+    }
+
+    // Initialize buffers, pipeline, etc.
+    fn initialize_with_resources(
+        &mut self,
+        input_width: u32,
+        input_height: u32,
+        output_width: u32,
+        output_height: u32,
+    ) -> Result<()> {
+        // Get a *clone* of the Arc<Device> if available, ending the borrow of self immediately.
+        let device_arc = self
+            .get_device_clone()
+            .ok_or_else(|| anyhow!("WGPU device not available for initialization"))?;
+        // `self` is no longer borrowed by `device_arc` at this point.
+
+        // Now update self fields
+        self.input_width = input_width;
+        self.input_height = input_height;
+        self.output_width = output_width;
+        self.output_height = output_height;
+
+        let input_buffer_size = (input_width * input_height * 4) as u64; // RGBA8
+        let output_buffer_size = (output_width * output_height * 4) as u64;
+
+        // Use the cloned Arc, getting a reference (&Device) when needed for wgpu calls.
+        let device_ref: &Device = &*device_arc;
+
+        // Create shader module and layouts if needed, then fetch or compile the pipeline for this shape
+        self.ensure_shader_and_layout(device_ref);
+        self.build_pipeline(
+            device_ref,
+            input_width,
+            input_height,
+            output_width,
+            output_height,
+        );
+        let bind_group_layout = self.bind_group_layout.as_ref().unwrap();
+
         // Create dimensions buffer
         let dimensions_data = [
             self.input_width,
@@ -886,7 +1379,9 @@ impl Upscaler for WgpuUpscaler {
             || self.output_width != output_width
             || self.output_height != output_height
             || self.shader.is_none()
-            || self.pipeline.is_none()
+            || !self
+                .pipeline_cache
+                .contains_key(&(input_width, input_height, output_width, output_height))
         {
             // Ensure WGPU is ready (especially for self-managed mode)
             if self.gpu_resources.is_none() {
@@ -933,127 +1428,8 @@ impl Upscaler for WgpuUpscaler {
     }
 
     fn upscale(&self, input: &[u8]) -> Result<Vec<u8>> {
-        if !self.initialized {
-            return Err(anyhow!(
-                "Upscaler not initialized. Call initialize() first."
-            ));
-        }
-
-        let (device, queue) = match (self.device(), self.queue()) {
-            (Some(d), Some(q)) => (d, q),
-            _ => return Err(anyhow!("WGPU device or queue not available")),
-        };
-
-        let pipeline = self
-            .pipeline
-            .as_ref()
-            .ok_or_else(|| anyhow!("Upscale pipeline not created"))?;
-        let staging_buffer = self
-            .staging_buffer
-            .as_ref()
-            .ok_or_else(|| anyhow!("Staging buffer not created"))?;
-
-        let input_buffer_size = (self.input_width * self.input_height * 4) as u64;
-        let output_buffer_size = (self.output_width * self.output_height * 4) as u64;
-
-        if input.len() as u64 != input_buffer_size {
-            return Err(anyhow!(
-                "Input data size ({}) does not match expected input buffer size ({} for {}x{})",
-                input.len(),
-                input_buffer_size,
-                self.input_width,
-                self.input_height
-            ));
-        }
-
-        let bind_group_to_use: &BindGroup;
-        let current_input_buffer: &Buffer;
-        let current_output_buffer: &Buffer; // For clarity, though only input is written to before dispatch
-
-        if self.use_memory_pool
-            && !self.buffer_pool_bind_groups.is_empty()
-            && self.gpu_resources.is_some()
-        {
-            let pool_idx = self.buffer_pool_index.fetch_add(1, Ordering::Relaxed)
-                % self.buffer_pool_size as usize;
-            bind_group_to_use = &self.buffer_pool_bind_groups[pool_idx];
-            // Pooled buffers are in pairs: input, output, input, output ...
-            current_input_buffer = &self.buffer_pool[pool_idx * 2];
-            current_output_buffer = &self.buffer_pool[pool_idx * 2 + 1];
-        } else if let Some(bg) = &self.fallback_bind_group {
-            bind_group_to_use = bg;
-            current_input_buffer = self
-                .input_buffer
-                .as_ref()
-                .ok_or_else(|| anyhow!("Input buffer not available for fallback path"))?;
-            current_output_buffer = self
-                .output_buffer
-                .as_ref()
-                .ok_or_else(|| anyhow!("Output buffer not available for fallback path"))?;
-        } else {
-            return Err(anyhow!(
-                "No valid bind group or buffers available for upscaling"
-            ));
-        }
-
-        // Write input data to the selected input GPU buffer
-        queue.write_buffer(current_input_buffer, 0, input);
-
-        // Adaptive quality check and potential adjustment (conceptual, needs proper handling of re-init)
-        if self.adaptive_quality {
-            // This call is problematic if it tries to mutate self.quality directly.
-            // It should signal if a change is *recommended*.
-            // The actual quality change and re-init should happen at a higher level (e.g., PyAdvancedWgpuUpscaler).
-            // For now, let's assume it just prints a recommendation or influences internal heuristics not yet implemented.
-            let _recommended_quality_change = self.update_adaptive_quality();
-            // if recommended_quality_change {
-            //    println!("[WgpuUpscaler] Adaptive quality suggests a change. Consider re-initializing with new quality.");
-            // }
-        }
-
-        let mut encoder = device.create_command_encoder(&CommandEncoderDescriptor {
-            label: Some("Upscale Command Encoder"),
-        });
-
-        {
-            let mut compute_pass = encoder.begin_compute_pass(&wgpu::ComputePassDescriptor {
-                label: Some("Upscale Compute Pass"),
-                timestamp_writes: None,
-            });
-            compute_pass.set_pipeline(pipeline);
-            compute_pass.set_bind_group(0, bind_group_to_use, &[]);
-            compute_pass.dispatch_workgroups(self.output_width / 8, self.output_height / 8, 1);
-            // Assuming 8x8 workgroup size
-        }
-
-        // Copy output from GPU buffer to staging buffer
-        encoder.copy_buffer_to_buffer(
-            current_output_buffer, // Source: the output buffer used in the bind group
-            0,
-            staging_buffer,
-            0,
-            output_buffer_size,
-        );
-
-        queue.submit(Some(encoder.finish()));
-
-        // Map staging buffer to read results back to CPU
-        let buffer_slice = staging_buffer.slice(..);
-        let (sender, receiver) = std::sync::mpsc::channel();
-        buffer_slice.map_async(MapMode::Read, move |result| {
-            sender.send(result).unwrap();
-        });
-
-        device.poll(wgpu::Maintain::Wait); // Wait for GPU to finish and map operation
-
-        // Receive the result of map_async
-        let _map_result = receiver
-            .recv()
-            .map_err(|e| anyhow!("Failed to receive map_async result: {}", e))??;
-
-        let data = buffer_slice.get_mapped_range().to_vec();
-        staging_buffer.unmap(); // Unmap the buffer
-
+        let mut data = vec![0u8; (self.output_width * self.output_height * 4) as usize];
+        self.upscale_into(input, &mut data)?;
         Ok(data)
     }
 
@@ -1155,4 +1531,17 @@ mod tests {
         // For now, let's just check it doesn't panic immediately on creation
         assert_eq!(upscaler.name(), "WgpuNearestUpscaler");
     }
+
+    #[test]
+    fn test_wgsl_workgroup_size() {
+        assert_eq!(wgsl_workgroup_size(NN_UPSCALE_SHADER), Some((16, 16)));
+        assert_eq!(wgsl_workgroup_size(BILINEAR_UPSCALE_SHADER), Some((16, 16)));
+        assert_eq!(
+            wgsl_workgroup_size("@compute @workgroup_size(8, 8)\nfn main() {}"),
+            Some((8, 8))
+        );
+        assert_eq!(wgsl_workgroup_size("@compute @workgroup_size(64u)\nfn main() {}"), Some((64, 1)));
+        assert_eq!(wgsl_workgroup_size("@compute @workgroup_size(WG, WG)\nfn main() {}"), None);
+        assert_eq!(wgsl_workgroup_size("fn main() {}"), None);
+    }
 }
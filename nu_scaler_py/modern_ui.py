@@ -56,6 +56,9 @@ class PreviewPanel(QFrame):
             }
         """)
         self.preview.setText("No preview available")
+        # Ignore the pixmap's size hint so per-frame setPixmap calls don't trigger a relayout
+        self.preview.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self.preview.setMinimumSize(320, 180)
         layout.addWidget(self.preview)
 
 class AdvancedSettingsDialog(QDialog):
@@ -157,6 +160,11 @@ class ModernNuScalerApp(QMainWindow):
         super().__init__()
         self.setWindowTitle("Nu_Scaler - Professional Edition")
         self.resize(1280, 720)
+        self.capture = None
+        self.upscaler = None
+        self.timer = None
+        self._upscaler_cfg = None
+        self._upscaler_cache = {}
         self.setup_ui()
         self.setup_connections()
         self.load_core()
@@ -402,7 +410,13 @@ class ModernNuScalerApp(QMainWindow):
             # Create upscaler
             quality = self.quality_combo.currentText().lower()
             algorithm = self.algo_combo.currentText().lower()
-            self.upscaler = self.nu_scaler_core.PyWgpuUpscaler(quality, algorithm)
+            # Reuse the upscaler (and its GPU device/pipelines) from a previous run with the same settings
+            key = (quality, algorithm)
+            self.upscaler = self._upscaler_cache.get(key)
+            if self.upscaler is None:
+                self.upscaler = self.nu_scaler_core.PyWgpuUpscaler(quality, algorithm)
+                self._upscaler_cache[key] = self.upscaler
+            self._upscaler_cfg = None
             
             # Create capture
             self.capture = self.nu_scaler_core.PyScreenCapture()
@@ -419,9 +433,10 @@ class ModernNuScalerApp(QMainWindow):
             # Start capture
             self.capture.start(target, window, None)
             
-            # Start update timer
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self.update_frame)
+            # Start update timer (created once, reused across capture sessions)
+            if self.timer is None:
+                self.timer = QTimer(self)
+                self.timer.timeout.connect(self.update_frame)
             self.timer.start(16)  # ~60 FPS
             
             # Update UI
@@ -436,10 +451,10 @@ class ModernNuScalerApp(QMainWindow):
             
     def stop_capture(self):
         """Stop screen capture."""
-        if hasattr(self, 'timer'):
+        if self.timer is not None:
             self.timer.stop()
         
-        if hasattr(self, 'capture') and self.capture:
+        if self.capture:
             try:
                 self.capture.stop()
             except Exception as e:
@@ -455,7 +470,7 @@ class ModernNuScalerApp(QMainWindow):
         
     def update_frame(self):
         """Process and display a new frame."""
-        if not hasattr(self, 'capture') or not self.capture or not self.upscaler:
+        if not self.capture or not self.upscaler:
             return
             
         try:
@@ -467,43 +482,38 @@ class ModernNuScalerApp(QMainWindow):
             frame_bytes, width, height = frame_result
             
             # Show original frame
-            original_qimg = QImage(frame_bytes, width, height, QImage.Format_RGBA8888)
-            original_pixmap = QPixmap.fromImage(original_qimg)
-            self.original_preview.preview.setPixmap(original_pixmap.scaled(
+            original_qimg = QImage(frame_bytes, width, height, 4 * width, QImage.Format_RGBA8888)
+            self.original_preview.preview.setPixmap(QPixmap.fromImage(original_qimg.scaled(
                 self.original_preview.preview.width(),
                 self.original_preview.preview.height(),
                 Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            ))
+                Qt.FastTransformation
+            )))
             
             # Initialize upscaler if needed
             scale = self.scale_slider.value() / 10.0
             out_width = int(width * scale)
             out_height = int(height * scale)
             
-            # Check if we need to reinitialize the upscaler
-            if not hasattr(self, 'last_in_width') or not hasattr(self, 'last_in_height') or \
-               not hasattr(self, 'last_scale') or \
-               self.last_in_width != width or self.last_in_height != height or \
-               abs(self.last_scale - scale) > 0.01:
-                
+            # Only reinitialize the upscaler when the frame size or scale changes
+            cfg = (width, height, out_width, out_height)
+            if cfg != self._upscaler_cfg:
                 self.upscaler.initialize(width, height, out_width, out_height)
-                self.last_in_width = width
-                self.last_in_height = height
-                self.last_scale = scale
+                self._upscaler_cfg = cfg
             
             # Upscale frame
             output_bytes = self.upscaler.upscale(frame_bytes)
             
             # Show processed frame
-            processed_qimg = QImage(output_bytes, out_width, out_height, QImage.Format_RGBA8888)
-            processed_pixmap = QPixmap.fromImage(processed_qimg)
-            self.processed_preview.preview.setPixmap(processed_pixmap.scaled(
+            # Wrap the bytes without copying and scale before converting, so only the
+            # preview-sized image is uploaded to a pixmap
+            processed_qimg = QImage(output_bytes, out_width, out_height, 4 * out_width, QImage.Format_RGBA8888)
+            self.processed_preview.preview.setPixmap(QPixmap.fromImage(processed_qimg.scaled(
                 self.processed_preview.preview.width(),
                 self.processed_preview.preview.height(),
                 Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            ))
+                Qt.FastTransformation
+            )))
             
             # Update FPS
             self.frame_count += 1
@@ -530,6 +540,12 @@ class ModernNuScalerApp(QMainWindow):
             self.show_error("Error in update_frame", str(e))
             self.stop_capture()
             
+    def closeEvent(self, event):
+        """Stop capture and release cached upscalers when the window closes."""
+        self.stop_capture()
+        self._upscaler_cache.clear()
+        super().closeEvent(event)
+
     def show_error(self, title: str, message: str):
         """Show an error message dialog."""
         QMessageBox.critical(self, title, message)
@@ -0,0 +1,119 @@
+"""
+nu_scaler._bilinear_numba - CPU bilinear upscaler used when nu_scaler_core (or its WGPU backend) is unavailable.
+
+The kernel is jitted with Numba when it is installed and runs in parallel over output rows.
+Without Numba a vectorized NumPy implementation is used instead.
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
+AVAILABLE = np is not None
+
+
+def _bilinear_resize_py(src, dst, sx, sy):
+    """Bilinear resample of an HxWxC uint8 image `src` into the preallocated `dst`.
+
+    `sx`/`sy` are the input-pixels-per-output-pixel ratios (in_w / out_w, in_h / out_h).
+    Sample positions (output pixel o reads input o * s, corner-aligned) and the 8-bit fixed-point weights
+    match the WGSL bilinear shader, so switching between the CPU and WGPU bilinear methods doesn't shift the image.
+    """
+    in_h, in_w, channels = src.shape
+    out_h, out_w = dst.shape[0], dst.shape[1]
+    for oy in prange(out_h):
+        fy = oy * sy
+        y0 = min(int(fy), in_h - 1)
+        y1 = min(y0 + 1, in_h - 1)
+        wy = int((fy - y0) * 256.0)
+        for ox in range(out_w):
+            fx = ox * sx
+            x0 = min(int(fx), in_w - 1)
+            x1 = min(x0 + 1, in_w - 1)
+            wx = int((fx - x0) * 256.0)
+            for c in range(channels):
+                top = int(src[y0, x0, c]) * (256 - wx) + int(src[y0, x1, c]) * wx
+                bottom = int(src[y1, x0, c]) * (256 - wx) + int(src[y1, x1, c]) * wx
+                dst[oy, ox, c] = (top * (256 - wy) + bottom * wy + 32768) >> 16
+
+
+if NUMBA_AVAILABLE:
+    bilinear_resize = njit(parallel=True, fastmath=True, cache=True)(_bilinear_resize_py)
+else:
+    bilinear_resize = None
+
+
+def _bilinear_resize_numpy(src, dst, sx, sy):
+    """Vectorized NumPy equivalent of the jitted kernel (used when Numba is not installed)."""
+    in_h, in_w = src.shape[0], src.shape[1]
+    out_h, out_w = dst.shape[0], dst.shape[1]
+    fy = np.arange(out_h, dtype=np.float64) * sy
+    fx = np.arange(out_w, dtype=np.float64) * sx
+    y0 = np.minimum(fy.astype(np.intp), in_h - 1)
+    x0 = np.minimum(fx.astype(np.intp), in_w - 1)
+    y1 = np.minimum(y0 + 1, in_h - 1)
+    x1 = np.minimum(x0 + 1, in_w - 1)
+    wy = ((fy - y0) * 256.0).astype(np.uint32)[:, None, None]
+    wx = ((fx - x0) * 256.0).astype(np.uint32)[None, :, None]
+    rows0 = src[y0].astype(np.uint32)
+    rows1 = src[y1].astype(np.uint32)
+    top = rows0[:, x0] * (256 - wx) + rows0[:, x1] * wx
+    bottom = rows1[:, x0] * (256 - wx) + rows1[:, x1] * wx
+    dst[...] = (top * (256 - wy) + bottom * wy + 32768) >> 16
+
+
+class CpuBilinearUpscaler:
+    """Drop-in stand-in for PyWgpuUpscaler that upscales RGBA frames on the CPU."""
+    def __init__(self, quality="quality"):
+        if not AVAILABLE:
+            raise RuntimeError("CPU bilinear upscaler requires numpy")
+        self.quality = quality
+        self.input_width = 0
+        self.input_height = 0
+        self.output_width = 0
+        self.output_height = 0
+        self._dst = None
+
+    @property
+    def name(self):
+        return "CPU Bilinear (Numba)" if NUMBA_AVAILABLE else "CPU Bilinear (NumPy)"
+
+    def initialize(self, input_width, input_height, output_width, output_height):
+        self.input_width = input_width
+        self.input_height = input_height
+        self.output_width = output_width
+        self.output_height = output_height
+        # Output buffer is allocated once per resolution and reused for every frame
+        self._dst = np.empty((output_height, output_width, 4), dtype=np.uint8)
+
+    def _resize(self, frame, dst):
+        expected = self.input_width * self.input_height * 4
+        if len(frame) != expected:
+            raise ValueError(f"Input size mismatch: expected {expected} bytes, got {len(frame)}")
+        src = np.frombuffer(frame, dtype=np.uint8).reshape(self.input_height, self.input_width, 4)
+        sx = self.input_width / self.output_width
+        sy = self.input_height / self.output_height
+        if NUMBA_AVAILABLE:
+            bilinear_resize(src, dst, sx, sy)
+        else:
+            _bilinear_resize_numpy(src, dst, sx, sy)
+
+    def upscale(self, frame):
+        if self._dst is None:
+            raise RuntimeError("Upscaler not initialized")
+        self._resize(frame, self._dst)
+        return self._dst.tobytes()
+
+    def upscale_into(self, frame, out):
+        """Upscale into a writable buffer of output_width * output_height * 4 bytes (e.g. a bytearray)."""
+        if self._dst is None:
+            raise RuntimeError("Upscaler not initialized")
+        dst = np.frombuffer(out, dtype=np.uint8).reshape(self.output_height, self.output_width, 4)
+        self._resize(frame, dst)
@@ -4,8 +4,9 @@ Nu_Scaler benchmarking module for testing upscaler performance.
 
 import time
 from typing import Dict, List, Optional, Tuple, Union
-import matplotlib.pyplot as plt
-import numpy as np
+
+# matplotlib/numpy are imported inside the plotting helpers so that importing
+# this module (e.g. from the GUI at startup) stays cheap.
 
 try:
     import nu_scaler_core
@@ -15,7 +15,7 @@ from PySide6.QtWidgets import (
     QGraphicsView, QGraphicsScene, QStyle, QStyleFactory, QStackedLayout
 )
 from PySide6.QtCore import Qt, QTimer, QSize, QThread, Signal, Slot, QEvent
-from PySide6.QtGui import QPixmap, QImage, QColor, QPalette, QIcon, QAction, QDrag, QFont
+from PySide6.QtGui import QPixmap, QImage, QImageReader, QColor, QPalette, QIcon, QAction, QDrag, QFont
 
 # Try to import Nu_Scaler core and utilities
 try:
@@ -237,6 +237,19 @@ class PreviewPane(QFrame):
             self.preview.clear()
             self.preview.setText("No image/video to display")
             
+    def _load_preview(self, file_path):
+        """Decode an image file straight to preview size.
+
+        The pane only ever shows a scaled-down preview, so QImageReader is asked for that size
+        and formats that support it (e.g. JPEG) skip decoding the full-resolution image.
+        """
+        reader = QImageReader(file_path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid() and (size.width() > self.preview.width() or size.height() > self.preview.height()):
+            reader.setScaledSize(size.scaled(self.preview.size(), Qt.KeepAspectRatio))
+        return QPixmap.fromImage(reader.read())
+    
     def dragEnterEvent(self, event):
         """Handle drag enter events for drag & drop functionality"""
         if event.mimeData().hasUrls():
@@ -250,7 +263,7 @@ class PreviewPane(QFrame):
             
             # Simple check for image files (could be expanded for videos)
             if file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif')):
-                pixmap = QPixmap(file_path)
+                pixmap = self._load_preview(file_path)
                 if not pixmap.isNull():
                     self.setPixmap(pixmap)
                     # Emit a signal here to notify parent of new image
@@ -269,7 +282,7 @@ class PreviewPane(QFrame):
             
             if file_path:
                 if file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')):
-                    pixmap = QPixmap(file_path)
+                    pixmap = self._load_preview(file_path)
                     if not pixmap.isNull():
                         self.setPixmap(pixmap)
                         # Emit a signal here to notify parent of new image
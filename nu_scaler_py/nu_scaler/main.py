@@ -24,33 +24,104 @@ import sys
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QListWidget, QStackedWidget, QFrame,
-    QPushButton, QComboBox, QSpinBox, QCheckBox, QSlider, QGroupBox, QFormLayout, QProgressBar, QFileDialog, QSizePolicy
+    QPushButton, QComboBox, QSpinBox, QCheckBox, QSlider, QGroupBox, QFormLayout, QProgressBar, QSizePolicy,
+    QPlainTextEdit, QMessageBox, QFileDialog
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QThread, QObject, Slot, QEvent
+from PySide6.QtCore import Qt, QTimer, Signal, QThread, QObject, Slot, QEvent, QRunnable, QThreadPool, QRect, QRectF, QPoint
 from PySide6.QtGui import QPixmap, QImage, QAction, QKeySequence, QPainter, QColor, QFont, QShortcut
 import time
+from time import perf_counter as _perf_counter # Used for every timestamp in this module
 import random
 import traceback
 import threading
-import psutil
 import os
+import re
+import functools
+from collections import deque
+import logging
 
-# Import for Windows API access if on Windows
+# QtOpenGLWidgets is a separate PySide6 module and may be missing from trimmed installs; previews then stay on QLabel
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:
+    QOpenGLWidget = None
+
+# Per-frame diagnostics go through this logger; it is silent unless the app configures logging for DEBUG
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# psutil is only needed for process stats/targets, so it is imported on first use
+# instead of at startup (see _import_psutil)
+psutil = None
+
+def _import_psutil():
+    global psutil
+    if psutil is None:
+        import psutil as _psutil
+        psutil = _psutil
+    return psutil
+
+# Target listing talks to user32 through ctypes (always available on Windows, unlike pywin32)
 if os.name == 'nt':
-    try:
-        import win32gui
-        import win32process
-        import win32con # For window styles, if needed later
-        print("[main.py] Successfully imported pywin32 modules (win32gui, win32process).")
-    except ImportError:
-        win32gui = None
-        win32process = None
-        win32con = None
-        print("[main.py] pywin32 library not found. Process capture features for Windows will be limited.")
+    import ctypes
+    from ctypes import wintypes
+    _user32 = ctypes.WinDLL('user32')
+    _WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    _user32.EnumWindows.argtypes = [_WNDENUMPROC, wintypes.LPARAM]
+    _user32.IsWindowVisible.argtypes = [wintypes.HWND]
+    _user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+    _user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+    _user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+    _user32.GetWindowThreadProcessId.restype = wintypes.DWORD
 else:
-    win32gui = None
-    win32process = None
-    win32con = None
+    _user32 = None
+
+def _visible_window_pids():
+    """PIDs that own at least one visible, titled top-level window, from a single EnumWindows pass.
+    Titles are never copied: only their length is checked, and only for PIDs not seen yet."""
+    pids = set()
+    pid = wintypes.DWORD()
+    def callback(hwnd, _lparam):
+        if _user32.IsWindowVisible(hwnd):
+            _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+            if pid.value not in pids and _user32.GetWindowTextLengthW(hwnd) > 0:
+                pids.add(pid.value)
+        return True # Continue enumeration
+    _user32.EnumWindows(_WNDENUMPROC(callback), 0)
+    return pids
+
+def _window_title_for_pid(target_pid):
+    """Title of the first visible, titled top-level window owned by `target_pid`, or None.
+    Only windows of that PID have their title copied; returning False ends EnumWindows early."""
+    found = []
+    pid = wintypes.DWORD()
+    def callback(hwnd, _lparam):
+        if _user32.IsWindowVisible(hwnd):
+            _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+            if pid.value == target_pid:
+                length = _user32.GetWindowTextLengthW(hwnd)
+                if length > 0:
+                    buf = ctypes.create_unicode_buffer(length + 1)
+                    _user32.GetWindowTextW(hwnd, buf, length + 1)
+                    if buf.value:
+                        found.append(buf.value)
+                        return False # Stop enumeration, we found one
+        return True # Continue enumeration
+    _user32.EnumWindows(_WNDENUMPROC(callback), 0)
+    return found[0] if found else None
+
+# Target labels end in "(PID: 1234)"; only used for entries that don't carry the PID as item data
+_PID_RE = re.compile(r"\(PID:\s*(\d+)\)\s*$")
+
+# Memory strategy names as the upscaler expects them, in memory_strategy_box order
+_MEMORY_STRATEGIES = ("auto", "aggressive", "balanced", "conservative", "minimal")
+
+# Fixed layouts of the live-feed overlay and status bar, filled with str.format on each text refresh
+_OVERLAY_TMPL = (
+    "Base Frame: {}×{}\nScaled Frame: {}×{}\nBase FPS: {:.1f}\nScaled FPS: {:.1f}\n{}\n"
+    "Upscale GPU Time: {:.1f} ms\n"
+)
+_STATUS_TMPL = "Base: {}×{} @ {:.1f}FPS | Scaled: {}×{} @ {:.1f}FPS ({:.1f}ms GPU)"
 
 # Import the Rust extension as 'nu_scaler'
 try:
@@ -65,6 +136,27 @@ except Exception as e:
     traceback.print_exc()
     nu_scaler_core = None
 
+# Core classes/enum members resolved once; None when the core (or that feature) isn't available
+_PyCaptureTarget = getattr(nu_scaler_core, 'PyCaptureTarget', None)
+_TARGET_FULLSCREEN = getattr(_PyCaptureTarget, 'FullScreen', None)
+_TARGET_WINDOW_BY_PID = getattr(_PyCaptureTarget, 'WindowByPid', None)
+_TARGET_WINDOW_BY_TITLE = getattr(_PyCaptureTarget, 'WindowByTitle', None)
+_TARGET_REGION = getattr(_PyCaptureTarget, 'Region', None)
+_PyWindowByPid = getattr(nu_scaler_core, 'PyWindowByPid', None)
+_PyWindowByTitle = getattr(nu_scaler_core, 'PyWindowByTitle', None)
+_PyRegion = getattr(nu_scaler_core, 'PyRegion', None)
+_DlssUpscaler = getattr(nu_scaler_core, 'DlssUpscaler', None)
+_PyWgpuUpscaler = getattr(nu_scaler_core, 'PyWgpuUpscaler', None)
+_WgpuFrameInterpolator = getattr(nu_scaler_core, 'WgpuFrameInterpolator', None)
+_PyScreenCapture = getattr(nu_scaler_core, 'PyScreenCapture', None)
+# Native PID -> window title lookup (the whole EnumWindows pass stays in Rust); older cores fall back to ctypes
+_core_window_title_for_pid = getattr(_PyScreenCapture, 'window_title_for_pid', None)
+# Capture capabilities (target member + its parameter class), checked by start_capture
+_CORE_HAS_FULLSCREEN = _TARGET_FULLSCREEN is not None
+_CORE_HAS_WINDOW_BY_PID = _TARGET_WINDOW_BY_PID is not None and _PyWindowByPid is not None
+_CORE_HAS_WINDOW_BY_TITLE = _TARGET_WINDOW_BY_TITLE is not None and _PyWindowByTitle is not None
+_CORE_HAS_REGION = _TARGET_REGION is not None and _PyRegion is not None
+
 # Import Python helper modules from nu_scaler_py
 try:
     from .benchmark import run_benchmark, run_comparison_benchmark, BenchmarkResult, plot_benchmark_results
@@ -82,8 +174,17 @@ except Exception as e:
     BenchmarkResult = None
     plot_benchmark_results = None
 
+# CPU bilinear fallback, used when nu_scaler_core or its WGPU backend is unavailable
+try:
+    from . import _bilinear_numba
+    if not _bilinear_numba.AVAILABLE:
+        _bilinear_numba = None
+except ImportError as e:
+    print(f"[main.py] ImportError when importing CPU bilinear fallback: {e}")
+    _bilinear_numba = None
+
 print(f"[main.py] nu_scaler_core available: {nu_scaler_core is not None}")
-print(f"[main.py] DLSS available: {hasattr(nu_scaler_core, 'DlssUpscaler')}")
+print(f"[main.py] DLSS available: {_DlssUpscaler is not None}")
 
 # Add import for GPU optimization
 try:
@@ -98,7 +199,49 @@ except Exception as e:
     optimize_upscaler = None
     force_gpu_activation = None
 
-class AspectRatioPreview(QLabel):
+class _OverlayPainter:
+    """Stats overlay shared by the preview widgets: a rounded box with right-aligned text in the top-right corner."""
+    def _init_overlay(self):
+        self._overlay_text = ""
+        # Overlay box + text rendered once per (text, size, dpr) and blitted on every other repaint
+        self._overlay_font = QFont()
+        self._overlay_font.setPointSize(12)
+        self._overlay_pixmap = None
+        self._overlay_pixmap_key = None
+
+    def set_overlay(self, text: str):
+        """Set the overlay text."""
+        if text == self._overlay_text:
+            return
+        self._overlay_text = text
+        self.update()
+
+    def _paint_overlay(self, painter):
+        overlay_rect = self.rect().adjusted(12, 12, -12, -12)
+        if self._overlay_text and not overlay_rect.isEmpty():
+            overlay_key = (self._overlay_text, overlay_rect.size(), self.devicePixelRatioF())
+            if self._overlay_pixmap is None or self._overlay_pixmap_key != overlay_key:
+                self._overlay_pixmap = self._render_overlay(overlay_rect.size(), overlay_key[2])
+                self._overlay_pixmap_key = overlay_key
+            painter.drawPixmap(overlay_rect.topLeft(), self._overlay_pixmap)
+
+    def _render_overlay(self, size, dpr):
+        pixmap = QPixmap(size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(QColor(30, 30, 30, 180))
+        painter.setPen(Qt.NoPen)
+        rect = QRect(QPoint(0, 0), size) # Logical coordinates
+        painter.drawRoundedRect(rect, 12, 12)
+        painter.setPen(QColor(255, 255, 255))
+        painter.setFont(self._overlay_font)
+        painter.drawText(rect, Qt.AlignTop | Qt.AlignRight, self._overlay_text)
+        painter.end()
+        return pixmap
+
+class AspectRatioPreview(QLabel, _OverlayPainter):
     """
     QLabel-based widget for displaying a QPixmap with aspect-ratio-aware scaling and a modern overlay.
     Supports double-click to toggle full-screen. Overlay is always visible and customizable.
@@ -111,17 +254,34 @@ class AspectRatioPreview(QLabel):
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setStyleSheet("background: #181818; border: 1px solid #444;")
         self._pixmap = None
-        self._overlay_text = ""
+        # Overlay text saved by LiveFeedScreen while the output is shown in the fullscreen/corner window
+        self._original_text_when_fullscreen = None
+        self._original_text_when_corner = None
+        self._transform_mode = Qt.SmoothTransformation
+        # Scaled copy of _pixmap for the current widget size, so overlay-only repaints don't rescale
+        self._scaled_cache = None
+        self._scaled_cache_key = None
+        self._init_overlay()
         self.installEventFilter(self)
 
     def set_pixmap(self, pixmap: QPixmap):
         """Set the pixmap to display."""
         self._pixmap = pixmap
+        self._scaled_cache = None
         self.update()
 
-    def set_overlay(self, text: str):
-        """Set the overlay text."""
-        self._overlay_text = text
+    def set_image(self, image: QImage):
+        """Set a frame from the upscale worker. It is already RGB32 (the raster pixmap format), so the pixmap is
+        a plain copy; NoFormatConversion keeps fromImage from re-examining the image for a conversion path."""
+        self.set_pixmap(QPixmap.fromImage(image, Qt.NoFormatConversion))
+
+    def current_pixmap(self):
+        return self._pixmap
+
+    def set_transformation_mode(self, mode):
+        """Set the scaling filter (Qt.FastTransformation is preferable for live video)."""
+        self._transform_mode = mode
+        self._scaled_cache = None
         self.update()
 
     def eventFilter(self, obj, event):
@@ -133,24 +293,92 @@ class AspectRatioPreview(QLabel):
     def paintEvent(self, event):
         super().paintEvent(event)
         painter = QPainter(self)
-        # Draw the scaled pixmap centered
-        if self._pixmap:
-            scaled = self._pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            x = (self.width() - scaled.width()) // 2
-            y = (self.height() - scaled.height()) // 2
+        # Draw the scaled pixmap centered (hot path: attributes read once into locals)
+        pixmap = self._pixmap
+        if pixmap:
+            # Scale straight to physical pixels so HiDPI screens don't resample a second time
+            dpr = self.devicePixelRatioF()
+            size = self.size()
+            cache_key = (pixmap.cacheKey(), size, dpr)
+            scaled = self._scaled_cache
+            if scaled is None or self._scaled_cache_key != cache_key:
+                scaled = pixmap.scaled(size * dpr, Qt.KeepAspectRatio, self._transform_mode)
+                scaled.setDevicePixelRatio(dpr)
+                self._scaled_cache = scaled
+                self._scaled_cache_key = cache_key
+            x = int(size.width() - scaled.width() / dpr) // 2
+            y = int(size.height() - scaled.height() / dpr) // 2
             painter.drawPixmap(x, y, scaled)
-        # Draw overlay
-        if self._overlay_text:
-            overlay_rect = self.rect().adjusted(12, 12, -12, -12)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setBrush(QColor(30, 30, 30, 180))
-            painter.setPen(Qt.NoPen)
-            painter.drawRoundedRect(overlay_rect, 12, 12)
-            painter.setPen(QColor(255, 255, 255))
-            font = QFont()
-            font.setPointSize(12)
-            painter.setFont(font)
-            painter.drawText(overlay_rect, Qt.AlignTop | Qt.AlignRight, self._overlay_text)
+        self._paint_overlay(painter)
+
+if QOpenGLWidget is not None:
+    class GLPreview(QOpenGLWidget, _OverlayPainter):
+        """
+        OpenGL-backed counterpart of AspectRatioPreview with the same interface.
+        Frames are drawn straight from the worker's QImage through Qt's OpenGL paint engine: the image is
+        uploaded as a texture and scaled to the widget on the GPU, so there is no QPixmap conversion and no
+        CPU-side rescale per frame. The overlay is drawn over the frame in the same pass.
+        """
+        doubleClicked = Signal()
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            self._image = None # Latest frame from set_image()
+            self._pixmap = None # Set instead of _image by set_pixmap() (mode switches, placeholders)
+            self._original_text_when_fullscreen = None
+            self._original_text_when_corner = None
+            self._smooth = True
+            self._background = QColor(0x18, 0x18, 0x18)
+            self._init_overlay()
+
+        def set_pixmap(self, pixmap: QPixmap):
+            """Set the pixmap to display."""
+            self._pixmap = pixmap
+            self._image = None
+            self.update()
+
+        def set_image(self, image: QImage):
+            """Set a frame from the upscale worker; it is uploaded as-is when the widget paints."""
+            self._image = image
+            self._pixmap = None
+            self.update()
+
+        def current_pixmap(self):
+            if self._image is not None:
+                return QPixmap.fromImage(self._image, Qt.NoFormatConversion) # Only on display mode switches
+            return self._pixmap
+
+        def set_transformation_mode(self, mode):
+            """Set the scaling filter: Qt.SmoothTransformation samples the texture bilinearly."""
+            self._smooth = mode == Qt.SmoothTransformation
+            self.update()
+
+        def mouseDoubleClickEvent(self, event):
+            self.doubleClicked.emit()
+
+        def paintGL(self):
+            painter = QPainter(self)
+            painter.fillRect(self.rect(), self._background)
+            frame = self._image if self._image is not None else self._pixmap
+            if frame is not None and not frame.isNull():
+                painter.setRenderHint(QPainter.SmoothPixmapTransform, self._smooth)
+                # Fit the frame into the widget keeping its aspect ratio, centered
+                w, h = self.width(), self.height()
+                scale = min(w / frame.width(), h / frame.height())
+                dw, dh = frame.width() * scale, frame.height() * scale
+                target = QRectF((w - dw) / 2, (h - dh) / 2, dw, dh)
+                if frame is self._image:
+                    painter.drawImage(target, frame)
+                else:
+                    painter.drawPixmap(target, frame, QRectF(frame.rect()))
+            self._paint_overlay(painter)
+            painter.end()
+
+    _PreviewWidget = GLPreview
+else:
+    GLPreview = None
+    _PreviewWidget = AspectRatioPreview
 
 class FullScreenDisplayWindow(QWidget):
     def __init__(self, parent=None):
@@ -161,7 +389,7 @@ class FullScreenDisplayWindow(QWidget):
 
         self._layout = QVBoxLayout(self)
         self._layout.setContentsMargins(0,0,0,0)
-        self.preview_widget = AspectRatioPreview(self)
+        self.preview_widget = _PreviewWidget(self)
         self._layout.addWidget(self.preview_widget)
         self.setLayout(self._layout)
 
@@ -175,6 +403,9 @@ class FullScreenDisplayWindow(QWidget):
             # Optionally, clear or set a placeholder if pixmap is None/Null
             self.preview_widget.set_pixmap(QPixmap()) # Clear
 
+    def set_image(self, image: QImage):
+        self.preview_widget.set_image(image)
+
     def set_overlay(self, text: str):
         self.preview_widget.set_overlay(text)
 
@@ -185,7 +416,7 @@ class FullScreenDisplayWindow(QWidget):
             super().keyPressEvent(event)
 
     def get_current_pixmap(self): # Helper for LiveFeedScreen if needed
-        return self.preview_widget._pixmap
+        return self.preview_widget.current_pixmap()
 
     def get_current_overlay_text(self): # Helper for LiveFeedScreen if needed
         return self.preview_widget._overlay_text
@@ -203,7 +434,9 @@ class CornerOverlayWindow(QWidget):
         # Create layout with no margins for the preview
         self._layout = QVBoxLayout(self)
         self._layout.setContentsMargins(0, 0, 0, 0)
-        self.preview_widget = AspectRatioPreview(self)
+        self.preview_widget = _PreviewWidget(self)
+        # The full-resolution output is shrunk to a quarter-screen thumbnail every frame; smooth filtering isn't worth it
+        self.preview_widget.set_transformation_mode(Qt.FastTransformation)
         self._layout.addWidget(self.preview_widget)
         self.setLayout(self._layout)
         
@@ -225,90 +458,274 @@ class CornerOverlayWindow(QWidget):
         else:
             self.preview_widget.set_pixmap(QPixmap())  # Clear
 
+    def set_image(self, image: QImage):
+        self.preview_widget.set_image(image)
+
     def set_overlay(self, text: str):
         self.preview_widget.set_overlay(text)
 
     def get_current_pixmap(self):
-        return self.preview_widget._pixmap
+        return self.preview_widget.current_pixmap()
 
     def get_current_overlay_text(self):
         return self.preview_widget._overlay_text
 
 class UpscaleWorker(QObject):
-    finished = Signal(bytes, int, int, float, str, float)
+    """Persistent upscale consumer living on its own QThread.
+
+    The GUI thread hands frames over with submit(); run() loops until stop(). The thread outlives capture
+    sessions: stopping a capture only reset()s the worker, so Start doesn't spin up a new thread. Pending work is a single
+    slot: a frame submitted while the previous one is still waiting replaces it, so when upscaling falls
+    behind the worker always picks up the freshest capture instead of working through stale ones.
+
+    Results are delivered as display-ready QImages (Format_RGB32). Wrapping and converting the upscaled
+    pixels happens here rather than on the GUI thread, overlapping with painting of the previous frame.
+    Since the conversion copies, upscalers that support upscale_into() write into one reused bytearray.
+
+    Finished frames are not signalled: the newest one waits in a result slot until the GUI's paint tick
+    collects it with take_result(), so no per-frame cross-thread event or argument marshalling is needed.
+
+    prebuild() compiles an upscaler pipeline between frames. The upscaler's methods need exclusive access,
+    so this has to happen on the worker (or after drain()) rather than on the GUI thread while a frame is
+    in flight. prebuilt is emitted when it is done, whether or not it succeeded.
+    """
     error = Signal(str)
+    prebuilt = Signal()
 
-    def __init__(self, upscaler, frame, in_w, in_h, out_w, out_h, scale, interpolation_status: str, interpolation_cpu_time_ms: float):
+    def __init__(self):
         super().__init__()
-        self.upscaler = upscaler
-        self.frame = frame
-        self.in_w = in_w
-        self.in_h = in_h
-        self.out_w = out_w
-        self.out_h = out_h
-        self.scale = scale
-        self.interpolation_status = interpolation_status
-        self.interpolation_cpu_time_ms = interpolation_cpu_time_ms
-        print(f'[DEBUG] UpscaleWorker created: {id(self)}')
+        self._pending = None # Latest submitted job, or None
+        self.dropped_frames = 0
+        self._cond = threading.Condition()
+        self._running = True
+        self._busy = False
+        self._release = False # Set by reset(): run() drops its references to the last session's upscaler
+        self._generation = 0 # Bumped by reset(); results of jobs taken before that are discarded
+        self._out_buf = None
+        self._result = None # (image, in_w, in_h, out_w, out_h, upscale_gpu_time_ms, interpolation_status, interpolation_cpu_time_ms)
+        self._prebuild = None # (upscaler, in_w, in_h, out_w, out_h) to compile a pipeline for, run before the next frame
+        logger.debug("UpscaleWorker created: %s", id(self))
+
+    def submit(self, upscaler, frame, in_w, in_h, out_w, out_h, interpolation_status: str, interpolation_cpu_time_ms: float):
+        with self._cond:
+            if self._pending is not None:
+                self.dropped_frames += 1 # Superseded before the worker got to it
+            self._pending = (upscaler, frame, in_w, in_h, out_w, out_h, interpolation_status, interpolation_cpu_time_ms)
+            self._cond.notify()
+
+    def prebuild(self, upscaler, in_w, in_h, out_w, out_h):
+        """Compile the pipeline for the given shape on the worker thread. A newer request replaces one not yet started.
+        It survives reset(), so the GUI always gets the prebuilt signal it is waiting for."""
+        with self._cond:
+            self._prebuild = (upscaler, in_w, in_h, out_w, out_h)
+            self._cond.notify()
+
+    def drain(self):
+        """Drop pending frames and block until the in-flight upscale and any queued prebuild have finished.
+        Afterwards the worker does not touch the upscaler again until the GUI thread submits more work."""
+        with self._cond:
+            self._pending = None
+            while self._busy or self._prebuild is not None:
+                self._cond.wait()
+
+    def reset(self):
+        """End of a capture session: drop queued and finished frames without waiting for the in-flight
+        upscale, whose result is discarded when it completes. Once idle, the worker lets go of the session's
+        upscaler and output buffer but keeps running for the next session."""
+        with self._cond:
+            self._pending = None
+            self._result = None
+            self._generation += 1
+            self._release = True
+            self._cond.notify_all()
+
+    def take_result(self):
+        """Return the newest finished frame (or None) and clear the slot. Called from the GUI thread."""
+        with self._cond:
+            result, self._result = self._result, None
+        return result
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._pending = None
+            self._prebuild = None
+            self._out_buf = None
+            self._result = None
+            self._cond.notify_all()
 
     @Slot()
     def run(self):
-        import time
-        print(f"[PYTHON DEBUG] About to call upscaler.upscale: {self.upscaler!r}")
-        print(f"[PYTHON DEBUG] type(self.upscaler): {type(self.upscaler)}")
-        t0 = time.perf_counter()
-        try:
-            print("[DEBUG] UpscaleWorker: Before upscale")
-            result = self.upscaler.upscale(self.frame)
-            print("[DEBUG] UpscaleWorker: After upscale")
-            t1 = time.perf_counter()
-            upscale_gpu_time_ms = (t1 - t0) * 1000
-            self.finished.emit(result, self.out_w, self.out_h, upscale_gpu_time_ms, self.interpolation_status, self.interpolation_cpu_time_ms)
-        except Exception as e:
-            print(f"[DEBUG] UpscaleWorker: Exception: {e}")
-            self.error.emit(str(e))
+        cond = self._cond
+        # The upscaler's entry points are looked up once per upscaler instead of on every frame
+        bound_upscaler = upscale = upscale_into = None
+        while True:
+            with cond:
+                while self._running and self._pending is None and self._prebuild is None:
+                    if self._release:
+                        self._release = False
+                        bound_upscaler = upscale = upscale_into = upscaler = frame = result = image = prebuild = None
+                        self._out_buf = None
+                    cond.wait()
+                if not self._running:
+                    return
+                prebuild, self._prebuild = self._prebuild, None
+                if prebuild is None:
+                    upscaler, frame, in_w, in_h, out_w, out_h, interpolation_status, interpolation_cpu_time_ms = self._pending
+                    self._pending = None
+                    generation = self._generation
+                self._busy = True
+            if prebuild is not None:
+                try:
+                    prebuild[0].get_or_build_pipeline(*prebuild[1:])
+                except Exception as e:
+                    # Not fatal: the GUI's initialize() builds the pipeline itself if it is still missing
+                    logger.debug("UpscaleWorker: pipeline prebuild failed: %s", e)
+                finally:
+                    prebuild = None
+                    with cond:
+                        self._busy = False
+                        cond.notify_all()
+                self.prebuilt.emit()
+                continue
+            if upscaler is not bound_upscaler:
+                bound_upscaler = upscaler
+                upscale = upscaler.upscale
+                upscale_into = getattr(upscaler, 'upscale_into', None)
+            t0 = _perf_counter()
+            try:
+                if upscale_into is not None:
+                    result = self._out_buf
+                    if result is None or len(result) != out_w * out_h * 4:
+                        result = self._out_buf = bytearray(out_w * out_h * 4)
+                    upscale_into(frame, result)
+                else:
+                    result = upscale(frame)
+                upscale_gpu_time_ms = (_perf_counter() - t0) * 1000
+                # Captured frames are opaque, so RGBX -> RGB32 skips alpha premultiplication and the pixmap
+                # paints without blending. The converted image owns its pixels, so `result` can be reused.
+                image = QImage(result, out_w, out_h, 4 * out_w, QImage.Format_RGBX8888).convertToFormat(QImage.Format_RGB32)
+                with cond:
+                    if generation == self._generation: # Not reset() while upscaling
+                        self._result = (image, in_w, in_h, out_w, out_h, upscale_gpu_time_ms, interpolation_status, interpolation_cpu_time_ms)
+            except Exception as e:
+                logger.debug("UpscaleWorker: Exception: %s", e)
+                self.error.emit(str(e))
+            finally:
+                with cond:
+                    self._busy = False
+                    cond.notify_all()
 
     def __del__(self):
-        print(f'[DEBUG] UpscaleWorker __del__: {id(self)}')
+        logger.debug("UpscaleWorker __del__: %s", id(self))
+
+class FrameWaiter(QObject):
+    """Waits on a capture's PyFrameSignal on its own QThread and emits frame_ready when a new frame arrives.
+
+    At most one frame_ready is queued at a time: `pending` stays set until the receiver clears it,
+    so a slow GUI thread never builds up a backlog of update_frame calls.
+    """
+    frame_ready = Signal()
+
+    def __init__(self, frame_signal):
+        super().__init__()
+        self._frame_signal = frame_signal
+        self._running = True
+        self.pending = False
+
+    def stop(self):
+        self._running = False
+        self._frame_signal.close() # Wakes run() immediately
+
+    @Slot()
+    def run(self):
+        while self._running:
+            arrived = self._frame_signal.wait(250)
+            if arrived is None:
+                return # Capture stopped
+            if arrived and not self.pending:
+                self.pending = True
+                self.frame_ready.emit()
+
+class _TargetScanSignals(QObject):
+    done = Signal(object, bool) # ([(label, pid or None)], whether the scan succeeded)
+
+class TargetScanJob(QRunnable):
+    """Enumerates capture targets on a QThreadPool thread so window/process listing never blocks the GUI."""
+    def __init__(self, scan_fn):
+        super().__init__()
+        self.scan_fn = scan_fn
+        self.signals = _TargetScanSignals()
+
+    def run(self):
+        try:
+            entries, ok = self.scan_fn()
+        except Exception as e:
+            traceback.print_exc()
+            entries, ok = [(f"Error listing targets: {e}", None)], False
+        self.signals.done.emit(entries, ok)
 
 class LiveFeedScreen(QWidget):
     log_signal = Signal(str)
+    TARGETS_CACHE_TTL_S = 1.0
+    FPS_WINDOW = 16 # Upscale times the scaled FPS median is taken over
+    TEXT_UPDATE_INTERVAL_S = 0.15 # Overlay/status bar/profiler stats are refreshed at most this often; the pixmap updates every frame
+    VRAM_STYLES = ("color: green", "color: orange", "color: red; font-weight: bold") # By usage band: <=75%, <=90%, >90%
+    ERROR_REPEAT_S = 5.0 # The same per-frame error is reported again at most this often
+    SCALE_SETTLE_MS = 250 # The scale slider must rest this long before its value is applied (and its pipeline built)
     profiler_signal = Signal(float, float, int, int)
     warning_signal = Signal(str, bool)
     def __init__(self, parent=None):
         super().__init__(parent)
         self.capture = None
         self.upscaler = None
+        # Shared "no image" pixmap for clearing surfaces. Not a class attribute: a QPixmap cannot be
+        # constructed before the QApplication exists
+        self._empty_pixmap = QPixmap()
         self.interpolator = None
-        if nu_scaler_core and hasattr(nu_scaler_core, 'WgpuFrameInterpolator'):
+        if _WgpuFrameInterpolator is not None:
             try:
                 # Default workgroup preset is Wide32x8
-                self.interpolator = nu_scaler_core.WgpuFrameInterpolator()
+                self.interpolator = _WgpuFrameInterpolator()
                 print("[LiveFeedScreen] WgpuFrameInterpolator initialized successfully.")
-                if hasattr(self, 'log_signal') and self.log_signal is not None: # Check if log_signal is connected
-                    self.log_signal.emit("Frame Interpolator: Initialized")
+                self.log_signal.emit("Frame Interpolator: Initialized")
             except Exception as e:
                 print(f"[LiveFeedScreen] Failed to initialize WgpuFrameInterpolator: {e}")
                 traceback.print_exc()
-                if hasattr(self, 'log_signal') and self.log_signal is not None:
-                    self.log_signal.emit(f"Frame Interpolator: Failed to init: {e}")
+                self.log_signal.emit(f"Frame Interpolator: Failed to init: {e}")
         else:
             print("[LiveFeedScreen] WgpuFrameInterpolator not available in nu_scaler_core.")
-            if hasattr(self, 'log_signal') and self.log_signal is not None:
-                 self.log_signal.emit("Frame Interpolator: Not available in core library")
+            self.log_signal.emit("Frame Interpolator: Not available in core library")
         
         self.prev_frame_data = None # Stores (bytes, width, height) for interpolation
         self.interpolation_enabled = False
+        # Single display-rate tick while capturing: polls the capture (when it can't push frames) and presents
+        # the newest upscaled frame collected from the worker. Upscaling runs on the worker thread, so this
+        # only has to keep up with the display.
         self.timer = QTimer(self)
-        self.timer.setInterval(100)  # Lowered to 10 FPS for diagnosis
-        self.timer.timeout.connect(self.update_frame)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(self._display_interval_ms())
+        self.timer.timeout.connect(self._on_display_tick)
+        self._poll_capture = True
+        # Window captures push frame arrivals through a FrameWaiter instead of being polled by self.timer
+        self._frame_thread = None
+        self._frame_waiter = None
         
         # --- FPS Calculation Attributes ---
         self.last_frame_time = None # For scaled FPS
         self.fps = 0.0 # Scaled FPS
+        self._gpu_ms_ring = [] # Last FPS_WINDOW upscale times; self.fps is derived from their median
+        self._gpu_ms_idx = 0 # Next slot to overwrite once the ring is full
+        self._text_updated_at = 0.0 # _perf_counter() of the last overlay/status text rebuild
+        self._overlay_str = "" # Last overlay text, reused by frames between rebuilds
+        self._status_str = None # Last status bar text set by _present_upscaled_frame
+        self._last_err_sig = None # (where, type, message prefix) of the last reported per-frame error
+        self._last_err_at = 0.0
+        self._oneshot_frames_remaining = 0 # Set by SettingsScreen.capture_frame: stop after this many presented frames
         
         self.base_fps = 0.0 # FPS of frames coming from capture source
-        self.last_base_frame_time = None
+        # update_frame only counts captured frames; _tick_1hz turns the count into base_fps
+        self.last_base_frame_time = _perf_counter()
         self.base_frame_count_for_fps = 0
         # --- END FPS Calculation Attributes ---
         
@@ -316,17 +733,20 @@ class LiveFeedScreen(QWidget):
         self.upscaler_initialized = False
         self.upscale_scale = 2.0  # Default scale factor
         self.advanced_upscaling = True  # Use advanced upscaler by default
-        self.memory_monitor_timer = QTimer(self)
-        self.memory_monitor_timer.timeout.connect(self.update_memory_stats)
-        self.memory_monitor_timer.start(2000)  # Update every 2 seconds
         self.vram_usage = 0.0
         self.total_vram = 0.0
         self.show_memory_stats = True
         self._upscale_thread = None
         self._upscale_worker = None
-        self._last_in_w = None
-        self._last_in_h = None
-        self._last_scale = None
+        # The upscale thread lives until the app quits; closeEvent doesn't reach an embedded widget on exit
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_upscale_worker)
+        self._targets_cache = None # Cached process target list (see refresh_targets)
+        self._targets_scan_signals = None # Set while a TargetScanJob is running
+        self._targets_scanned_at = 0.0 # time.monotonic() of the last successful scan
+        self._upscaler_cfg = None # (in_w, in_h, out_w, out_h, method, quality) the upscaler was initialized with
+        self._last_submitted_frame = None # Last frame handed to the upscale worker
         self.fullscreen_display_window = None # For dedicated fullscreen output
         self.corner_overlay_window = None # For corner overlay output
         self.display_mode = "embedded" # "embedded", "fullscreen", or "corner"
@@ -339,48 +759,38 @@ class LiveFeedScreen(QWidget):
         print('[DEBUG] LiveFeedScreen: Before update_scale_label')
         self.update_scale_label()
         print('[DEBUG] LiveFeedScreen: After update_scale_label')
-        # Heartbeat timer
-        self.heartbeat_timer = QTimer(self)
-        self.heartbeat_timer.setInterval(1000)
-        self.heartbeat_timer.timeout.connect(self._heartbeat)
-        self.heartbeat_timer.start()
-        # Resource monitor timer
-        self.resource_timer = QTimer(self)
-        self.resource_timer.setInterval(1000)
-        self.resource_timer.timeout.connect(self._resource_debug)
-        self.resource_timer.start()
-        # Start watchdog thread
-        self._watchdog_running = True
-        self._watchdog_thread = threading.Thread(target=self._watchdog_loop, daemon=True)
-        self._watchdog_thread.start()
-
-    def _watchdog_loop(self):
-        while self._watchdog_running:
-            try:
-                print(f"[WATCHDOG] Still alive at {time.strftime('%H:%M:%S')}")
-                process = psutil.Process(os.getpid())
-                mem = process.memory_info().rss / (1024 * 1024)
-                thread_count = threading.active_count()
-                print(f"[WATCHDOG] Memory: {mem:.1f} MB | Threads: {thread_count}")
-            except Exception as e:
-                print(f"[WATCHDOG] Error: {e}")
-            time.sleep(1)
+        # One 1 Hz housekeeping timer: heartbeat, process resources and (every other tick) VRAM stats.
+        # Being a GUI-thread timer it doubles as the event-loop liveness check the old watchdog thread did.
+        self._proc = None # psutil.Process handle, created on the first tick and reused
+        self._housekeeping_ticks = 0
+        self.housekeeping_timer = QTimer(self)
+        self.housekeeping_timer.setInterval(1000)
+        self.housekeeping_timer.timeout.connect(self._tick_1hz)
+        self.housekeeping_timer.start()
 
     def closeEvent(self, event):
-        self._watchdog_running = False
+        self.housekeeping_timer.stop()
+        self._stop_upscale_worker()
         super().closeEvent(event)
 
-    def _heartbeat(self):
-        print(f"[HEARTBEAT] GUI event loop alive at {time.strftime('%H:%M:%S')}")
-
-    def _resource_debug(self):
+    def _tick_1hz(self):
+        self._housekeeping_ticks += 1
+        # Base FPS over the actual elapsed time, so a late tick doesn't inflate it
+        now = _perf_counter()
+        elapsed = now - self.last_base_frame_time
+        if elapsed > 0:
+            self.base_fps = self.base_frame_count_for_fps / elapsed
+        self.base_frame_count_for_fps = 0
+        self.last_base_frame_time = now
         try:
-            process = psutil.Process(os.getpid())
-            mem = process.memory_info().rss / (1024 * 1024)
-            thread_count = threading.active_count()
-            print(f"[RESOURCE] Memory: {mem:.1f} MB | Threads: {thread_count}")
+            if self._proc is None:
+                self._proc = _import_psutil().Process(os.getpid())
+            mem = self._proc.memory_info().rss / (1024 * 1024)
+            print(f"[HEARTBEAT] {time.strftime('%H:%M:%S')} | Memory: {mem:.1f} MB | Threads: {threading.active_count()}")
         except Exception as e:
-            print(f"[RESOURCE] Error: {e}")
+            print(f"[HEARTBEAT] Error: {e}")
+        if self._housekeeping_ticks % 2 == 0: # VRAM stats keep their 2 s cadence
+            self.update_memory_stats()
 
     def init_ui(self):
         layout = QHBoxLayout(self)
@@ -405,7 +815,7 @@ class LiveFeedScreen(QWidget):
         self.target_box.setEnabled(False)
         self.source_box.currentTextChanged.connect(self.update_source_ui)
         self.refresh_targets_btn = QPushButton("Refresh Targets")
-        self.refresh_targets_btn.clicked.connect(self.refresh_targets)
+        self.refresh_targets_btn.clicked.connect(lambda: self.refresh_targets())
         self.start_btn = QPushButton("Start")
         self.start_btn.clicked.connect(self.start_capture)
         self.stop_btn = QPushButton("Stop")
@@ -433,24 +843,30 @@ class LiveFeedScreen(QWidget):
         self.output_label.setAlignment(Qt.AlignCenter)
         self.output_label.setStyleSheet("font-size: 18px; color: #ccc;")
         # Modern maximized aspect-ratio-aware preview
-        self.output_preview = AspectRatioPreview()
+        self.output_preview = _PreviewWidget()
         self.output_preview.setMinimumSize(320, 180)
         self.output_preview.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.output_preview.doubleClicked.connect(self.handle_dedicated_fullscreen_toggle) # Connect to new handler
+        self.output_preview.set_transformation_mode(Qt.FastTransformation) # Rescaled every frame, keep it cheap
         right_layout.addWidget(self.output_label)
         right_layout.addWidget(self.output_preview, 1)
         # Upscaling controls
         upscale_controls = QGroupBox("Upscaling Settings")
         upscale_form = QFormLayout(upscale_controls)
         self.method_box = QComboBox()
-        methods = []
-        if hasattr(nu_scaler_core, 'DlssUpscaler'):
-            methods.append("DLSS")
-        if hasattr(nu_scaler_core, 'PyWgpuUpscaler'):
-            methods.append("WGPU Nearest")
-            methods.append("WGPU Bilinear")
+        # Upscaler factories for the methods this build provides, keyed by method_box text.
+        # init_upscaler dispatches through this dict; each factory takes the quality string.
+        self._method_factories = {}
+        if _DlssUpscaler is not None:
+            self._method_factories["DLSS"] = self._make_dlss_upscaler
+        if _PyWgpuUpscaler is not None:
+            # The two WGPU methods only differ in the algorithm string, bound here once
+            self._method_factories["WGPU Nearest"] = functools.partial(self._make_wgpu_upscaler, algorithm="nearest")
+            self._method_factories["WGPU Bilinear"] = functools.partial(self._make_wgpu_upscaler, algorithm="bilinear")
+        if _bilinear_numba is not None:
+            self._method_factories["CPU Bilinear"] = self._make_cpu_bilinear_upscaler
         # Add FSR, etc. as needed
-        self.method_box.addItems(methods)
+        self.method_box.addItems(list(self._method_factories))
         self.quality_box = QComboBox()
         self.quality_box.addItems(["ultra", "quality", "balanced", "performance"])
         self.quality_box.setToolTip("Select the upscaling quality.")
@@ -459,6 +875,15 @@ class LiveFeedScreen(QWidget):
         self.scale_slider.setValue(20)
         self.scale_slider.valueChanged.connect(self.update_scale_label)
         self.scale_label = QLabel("2.0×")
+        # Every intermediate slider value would otherwise re-initialize the upscaler (and compile a pipeline)
+        self._scale_settle_timer = QTimer(self)
+        self._scale_settle_timer.setSingleShot(True)
+        self._scale_settle_timer.setInterval(self.SCALE_SETTLE_MS)
+        self._scale_settle_timer.timeout.connect(self._apply_settled_scale)
+        # update_frame reads the cached settings instead of querying three widgets on every tick
+        self.method_box.currentTextChanged.connect(self._update_upscale_settings)
+        self.quality_box.currentTextChanged.connect(self._update_upscale_settings)
+        self._update_upscale_settings()
         upscale_form.addRow("Method:", self.method_box)
         upscale_form.addRow("Quality:", self.quality_box)
         upscale_form.addRow("Scale Factor:", self.scale_slider)
@@ -477,12 +902,14 @@ class LiveFeedScreen(QWidget):
         self.advanced_check.setChecked(self.advanced_upscaling)
         self.advanced_check.stateChanged.connect(self.toggle_advanced_upscaling)
         upscale_controls.layout().addRow(self.advanced_check)
-        self.memory_stats_label = QLabel("VRAM: 0.0 MB / 0.0 MB (0%)", self)
+        self._vram_text = "VRAM: 0.0 MB / 0.0 MB (0%)"
+        self._vram_bucket = None
+        self.memory_stats_label = QLabel(self._vram_text, self)
         upscale_controls.layout().addRow(self.memory_stats_label)
         memory_strategy_layout = QHBoxLayout()
         memory_strategy_layout.addWidget(QLabel("Memory Strategy:"))
         self.memory_strategy_box = QComboBox(self)
-        self.memory_strategy_box.addItems(["Auto", "Aggressive", "Balanced", "Conservative", "Minimal"])
+        self.memory_strategy_box.addItems([strategy.capitalize() for strategy in _MEMORY_STRATEGIES])
         self.memory_strategy_box.setCurrentText("Auto")
         self.memory_strategy_box.currentIndexChanged.connect(self.set_memory_strategy)
         memory_strategy_layout.addWidget(self.memory_strategy_box)
@@ -502,110 +929,161 @@ class LiveFeedScreen(QWidget):
         form.addRow("Display Mode:", self.display_btn)
 
     def update_source_ui(self, text):
-        self.target_box.clear()
         if text == "Process":
+            # With a cached list, _set_target_items only swaps the rows that differ (and keeps the selection)
+            if not self._targets_cache:
+                self.target_box.clear()
             self.target_box.setEnabled(True)
             self.refresh_targets_btn.setEnabled(True)
-            self.refresh_targets()
+            self.refresh_targets(use_cache=True)
         elif text == "Screen":
             self.target_box.setEnabled(False)
             self.refresh_targets_btn.setEnabled(False)
+            self.target_box.clear()
             self.target_box.addItem("N/A - Captures primary screen")
         elif text == "Region":
             self.target_box.setEnabled(False)
             self.refresh_targets_btn.setEnabled(False)
+            self.target_box.clear()
             self.target_box.addItem("N/A - Uses fixed region coordinates")
         else:
             self.target_box.setEnabled(False)
             self.refresh_targets_btn.setEnabled(False)
+            self.target_box.clear()
             self.target_box.addItem("N/A - Invalid Source")
 
-    def refresh_targets(self):
+    def refresh_targets(self, use_cache=False):
+        """Populate the target list. Enumerating windows/processes is slow, so it runs on the thread pool,
+        the result is cached and only re-enumerated on an explicit refresh (use_cache=False)."""
         current_source_type = self.source_box.currentText()
-        self.target_box.clear()
+        if current_source_type != "Process":
+            return # target_box is handled by update_source_ui
+
+        # Repeated refresh clicks within TARGETS_CACHE_TTL_S reuse the last scan
+        fresh = time.monotonic() - self._targets_scanned_at < self.TARGETS_CACHE_TTL_S
+        if self._targets_cache and (use_cache or fresh):
+            self._set_target_items(self._targets_cache)
+            return
+        if self._targets_scan_signals is not None:
+            return # A scan is already running; its result will fill the list
         print(f"[GUI] Refreshing targets for source type: {current_source_type}")
-        
-        if current_source_type == "Process":
-            apps = {}
-            if os.name == 'nt' and win32gui and win32process:
-                print("[GUI] Using pywin32 to find 'App' processes (with visible windows).")
-                try:
-                    def enum_windows_callback(hwnd, lParam):
-                        if win32gui.IsWindowVisible(hwnd) and win32gui.GetWindowText(hwnd):
-                            _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                            # We store the title with the PID in case we need it for WindowByTitle fallback
-                            # and to ensure we only list a PID once even if it has multiple such windows.
-                            if pid not in lParam:
-                                lParam[pid] = win32gui.GetWindowText(hwnd) # Store first non-empty title found for this PID
-                        return True # Continue enumeration
-
-                    window_owning_pids_with_titles = {}
-                    win32gui.EnumWindows(enum_windows_callback, window_owning_pids_with_titles)
-
-                    if not window_owning_pids_with_titles:
-                        self.target_box.addItem("No processes with visible windows found (via pywin32).")
-                        self.target_box.setEnabled(False)
-                        return
+        if self.target_box.count() == 0:
+            self.target_box.addItem("(scanning...)") # Otherwise the current list stays up until the scan is merged in
+
+        job = TargetScanJob(self._scan_process_targets)
+        job.signals.done.connect(self._on_targets_scanned, Qt.QueuedConnection)
+        self._targets_scan_signals = job.signals # Keep the signal holder alive until delivery
+        QThreadPool.globalInstance().start(job)
+
+    @Slot(object, bool)
+    def _on_targets_scanned(self, entries, ok):
+        self._targets_scan_signals = None
+        if ok:
+            self._targets_cache = entries
+            self._targets_scanned_at = time.monotonic()
+        if self.source_box.currentText() != "Process":
+            return # Source changed while scanning
+        self._set_target_items(entries)
+        if not ok:
+            self.target_box.setEnabled(False)
 
-                    # Now cross-reference with psutil to get process names
-                    final_apps_list = []
-                    for proc in psutil.process_iter(['pid', 'name']):
-                        try:
-                            pid = proc.info['pid']
-                            if pid in window_owning_pids_with_titles:
-                                name = proc.info['name'] or "N/A"
-                                # Using the title obtained from win32gui as it might be more accurate for the main window
-                                # For display, we show process name and PID.
-                                final_apps_list.append(f"{name} (PID: {pid})") 
-                        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                            continue
-                    
-                    if final_apps_list:
-                        self.target_box.addItems(sorted(list(set(final_apps_list)))) # Set for uniqueness, then sort
-                    else:
-                        # This case should be rare if window_owning_pids_with_titles was populated
-                        self.target_box.addItem("Could not match PIDs to process names.")
-                        self.target_box.setEnabled(False)
-
-                except Exception as e_win32:
-                    print(f"[GUI] Error using pywin32 for process listing: {e_win32}")
-                    traceback.print_exc()
-                    self.target_box.addItem("Error listing processes with pywin32.")
-                    self.log_signal.emit(f"pywin32 error: {e_win32}")
-                    self.target_box.setEnabled(False)
-            
-            else: # Not on Windows or pywin32 not available
-                if os.name == 'nt': # Specifically on Windows but pywin32 failed to import
-                    msg = "pywin32 missing for App list; showing basic process list."
-                    self.log_signal.emit("Warning: pywin32 not found. Process list may include background tasks.")
-                else: # Not on Windows
-                    msg = "Process capture not optimized for non-Windows; showing basic process list."
-                    self.log_signal.emit("Info: Process listing uses basic psutil iteration on non-Windows.")
-                
-                print(f"[GUI] {msg}")
-                self.target_box.addItem(msg) # Add as first item to inform user
+    def _set_target_items(self, entries):
+        """Make target_box list `entries` ((label, pid or None) pairs) in order, removing and inserting
+        only the rows that differ, so a refresh doesn't rebuild a few hundred items or lose the current selection.
+        The PID is stored as the item's UserRole data for start_capture."""
+        box = self.target_box
+        wanted = {text for text, _ in entries}
+        for row in range(box.count() - 1, -1, -1):
+            if box.itemText(row) not in wanted:
+                box.removeItem(row)
+        for row, (text, pid) in enumerate(entries):
+            if row >= box.count() or box.itemText(row) != text:
+                box.insertItem(row, text, pid)
+        for row in range(box.count() - 1, len(entries) - 1, -1):
+            box.removeItem(row) # Leftovers from a reordering
+
+    def _scan_process_targets(self):
+        """Enumerate "Process" capture targets. Runs on a worker thread, so it must not touch widgets.
+        Returns (entries, ok) with entries as (label, pid or None) pairs; entries are only cached when ok is True."""
+        psutil = _import_psutil()
+        apps = {}
+        if _user32 is not None:
+            print("[GUI] Finding 'App' processes (with visible windows).")
+            try:
+                window_pids = _visible_window_pids()
 
-                # Fallback to basic psutil listing (all processes with a name and exe)
-                psutil_apps = []
-                for proc in psutil.process_iter(['pid', 'name', 'exe']):
+                if not window_pids:
+                    return [("No processes with visible windows found.", None)], False
+
+                # Now get process names from psutil. Only the window-owning PIDs need one, so look those up
+                # directly instead of walking every process on the system.
+                final_apps = set()
+                for pid in window_pids:
                     try:
-                        proc_name = proc.info['name'] or "N/A"
-                        if proc_name and proc.info.get('exe'):
-                           psutil_apps.append(f"{proc_name} (PID: {proc.info['pid']})")
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                        name = psutil.Process(pid).name() or "N/A"
+                    except psutil.AccessDenied:
+                        name = "N/A"
+                    except (psutil.NoSuchProcess, psutil.ZombieProcess):
                         continue
-                if psutil_apps:
-                    self.target_box.addItems(sorted(list(set(psutil_apps))))
-                else: # If basic list also empty (very unlikely)
-                    self.target_box.addItem("No processes found via psutil.")
-                    self.target_box.setEnabled(False) # Only disable if truly nothing found
+                    # For display, we show process name and PID.
+                    final_apps.add((f"{name} (PID: {pid})", pid))
+                
+                if final_apps:
+                    return sorted(final_apps), True
+                # This case should be rare if window_pids was populated
+                return [("Could not match PIDs to process names.", None)], False
+
+            except Exception as e_win32:
+                print(f"[GUI] Error enumerating windows for process listing: {e_win32}")
+                traceback.print_exc()
+                self.log_signal.emit(f"Window enumeration error: {e_win32}")
+                return [("Error listing processes with visible windows.", None)], False
         
-        else: # Screen or Region
-            pass # target_box is handled by update_source_ui
+        else: # Not on Windows
+            msg = "Process capture not optimized for non-Windows; showing basic process list."
+            self.log_signal.emit("Info: Process listing uses basic psutil iteration on non-Windows.")
+            
+            print(f"[GUI] {msg}")
+
+            # Fallback to basic psutil listing (all processes with a name and exe)
+            psutil_apps = set()
+            for proc in psutil.process_iter(['pid', 'name', 'exe']):
+                try:
+                    proc_name = proc.info['name'] or "N/A"
+                    if proc_name and proc.info.get('exe'):
+                       psutil_apps.add((f"{proc_name} (PID: {proc.info['pid']})", proc.info['pid']))
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    continue
+            # msg goes first to inform the user
+            if psutil_apps:
+                return [(msg, None)] + sorted(psutil_apps), True
+            # If basic list also empty (very unlikely)
+            return [(msg, None), ("No processes found via psutil.", None)], False
+
+    def _update_upscale_settings(self, *_):
+        self._upscale_settings = (self.scale_slider.value() / 10.0, self.method_box.currentText(), self.quality_box.currentText())
 
     def update_scale_label(self):
         val = self.scale_slider.value() / 10.0
         self.scale_label.setText(f"{val:.1f}×")
+        self._scale_settle_timer.start() # Restarted by every step; only the settled value is applied
+
+    def _apply_settled_scale(self):
+        # While capturing, the pipeline for the new scale is compiled on the upscale worker first and the
+        # setting is applied once it is ready (_on_pipeline_prebuilt), so the re-init on the next frame
+        # finds it cached instead of compiling on the GUI thread
+        val = self.scale_slider.value() / 10.0
+        upscaler, cfg, worker = self.upscaler, self._upscaler_cfg, self._upscale_worker
+        if worker is not None and upscaler is not None and cfg is not None and hasattr(upscaler, 'get_or_build_pipeline'):
+            in_w, in_h = cfg[:2]
+            worker.prebuild(upscaler, in_w, in_h, int(in_w * val), int(in_h * val))
+        else:
+            self._update_upscale_settings()
+
+    def _on_pipeline_prebuilt(self):
+        # A later slider move restarted the timer: that value will be applied (and prebuilt) instead
+        if not self._scale_settle_timer.isActive():
+            self._update_upscale_settings()
 
     def start_capture(self):
         print("[GUI] Start capture requested.")
@@ -624,8 +1102,8 @@ class LiveFeedScreen(QWidget):
             if source == "Screen":
                 # Check if core supports FullScreen capture
                 # Corrected check using hasattr:
-                if hasattr(nu_scaler_core, "PyCaptureTarget") and hasattr(nu_scaler_core.PyCaptureTarget, "FullScreen"):
-                    capture_target_type = nu_scaler_core.PyCaptureTarget.FullScreen
+                if _CORE_HAS_FULLSCREEN:
+                    capture_target_type = _TARGET_FULLSCREEN
                     print("[GUI] Using FullScreen target.")
                 else:
                     self.log_signal.emit("Error: FullScreen capture target not available in nu_scaler_core.")
@@ -638,64 +1116,53 @@ class LiveFeedScreen(QWidget):
                     self.status_bar.setText("Invalid process selection")
                     return
                 try:
-                    pid_str = target_selection[target_selection.rfind("(PID: ") + 6:-1]
-                    pid = int(pid_str)
+                    pid = self.target_box.currentData()
+                    if pid is None: # Entry without PID data; parse it from the label
+                        match = _PID_RE.search(target_selection)
+                        if match is None:
+                            raise ValueError(target_selection)
+                        pid = int(match.group(1))
                     
                     # Ideal scenario: Core supports capturing by PID directly
                     # Check if PyCaptureTarget exists and has a WindowByPid attribute/member
                     # Also check if the corresponding PyWindowByPid struct/class exists.
-                    if hasattr(nu_scaler_core, "PyCaptureTarget") and hasattr(nu_scaler_core.PyCaptureTarget, "WindowByPid") and hasattr(nu_scaler_core, "PyWindowByPid"):
-                        capture_target_type = nu_scaler_core.PyCaptureTarget.WindowByPid
-                        capture_target_param = nu_scaler_core.PyWindowByPid(pid=pid)
+                    if _CORE_HAS_WINDOW_BY_PID:
+                        capture_target_type = _TARGET_WINDOW_BY_PID
+                        capture_target_param = _PyWindowByPid(pid=pid)
                         print(f"[GUI] Using WindowByPid target (from core): {pid}")
                         self.log_signal.emit(f"Attempting capture for PID {pid} using core WindowByPid.")
-                    # Fallback: If core doesn't support WindowByPid, we might need to find a window title
-                    # using pywin32 (if available and on Windows) and use WindowByTitle.
+                    # Fallback: If core doesn't support WindowByPid, find a window title for the PID
+                    # through user32 (ctypes, Windows only) and use WindowByTitle.
                     # This part makes the assumption that if WindowByPid is not in core, we still need a window title.
-                    elif os.name == 'nt' and win32gui and win32process: # Check if on Windows and pywin32 is available
-                        print(f"[GUI] Core WindowByPid not found. Attempting to find main window title for PID: {pid} using pywin32 for WindowByTitle fallback.")
-                        found_title_for_pid = None
+                    elif _user32 is not None: # Check if on Windows
+                        print(f"[GUI] Core WindowByPid not found. Attempting to find main window title for PID: {pid} for WindowByTitle fallback.")
                         try:
-                            # Callback to find a suitable window for the specific PID
-                            def find_pid_window_callback(hwnd, lParam):
-                                target_pid, storage = lParam # lParam is a tuple (target_pid, [list_to_store_title])
-                                if win32gui.IsWindowVisible(hwnd):
-                                    _, current_pid = win32process.GetWindowThreadProcessId(hwnd)
-                                    if current_pid == target_pid:
-                                        title = win32gui.GetWindowText(hwnd)
-                                        if title: # Found a visible window with a title for our PID
-                                            storage.append(title)
-                                            return False # Stop enumeration, we found one
-                                return True # Continue enumeration
-                            
-                            window_titles_for_pid = []
-                            win32gui.EnumWindows(find_pid_window_callback, (pid, window_titles_for_pid))
-
-                            if window_titles_for_pid:
-                                found_title_for_pid = window_titles_for_pid[0] # Take the first one found
-                                print(f"[GUI] pywin32 found window title '{found_title_for_pid}' for PID {pid}.")
+                            find_title = _core_window_title_for_pid or _window_title_for_pid
+                            found_title_for_pid = find_title(pid)
+                            if found_title_for_pid:
+                                print(f"[GUI] Found window title '{found_title_for_pid}' for PID {pid}.")
 
                             # Check if core supports WindowByTitle capture
-                            if found_title_for_pid and hasattr(nu_scaler_core, "PyCaptureTarget") and hasattr(nu_scaler_core.PyCaptureTarget, "WindowByTitle") and hasattr(nu_scaler_core, "PyWindowByTitle"):
-                                capture_target_type = nu_scaler_core.PyCaptureTarget.WindowByTitle
-                                capture_target_param = nu_scaler_core.PyWindowByTitle(title=found_title_for_pid)
-                                print(f"[GUI] Fallback: Capturing PID {pid} via window title '{found_title_for_pid}' (found with pywin32).")
-                                self.log_signal.emit(f"Fallback: Capturing PID {pid} using pywin32-found window title: '{found_title_for_pid}'.")
+                            if found_title_for_pid and _CORE_HAS_WINDOW_BY_TITLE:
+                                capture_target_type = _TARGET_WINDOW_BY_TITLE
+                                capture_target_param = _PyWindowByTitle(title=found_title_for_pid)
+                                print(f"[GUI] Fallback: Capturing PID {pid} via window title '{found_title_for_pid}' (found with user32).")
+                                self.log_signal.emit(f"Fallback: Capturing PID {pid} using user32-found window title: '{found_title_for_pid}'.")
                             else:
                                 if not found_title_for_pid:
-                                    self.log_signal.emit(f"Could not find a suitable window title for PID {pid} using pywin32 for fallback.")
-                                    self.status_bar.setText(f"No window title for PID {pid} (pywin32)")
+                                    self.log_signal.emit(f"Could not find a suitable window title for PID {pid} for fallback.")
+                                    self.status_bar.setText(f"No window title for PID {pid}")
                                 else: # Found title but WindowByTitle target is missing in core
-                                    self.log_signal.emit(f"Error: WindowByTitle capture not available in nu_scaler_core for PID {pid} pywin32 fallback.")
+                                    self.log_signal.emit(f"Error: WindowByTitle capture not available in nu_scaler_core for PID {pid} window title fallback.")
                                     self.status_bar.setText("WindowByTitle missing for PID fallback")
                                 return
                         except Exception as e_gw_fallback:
-                            self.log_signal.emit(f"Error during pywin32 fallback for PID {pid} window search: {e_gw_fallback}")
-                            self.status_bar.setText(f"Error finding window for PID {pid} (pywin32)")
+                            self.log_signal.emit(f"Error during window title fallback for PID {pid} window search: {e_gw_fallback}")
+                            self.status_bar.setText(f"Error finding window for PID {pid}")
                             traceback.print_exc()
                             return
                     else:
-                        # Core WindowByPid not available, AND (not on Windows OR pywin32 not available)
+                        # Core WindowByPid not available, AND not on Windows
                         self.log_signal.emit(f"Error: Cannot capture PID {pid}. Core WindowByPid not supported, and no suitable Python fallback available.")
                         self.status_bar.setText("Process capture: Core/fallback missing.")
                         return
@@ -705,9 +1172,9 @@ class LiveFeedScreen(QWidget):
                     return
             
             elif source == "Region":
-                if hasattr(nu_scaler_core, "PyCaptureTarget") and "Region" in nu_scaler_core.PyCaptureTarget.__members__ and hasattr(nu_scaler_core, "PyRegion"):
-                    capture_target_type = nu_scaler_core.PyCaptureTarget.Region
-                    capture_target_param = nu_scaler_core.PyRegion(x=100, y=100, width=800, height=600)
+                if _CORE_HAS_REGION:
+                    capture_target_type = _TARGET_REGION
+                    capture_target_param = _PyRegion(x=100, y=100, width=800, height=600)
                     print(f"[GUI] Using Region target: x={capture_target_param.x}, y={capture_target_param.y}, w={capture_target_param.width}, h={capture_target_param.height}")
                 else:
                     self.log_signal.emit("Error: Region capture not available/configured in nu_scaler_core.")
@@ -727,7 +1194,7 @@ class LiveFeedScreen(QWidget):
                 self.stop_capture(silent=True)
 
             print(f"[GUI] Initializing PyScreenCapture for target type: {capture_target_type}")
-            self.capture = nu_scaler_core.PyScreenCapture()
+            self.capture = _PyScreenCapture()
             
             print(f"[GUI] Calling self.capture.start(target_type={capture_target_type}, target_param={capture_target_param})")
             self.capture.start(capture_target_type, capture_target_param)
@@ -735,12 +1202,15 @@ class LiveFeedScreen(QWidget):
 
             self.upscaler_initialized = False
             self.upscaler = None 
-            self.timer.start() 
-            self.start_btn.setEnabled(False)
-            self.stop_btn.setEnabled(True)
-            self.source_box.setEnabled(False)
-            self.target_box.setEnabled(False)
-            self.refresh_targets_btn.setEnabled(False)
+            self._upscaler_cfg = None
+            self._last_submitted_frame = None
+            # Window captures (WGC) signal each new frame, so update_frame runs on arrival instead of polling.
+            # FullScreen frames come from scrap, which can only be polled.
+            self._poll_capture = capture_target_type == _TARGET_FULLSCREEN or not hasattr(self.capture, 'frame_signal')
+            if not self._poll_capture:
+                self._start_frame_waiter(self.capture.frame_signal())
+            self.timer.start()
+            self._set_capture_controls(True)
             self.status_bar.setText(f"Capture started ({source})")
             self.log_signal.emit(f"Capture started. Source: {source}, Target: {target_selection if capture_target_param else 'N/A'}")
             print("[GUI] Capture timer started.")
@@ -761,70 +1231,74 @@ class LiveFeedScreen(QWidget):
             self.log_signal.emit(error_message)
             self.status_bar.setText(f"Error starting capture")
             traceback.print_exc()
-            self.start_btn.setEnabled(True)
-            self.stop_btn.setEnabled(False)
-            self.source_box.setEnabled(True)
-            self.update_source_ui(self.source_box.currentText()) 
+            self._set_capture_controls(False)
+
+    def _set_capture_controls(self, capturing):
+        """Enable the capture controls for the new state as one batch: painting is suspended until all of
+        them (and the target list) are updated, so the panel is restyled and repainted once."""
+        self.setUpdatesEnabled(False)
+        try:
+            self.start_btn.setEnabled(not capturing)
+            self.stop_btn.setEnabled(capturing)
+            self.source_box.setEnabled(not capturing)
+            if capturing:
+                self.target_box.setEnabled(False)
+                self.refresh_targets_btn.setEnabled(False)
+            else:
+                # update_source_ui will correctly set enable state for target_box and refresh_targets_btn
+                # and also populate target_box if needed (e.g. for Window/Process)
+                self.update_source_ui(self.source_box.currentText())
+        finally:
+            self.setUpdatesEnabled(True)
 
     def stop_capture(self, silent=False):
-        print(f'[DEBUG] stop_capture: called (silent={silent})')
+        logger.debug("stop_capture: called (silent=%s)", silent)
         # Stop the frame processing timer first
         self.timer.stop()
-        print('[DEBUG] stop_capture: timer stopped')
+        self._stop_frame_waiter()
+        # Drop the frames kept for the duplicate/interpolation checks; they would otherwise pin a full
+        # capture in memory until the next session
+        self._last_submitted_frame = None
+        self.prev_frame_data = None
+        self._gpu_ms_ring = [] # The next session starts its FPS median from scratch
+        self._gpu_ms_idx = 0
+        self._status_str = None # The status bar is overwritten below, so the next session must set it again
+        self._text_updated_at = 0.0
+        self._oneshot_frames_remaining = 0
+        logger.debug("stop_capture: timer stopped")
 
         # Stop the capture object
         if self.capture:
             try:
                 self.capture.stop()
-                print('[DEBUG] stop_capture: capture.stop() called')
+                logger.debug("stop_capture: capture.stop() called")
             except Exception as e:
-                print(f'[DEBUG] stop_capture: error stopping capture object: {e}')
-                if hasattr(self, 'log_signal') and self.log_signal:
-                    self.log_signal.emit(f"Error stopping capture device: {e}")
+                logger.debug("stop_capture: error stopping capture object: %s", e)
+                self.log_signal.emit(f"Error stopping capture device: {e}")
             self.capture = None
         
-        # Clean up worker and thread
-        if hasattr(self, '_upscale_thread') and self._upscale_thread is not None:
-            if self._upscale_thread.isRunning():
-                print(f'[DEBUG] stop_capture: Quitting upscale thread (state: {self._upscale_thread.isRunning()})')
-                self._upscale_thread.quit()
-                if not self._upscale_thread.wait(2000): # Wait for 2 seconds
-                    print('[DEBUG] stop_capture: Warning - upscale thread did not quit in time.')
-                else:
-                    print('[DEBUG] stop_capture: Upscale thread quit and waited')
-            self._upscale_thread = None
-        
-        if hasattr(self, '_upscale_worker') and self._upscale_worker is not None:
-            # Worker should be managed by its thread's lifecycle (e.g., deleteLater)
-            # but explicitly setting to None here after thread is stopped.
-            self._upscale_worker = None
-            print('[DEBUG] stop_capture: Upscale worker cleared')
+        # The worker thread is kept for the next capture; it only drops this session's frames and upscaler
+        if self._upscale_worker is not None:
+            self._upscale_worker.reset()
 
         # Reset upscaler related attributes
         if self.upscaler:
-            print('[DEBUG] stop_capture: Clearing upscaler instance')
+            logger.debug("stop_capture: Clearing upscaler instance")
             # If upscaler has a specific release method, it should be called before/during del
             # e.g., if hasattr(self.upscaler, 'release'): self.upscaler.release()
             self.upscaler = None # Allow it to be garbage collected
         self.upscaler_initialized = False
 
         # Update UI elements
-        self.start_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-        self.source_box.setEnabled(True) 
-        
-        # update_source_ui will correctly set enable state for target_box and refresh_targets_btn
-        # and also populate target_box if needed (e.g. for Window/Process)
-        self.update_source_ui(self.source_box.currentText()) 
+        self._set_capture_controls(False)
 
         if not silent:
             self.status_bar.setText("Capture stopped")
-            if hasattr(self, 'log_signal') and self.log_signal:
-                self.log_signal.emit("Capture stopped")
+            self.log_signal.emit("Capture stopped")
         
         # Close dedicated fullscreen window if it's open and managed by LiveFeedScreen
-        if hasattr(self, 'fullscreen_display_window') and self.fullscreen_display_window and self.fullscreen_display_window.isVisible():
-            print('[DEBUG] stop_capture: Closing fullscreen display window.')
+        if self.fullscreen_display_window and self.fullscreen_display_window.isVisible():
+            logger.debug("stop_capture: Closing fullscreen display window.")
             self.fullscreen_display_window.close()
             # Optionally set to None if it's managed this way:
             # self.fullscreen_display_window = None 
@@ -832,15 +1306,14 @@ class LiveFeedScreen(QWidget):
         # Optional: Force garbage collection if memory issues were observed, though usually not necessary
         # import gc
         # gc.collect()
-        # print(f'[DEBUG] stop_capture: gc collected (if uncommented)')
 
-        print(f'[DEBUG] stop_capture: finished')
+        logger.debug("stop_capture: finished")
 
     def toggle_advanced_upscaling(self, state):
         try:
+            # No upscaler factory reads this flag, so the current upscaler stays valid; only the
+            # memory strategy control depends on it
             self.advanced_upscaling = bool(state)
-            self.upscaler = None
-            self.upscaler_initialized = False
             self.memory_strategy_box.setEnabled(self.advanced_upscaling)
         except Exception as e:
             print(f'[DEBUG] toggle_advanced_upscaling: {e}')
@@ -849,9 +1322,8 @@ class LiveFeedScreen(QWidget):
         try:
             if not self.upscaler or not hasattr(self.upscaler, 'set_memory_strategy'):
                 return
-            strategies = ["Auto", "Aggressive", "Balanced", "Conservative", "Minimal"]
-            if index >= 0 and index < len(strategies):
-                strategy = strategies[index].lower()
+            if 0 <= index < len(_MEMORY_STRATEGIES):
+                strategy = _MEMORY_STRATEGIES[index]
                 try:
                     self.upscaler.set_memory_strategy(strategy)
                     print(f"Memory strategy set to: {strategy}")
@@ -863,31 +1335,41 @@ class LiveFeedScreen(QWidget):
     def update_memory_stats(self):
         """Update GPU memory usage statistics"""
         try:
-            if self.upscaler and hasattr(self.upscaler, 'get_vram_stats'):
+            if not self.upscaler:
+                return
+            if hasattr(self.upscaler, 'get_vram_usage'):
+                self.vram_usage, self.total_vram = self.upscaler.get_vram_usage() # One call, plain tuple
+            elif hasattr(self.upscaler, 'get_vram_stats'):
                 stats = self.upscaler.get_vram_stats()
-                if stats:
-                    self.vram_usage = stats.used_mb
-                    self.total_vram = stats.total_mb
-                    percentage = stats.usage_percent
-                    
-                    # Update label
-                    self.memory_stats_label.setText(
-                        f"VRAM: {self.vram_usage:.1f} MB / {self.total_vram:.1f} MB ({percentage:.1f}%)"
-                    )
-                    
-                    # Set color based on usage
-                    if percentage > 90:
-                        self.memory_stats_label.setStyleSheet("color: red; font-weight: bold")
-                    elif percentage > 75:
-                        self.memory_stats_label.setStyleSheet("color: orange")
-                    else:
-                        self.memory_stats_label.setStyleSheet("color: green")
+                if not stats:
+                    return
+                self.vram_usage, self.total_vram = stats.used_mb, stats.total_mb
+            else:
+                return
+            percentage = self.vram_usage / self.total_vram * 100.0 if self.total_vram > 0 else 0.0
+
+            # Update label (the overlay reuses the cached string every frame)
+            vram_text = f"VRAM: {self.vram_usage:.1f} MB / {self.total_vram:.1f} MB ({percentage:.1f}%)"
+            if vram_text != self._vram_text:
+                self._vram_text = vram_text
+                self.memory_stats_label.setText(vram_text)
+
+            # Set color based on usage; restyling re-polishes the widget, so only do it when the band changes
+            bucket = 2 if percentage > 90 else 1 if percentage > 75 else 0
+            if bucket != self._vram_bucket:
+                self._vram_bucket = bucket
+                self.memory_stats_label.setStyleSheet(self.VRAM_STYLES[bucket])
         except Exception as e:
+            # A pipeline prebuild on the upscale worker borrows the upscaler exclusively (PyO3 raises
+            # RuntimeError "Already mutably borrowed"); the next poll picks the stats up again
+            if isinstance(e, RuntimeError) and "borrowed" in str(e):
+                logger.debug("update_memory_stats: upscaler busy, skipping this poll")
+                return
             print(f"Error updating memory stats: {e}")
     
     def init_upscaler(self, in_w, in_h, scale):
         """Create and initialize the appropriate upscaler based on settings."""
-        if not nu_scaler_core:
+        if not nu_scaler_core and _bilinear_numba is None:
             self.log_signal.emit("Error: nu_scaler_core not loaded.")
             return None
 
@@ -896,93 +1378,69 @@ class LiveFeedScreen(QWidget):
         out_w = int(in_w * scale)
         out_h = int(in_h * scale)
 
-        # Get selected quality and method
-        quality = self.quality_box.currentText()
-        method = self.method_box.currentText()
+        # Selected quality and method, as cached by _update_upscale_settings
+        _, method, quality = self._upscale_settings
 
         try:
-            if method == "DLSS":
-                if hasattr(nu_scaler_core, 'DlssUpscaler'):
-                    self.log_signal.emit(f"Creating DLSS Upscaler (Quality: {quality})")
-                    self.upscaler = nu_scaler_core.DlssUpscaler(quality)
-                    self.upscaler.initialize(in_w, in_h, out_w, out_h)
-                    self.advanced_upscaling = False
-                else:
-                    self.log_signal.emit("Error: DlssUpscaler not found in nu_scaler_core.")
-                    return None
-            elif method == "WGPU Nearest":
-                if hasattr(nu_scaler_core, 'PyWgpuUpscaler'):
-                    self.log_signal.emit(f"Creating WGPU Upscaler (nearest) (Quality: {quality})")
-                    self.upscaler = nu_scaler_core.PyWgpuUpscaler(quality, "nearest")
-                    self.upscaler.initialize(in_w, in_h, out_w, out_h)
-                else:
-                    self.log_signal.emit("Error: PyWgpuUpscaler not found in nu_scaler_core.")
-                    return None
-            elif method == "WGPU Bilinear":
-                if hasattr(nu_scaler_core, 'PyWgpuUpscaler'):
-                    self.log_signal.emit(f"Creating WGPU Upscaler (bilinear) (Quality: {quality})")
-                    self.upscaler = nu_scaler_core.PyWgpuUpscaler(quality, "bilinear")
-                    self.upscaler.initialize(in_w, in_h, out_w, out_h)
-                else:
-                    self.log_signal.emit("Error: PyWgpuUpscaler not found in nu_scaler_core.")
-                    return None
+            # Same method/quality: re-initialize the existing upscaler so its cached pipelines are reused
+            last_cfg = self._upscaler_cfg
+            if (self.upscaler is not None and last_cfg is not None and last_cfg[4:] == (method, quality)
+                    and hasattr(self.upscaler, 'get_or_build_pipeline')):
+                self.upscaler.initialize(in_w, in_h, out_w, out_h)
             else:
-                self.log_signal.emit(f"Error: Unknown upscaling method selected: {method}")
-                return None
+                factory = self._method_factories.get(method)
+                if factory is None:
+                    self.log_signal.emit(f"Error: Upscaling method not available: {method}")
+                    return None
+                self.upscaler = factory(quality)
+                self.upscaler.initialize(in_w, in_h, out_w, out_h)
 
             self.upscaler_initialized = True
             self.log_signal.emit(f"Upscaler '{self.upscaler.name}' initialized ({in_w}x{in_h} -> {out_w}x{out_h})")
-            self._last_in_w = in_w
-            self._last_in_h = in_h
-            self._last_scale = scale
-            self._last_quality = quality
-            self._last_method = method
+            self._upscaler_cfg = (in_w, in_h, out_w, out_h, method, quality)
             return self.upscaler
 
         except Exception as e:
-            error_msg = f"Error initializing upscaler ({method}, {quality}): {e}"
-            print(error_msg)
-            traceback.print_exc()
-            self.log_signal.emit(error_msg)
+            # update_frame retries the init on every frame, so the traceback is only formatted at debug level
+            error_msg = f"Error initializing upscaler ({method}, {quality}): {type(e).__name__}: {e}"
+            logger.debug(error_msg, exc_info=True)
+            if self._should_report_error("init", type(e).__name__, str(e)):
+                self.log_signal.emit(error_msg)
             self.upscaler = None
             self.upscaler_initialized = False
             return None
 
+    def _make_dlss_upscaler(self, quality):
+        self.log_signal.emit(f"Creating DLSS Upscaler (Quality: {quality})")
+        self.advanced_upscaling = False
+        return _DlssUpscaler(quality)
+
+    def _make_wgpu_upscaler(self, quality, algorithm):
+        self.log_signal.emit(f"Creating WGPU Upscaler ({algorithm}) (Quality: {quality})")
+        return _PyWgpuUpscaler(quality, algorithm)
+
+    def _make_cpu_bilinear_upscaler(self, quality):
+        self.log_signal.emit(f"Creating CPU Bilinear Upscaler (Numba: {_bilinear_numba.NUMBA_AVAILABLE})")
+        self.advanced_upscaling = False
+        return _bilinear_numba.CpuBilinearUpscaler(quality)
+
     def update_frame(self):
-        # print("[TRACE] update_frame called") # Optional: Uncomment for very verbose tracing
+        # Bound once per call: this runs for every captured frame
+        interpolator = self.interpolator
         try:
-            print("[TRACE] update_frame ENTERED try block") # Moved inside try
             if not self.capture:
-                print("[DEBUG] update_frame: No capture object, returning early.") # Added detail
+                logger.debug("update_frame: No capture object, returning early.")
                 return
             
-            print("[DEBUG] update_frame: Attempting self.capture.get_frame()...") # Added before call
             frame_result = self.capture.get_frame()
-            print(f"[DEBUG] update_frame: self.capture.get_frame() returned: {type(frame_result)}") # Added after call
 
             if frame_result is None:
-                # print("[TRACE] update_frame: get_frame() returned None, returning.") # Keep commented unless needed
                 return # No frame yet
-            
-            # This print is now redundant if the one above works
-            # print(f"[DEBUG] update_frame: Got frame_result.") 
 
-            # --- Base FPS Calculation START ---
-            now_for_base_fps = time.perf_counter()
-            if self.last_base_frame_time is None:
-                self.last_base_frame_time = now_for_base_fps
-            
-            self.base_frame_count_for_fps += 1
-            base_fps_elapsed = now_for_base_fps - self.last_base_frame_time
-            
-            if base_fps_elapsed >= 1.0: # Update base_fps roughly every second
-                self.base_fps = self.base_frame_count_for_fps / base_fps_elapsed
-                self.base_frame_count_for_fps = 0
-                self.last_base_frame_time = now_for_base_fps
-            # --- Base FPS Calculation END ---
+            self.base_frame_count_for_fps += 1 # Sampled into base_fps by _tick_1hz
 
             frame_bytes_obj, in_w, in_h = frame_result
-            print(f"[DEBUG] update_frame: Frame details - Size={in_w}x{in_h}, Bytes type={type(frame_bytes_obj)}") # DEBUG PRINT
+            logger.debug("update_frame: Frame details - Size=%sx%s", in_w, in_h)
             current_captured_frame_bytes = frame_bytes_obj # Keep original for prev_frame_data
 
             # --- Frame Interpolation Logic START ---
@@ -990,202 +1448,267 @@ class LiveFeedScreen(QWidget):
             interpolation_status_for_frame = "Captured (Interp Off)" # Default status
             interpolation_cpu_time_ms_for_frame = 0.0
 
-            if self.interpolation_enabled and self.interpolator:
-                if self.prev_frame_data:
+            if self.interpolation_enabled and interpolator:
+                prev = self.prev_frame_data
+                if prev is not None and prev[1] == in_w and prev[2] == in_h and prev[0] == current_captured_frame_bytes:
+                    # Duplicate capture (static desktop, paused game): interpolating between two identical frames
+                    # just reproduces the frame. Reusing the previous bytes object also lets the identical-frame
+                    # check before the upscale succeed on identity instead of comparing the pixels again.
+                    current_captured_frame_bytes = frame_to_process = prev[0]
+                    interpolation_status_for_frame = "Captured (Duplicate)"
+                elif prev:
                     prev_frame_bytes, prev_w, prev_h = self.prev_frame_data
                     if prev_w == in_w and prev_h == in_h:
                         try:
-                            interp_start_time = time.perf_counter()
-                            interpolated_frame_bytes = self.interpolator.interpolate_py(
+                            interp_start_time = _perf_counter()
+                            interpolated_frame_bytes = interpolator.interpolate_py(
                                 prev_frame_bytes, 
                                 current_captured_frame_bytes, 
                                 in_w, 
                                 in_h, 
                                 time_t=0.5
                             )
-                            interpolation_cpu_time_ms_for_frame = (time.perf_counter() - interp_start_time) * 1000
+                            interpolation_cpu_time_ms_for_frame = (_perf_counter() - interp_start_time) * 1000
                             if interpolated_frame_bytes:
                                 frame_to_process = interpolated_frame_bytes
                                 interpolation_status_for_frame = "Interpolated"
                             else:
                                 self.log_signal.emit("Frame Interpolation: Call returned None")
-                                print("[DEBUG] Frame interpolation: interpolate_py returned None")
+                                logger.debug("Frame interpolation: interpolate_py returned None")
                                 interpolation_status_for_frame = "Captured (Interp Failed)"
                         except Exception as e:
-                            error_msg = f"Frame Interpolation Error: {e}"
-                            print(f"[DEBUG] {error_msg}")
+                            error_msg = f"Frame Interpolation Error: {type(e).__name__}: {e}"
+                            logger.debug(error_msg, exc_info=True)
                             self.log_signal.emit(error_msg)
-                            traceback.print_exc()
                             interpolation_status_for_frame = "Captured (Interp Error)"
                             # Fallback to current_captured_frame_bytes (already set as frame_to_process)
                     else:
-                        print("[DEBUG] Frame interpolation skipped (dimension mismatch).")
+                        logger.debug("Frame interpolation skipped (dimension mismatch).")
                         self.log_signal.emit("Frame Interpolation: Skipped (dimension mismatch)")
                         interpolation_status_for_frame = "Captured (Interp Skipped - Dim Mismatch)"
                         self.prev_frame_data = None # Reset due to stream change
                 else:
                     interpolation_status_for_frame = "Captured (Interp Skipped - No Prev Frame)"
                     # self.log_signal.emit("Frame Interpolation: Skipped (no previous frame yet)") # Can be spammy
-            elif self.interpolator and not self.interpolation_enabled:
+            elif interpolator and not self.interpolation_enabled:
                  interpolation_status_for_frame = "Captured (Interp Off)"
-            elif not self.interpolator:
+            elif not interpolator:
                 interpolation_status_for_frame = "Captured (Interpolator N/A)"
             
             self.prev_frame_data = (current_captured_frame_bytes, in_w, in_h)
             # --- Frame Interpolation Logic END ---
-            print(f"[DEBUG] update_frame: Interpolation status for frame: {interpolation_status_for_frame}") # DEBUG PRINT
-
-            # Only re-initialize upscaler if input size or scale changes
-            scale = self.scale_slider.value() / 10.0
-            reinit_needed = False
-            print(f"[DEBUG] update_frame: Checking if upscaler re-init needed. Current state: Initialized={self.upscaler_initialized}, Upscaler Obj={self.upscaler is not None}") # DEBUG PRINT
-            if not self.upscaler or not self.upscaler_initialized:
-                print(f"[DEBUG] update_frame: Re-init needed - Upscaler not initialized or None.") # DEBUG PRINT
-                reinit_needed = True
-            elif (self._last_in_w != in_w or self._last_in_h != in_h):
-                print(f"[DEBUG] update_frame: Re-init needed - Input size changed ({self._last_in_w}x{self._last_in_h} -> {in_w}x{in_h})") # DEBUG PRINT
-                reinit_needed = True
-            elif (self._last_scale != scale):
-                print(f"[DEBUG] update_frame: Re-init needed - Scale changed ({self._last_scale} -> {scale})") # DEBUG PRINT
-                reinit_needed = True
-            # Add check for method/quality changes as well?
-            # elif (self._last_method != self.method_box.currentText()) or (self._last_quality != self.quality_box.currentText()): 
-            #     print(f"[DEBUG] update_frame: Re-init needed - Method/Quality changed")
-            #     reinit_needed = True
-            else:
-                 print(f"[DEBUG] update_frame: Re-init NOT needed.") # DEBUG PRINT
-
-            if reinit_needed:
-                self._last_in_w = in_w
-                self._last_in_h = in_h
-                self._last_scale = scale
-                # self._last_method = self.method_box.currentText()
-                # self._last_quality = self.quality_box.currentText()
-                print(f"[DEBUG] update_frame: Calling init_upscaler({in_w}, {in_h}, {scale})") # DEBUG PRINT
+            logger.debug("update_frame: Interpolation status for frame: %s", interpolation_status_for_frame)
+
+            # Only re-initialize the upscaler when the effective config actually changes
+            scale, method, quality = self._upscale_settings
+            out_w = int(in_w * scale)
+            out_h = int(in_h * scale)
+            cfg = (in_w, in_h, out_w, out_h, method, quality)
+            if not self.upscaler or not self.upscaler_initialized or cfg != self._upscaler_cfg:
+                logger.debug("update_frame: Re-init needed - config %s -> %s", self._upscaler_cfg, cfg)
+                if self._upscale_worker is not None:
+                    # The upscaler can't be re-initialized while the worker is using it
+                    self._upscale_worker.drain()
                 upscaler_instance = self.init_upscaler(in_w, in_h, scale)
-                print(f"[DEBUG] update_frame: init_upscaler returned: {type(upscaler_instance)}") # DEBUG PRINT
                 if not upscaler_instance:
-                    print(f"[DEBUG] update_frame: init_upscaler failed, returning.") # DEBUG PRINT
+                    logger.debug("update_frame: init_upscaler failed, returning.")
+                    self._upscaler_cfg = None
                     return # Stop if upscaler failed to init
-                else:
-                    print(f"[DEBUG] update_frame: init_upscaler succeeded.") # DEBUG PRINT
-
-            # Only start a new upscale if no worker is running
-            print(f"[DEBUG] update_frame: Checking existing upscale thread: {self._upscale_thread is not None}") # DEBUG PRINT
-            if self._upscale_thread is not None:
-                print("[DEBUG] update_frame: Skipping frame: upscale worker thread already exists and presumably running.") # DEBUG PRINT
+                self.upscale_scale = scale
+                self._last_submitted_frame = None
+            elif frame_to_process == self._last_submitted_frame:
+                # Static content (idle desktop, paused game): the upscale would reproduce the frame already shown.
+                # bytes equality is a memcmp that bails out at the first differing byte, so changing frames cost little.
+                logger.debug("update_frame: Frame unchanged, skipping upscale.")
                 return
+            self._last_submitted_frame = frame_to_process
 
-            # Calculate output dimensions (using self.upscale_scale which might differ from slider during transition)
-            current_scale = self.upscale_scale 
-            out_w = int(in_w * current_scale)
-            out_h = int(in_h * current_scale)
-            print(f"[DEBUG] update_frame: Preparing UpscaleWorker for {in_w}x{in_h} -> {out_w}x{out_h} (Scale: {current_scale})") # DEBUG PRINT
-
-            # Start worker thread for upscaling
-            self._upscale_thread = QThread()
-            self._upscale_worker = UpscaleWorker(self.upscaler, frame_to_process, in_w, in_h, out_w, out_h, current_scale, interpolation_status_for_frame, interpolation_cpu_time_ms_for_frame)
-            self._upscale_worker.moveToThread(self._upscale_thread)
-            self._upscale_thread.started.connect(self._upscale_worker.run)
-            self._upscale_worker.finished.connect(self.on_upscale_finished)
-            self._upscale_worker.error.connect(self.on_upscale_error)
-            self._upscale_worker.finished.connect(self._upscale_thread.quit)
-            self._upscale_worker.finished.connect(self._upscale_worker.deleteLater)
-            self._upscale_thread.finished.connect(self._upscale_thread.deleteLater)
-            self._upscale_thread.finished.connect(self._clear_upscale_thread)
-            print(f"[DEBUG] update_frame: Starting upscale thread...") # DEBUG PRINT
-            self._upscale_thread.start()
-            print(f"[DEBUG] update_frame: Upscale thread started.") # DEBUG PRINT
+            # Output dimensions come from the config the upscaler was initialized with; the input size travels
+            # with the frame so the overlay doesn't have to derive it back from the output size
+            logger.debug("update_frame: Submitting frame for %sx%s -> %sx%s (Scale: %s)", in_w, in_h, out_w, out_h, self.upscale_scale)
+            self._ensure_upscale_worker()
+            self._upscale_worker.submit(self.upscaler, frame_to_process, in_w, in_h, out_w, out_h, interpolation_status_for_frame, interpolation_cpu_time_ms_for_frame)
         except Exception as e:
-            # Enhanced exception printing
-            print(f"[EXCEPTION] An error occurred within update_frame loop:")
-            print(f"[EXCEPTION] Type: {type(e).__name__}")
-            print(f"[EXCEPTION] Error: {e}")
-            print(f"[EXCEPTION] Traceback:")
-            import traceback
-            traceback.print_exc() # Print full traceback to console
-            # Optionally, emit to log signal as well
-            if hasattr(self, 'log_signal') and self.log_signal:
-                self.log_signal.emit(f"Error in update_frame: {e}")
+            # A failing frame usually fails again on the next tick: emit a one-line summary and only walk and
+            # format the traceback when debug logging is enabled
+            logger.debug("update_frame: exception", exc_info=True)
+            if self._should_report_error("update_frame", type(e).__name__, str(e)):
+                self.log_signal.emit(f"Error in update_frame: {type(e).__name__}: {e}")
             # Decide if we should stop capture on error, or just log and continue?
             # self.stop_capture() # Uncomment to stop capture automatically on update_frame error
 
-    def _clear_upscale_thread(self):
+    def idle_upscaler(self):
+        """Return the live upscaler (or None) with the upscale worker drained, for reconfiguring it from the GUI thread.
+        The core releases the GIL during a frame while still borrowing the upscaler, so a mutating call
+        (reload_shader, set_thread_count, ...) made mid-frame fails with "Already borrowed". Frames are only
+        submitted from the GUI thread, so the worker stays idle until the caller returns to the event loop."""
+        if self.upscaler is not None and self._upscale_worker is not None:
+            self._upscale_worker.drain()
+            self._last_submitted_frame = None # The dropped frame must not make the next identical one look shown
+        return self.upscaler
+
+    def _ensure_upscale_worker(self):
+        """Start the persistent upscale worker thread on first use. It is only stopped in closeEvent."""
+        if self._upscale_worker is not None:
+            return
+        self._upscale_thread = QThread()
+        self._upscale_worker = UpscaleWorker()
+        self._upscale_worker.moveToThread(self._upscale_thread)
+        self._upscale_thread.started.connect(self._upscale_worker.run)
+        self._upscale_worker.error.connect(self.on_upscale_error)
+        self._upscale_worker.prebuilt.connect(self._on_pipeline_prebuilt)
+        self._upscale_thread.start()
+
+    def _stop_upscale_worker(self):
+        if self._upscale_worker is None:
+            return
+        self._upscale_worker.stop()
+        self._upscale_thread.quit()
+        if not self._upscale_thread.wait(2000): # Wait for 2 seconds
+            print('[DEBUG] Warning - upscale thread did not quit in time.')
         self._upscale_thread = None
         self._upscale_worker = None
 
-    def on_upscale_finished(self, out_bytes, out_w, out_h, upscale_gpu_time_ms, interpolation_status, interpolation_cpu_time_ms):
+    def _start_frame_waiter(self, frame_signal):
+        self._frame_thread = QThread()
+        self._frame_waiter = FrameWaiter(frame_signal)
+        self._frame_waiter.moveToThread(self._frame_thread)
+        self._frame_thread.started.connect(self._frame_waiter.run)
+        self._frame_waiter.frame_ready.connect(self._on_frame_ready)
+        self._frame_thread.start()
+
+    def _stop_frame_waiter(self):
+        if self._frame_waiter is None:
+            return
+        self._frame_waiter.stop()
+        self._frame_thread.quit()
+        if not self._frame_thread.wait(2000):
+            print('[DEBUG] stop_capture: Warning - frame waiter thread did not quit in time.')
+        self._frame_thread = None
+        self._frame_waiter = None
+
+    @Slot()
+    def _on_frame_ready(self):
+        if self._frame_waiter is None:
+            return # Queued before the capture was stopped
+        self._frame_waiter.pending = False
+        self.update_frame()
+
+    @staticmethod
+    def _display_interval_ms():
+        """Frame interval in ms matching the primary screen's refresh rate (60 Hz if unknown)."""
+        screen = QApplication.primaryScreen()
+        refresh = screen.refreshRate() if screen else 0
+        return max(1, round(1000.0 / (refresh if refresh > 0 else 60.0)))
+
+    def _on_display_tick(self):
+        if self._poll_capture:
+            self.update_frame()
+        self._present_pending_result()
+
+    def _present_pending_result(self):
+        if self._upscale_worker is None:
+            return
+        result = self._upscale_worker.take_result()
+        if result is None:
+            return
+        self._present_upscaled_frame(*result)
+
+    def _present_upscaled_frame(self, image, in_w, in_h, out_w, out_h, upscale_gpu_time_ms, interpolation_status, interpolation_cpu_time_ms):
         # Note: `elapsed` from worker is already in ms, renamed to upscale_gpu_time_ms
-        # print(f'[DEBUG] on_upscale_finished: {id(self)}')
-        # print(f"[DEBUG] Upscale finished in {upscale_gpu_time_ms:.2f} ms at {time.strftime('%H:%M:%S')}")
-        # print(f"[DEBUG] Interpolation status: {interpolation_status}, CPU time: {interpolation_cpu_time_ms:.2f} ms")
-        if out_bytes:
+        if image is not None and not image.isNull():
+            interpolating = self.interpolation_enabled and self.interpolator is not None
             try:
-                qimg = QImage(out_bytes, out_w, out_h, QImage.Format_RGBA8888)
-                pixmap = QPixmap.fromImage(qimg)
-                self.output_preview.set_pixmap(pixmap)
-                
-                # Scaled FPS calculation (based on upscaler output rate)
-                inst_scaled_fps = 1000.0 / upscale_gpu_time_ms if upscale_gpu_time_ms > 0 else 0.0
-                self.fps = 0.95 * self.fps + 0.05 * inst_scaled_fps if self.fps > 0 else inst_scaled_fps
-                
-                vram_str = self.memory_stats_label.text()
-                
-                overlay_lines = [
-                    f"Base Frame: {out_w//self.upscale_scale:.0f}×{out_h//self.upscale_scale:.0f}",
-                    f"Scaled Frame: {out_w}×{out_h}",
-                    f"Base FPS: {self.base_fps:.1f}",       # Display calculated base FPS
-                    f"Scaled FPS: {self.fps:.1f}",     # This is the existing self.fps
-                    f"{vram_str}",
-                    f"Upscale GPU Time: {upscale_gpu_time_ms:.1f} ms"
-                ]
-
-                if self.interpolation_enabled and self.interpolator:
-                    overlay_lines.append(f"Frame Source: {interpolation_status}")
-                    if interpolation_status == "Interpolated" and interpolation_cpu_time_ms > 0:
-                        overlay_lines.append(f"Interp CPU Time: {interpolation_cpu_time_ms:.1f} ms")
+                # Frames go only to the surface currently showing output: while the fullscreen or corner window
+                # is up, the embedded preview keeps its placeholder instead of painting every frame a second time
+                if self.display_mode == "fullscreen" and self.fullscreen_display_window and self.fullscreen_display_window.isVisible():
+                    display = self.fullscreen_display_window
+                elif self.display_mode == "corner" and self.corner_overlay_window and self.corner_overlay_window.isVisible():
+                    display = self.corner_overlay_window
                 else:
-                    overlay_lines.append("Frame Source: Captured (Interp Off)") # Or use interpolation_status if more detailed
-
-                overlay = "\n".join(overlay_lines)
-                self.output_preview.set_overlay(overlay)
-                
-                status_bar_text = (
-                    f"Base: {out_w//self.upscale_scale:.0f}×{out_h//self.upscale_scale:.0f} @ {self.base_fps:.1f}FPS | "
-                    f"Scaled: {out_w}×{out_h} @ {self.fps:.1f}FPS ({upscale_gpu_time_ms:.1f}ms GPU)"
-                )
-                if self.interpolation_enabled and self.interpolator and interpolation_status == "Interpolated" and interpolation_cpu_time_ms > 0:
-                    status_bar_text += f" | Interp CPU: {interpolation_cpu_time_ms:.1f}ms ({interpolation_status})"
-                elif self.interpolation_enabled and self.interpolator:
-                    status_bar_text += f" | Interp: {interpolation_status}" 
-
-                self.status_bar.setText(status_bar_text)
-                self.profiler_signal.emit(upscale_gpu_time_ms, self.fps, out_w//self.upscale_scale, out_h//self.upscale_scale)
+                    display = self.output_preview
+                # GLPreview uploads the QImage as a texture directly; the QLabel fallback converts it to a pixmap
+                display.set_image(image)
+
+                # Single-frame capture: stop once the frame is on screen. Deferred so this paint tick finishes first.
+                if self._oneshot_frames_remaining:
+                    self._oneshot_frames_remaining -= 1
+                    if self._oneshot_frames_remaining == 0:
+                        QTimer.singleShot(0, self.stop_capture)
+
+                # Scaled FPS calculation (based on upscaler output rate). The median of the recent upscale times
+                # ignores one-off spikes (GC pause, pipeline rebuild) that would drag an average down.
+                if upscale_gpu_time_ms > 0:
+                    ring = self._gpu_ms_ring
+                    if len(ring) < self.FPS_WINDOW:
+                        ring.append(upscale_gpu_time_ms)
+                    else:
+                        ring[self._gpu_ms_idx] = upscale_gpu_time_ms
+                        self._gpu_ms_idx = (self._gpu_ms_idx + 1) % self.FPS_WINDOW
+                    self.fps = 1000.0 / sorted(ring)[len(ring) // 2]
                 
-                self.last_frame_time = time.perf_counter()
+                now = _perf_counter()
+                self.last_frame_time = now
+
+                # The stats text changes far more slowly than it is readable, so it is only rebuilt every
+                # TEXT_UPDATE_INTERVAL_S and only pushed to the widgets when it actually changed.
+                # The profiler readout shares that rate; self.fps is already a median over recent frames.
+                if now - self._text_updated_at >= self.TEXT_UPDATE_INTERVAL_S:
+                    self._text_updated_at = now
+                    self.profiler_signal.emit(upscale_gpu_time_ms, self.fps, in_w, in_h)
+                    # Shared by the overlay and the status bar
+                    show_interp_time = (interpolating and interpolation_status == "Interpolated"
+                                        and interpolation_cpu_time_ms > 0)
+                    overlay = _OVERLAY_TMPL.format(
+                        in_w, in_h, out_w, out_h, self.base_fps, self.fps, self._vram_text, upscale_gpu_time_ms
+                    )
+                    if not interpolating:
+                        overlay += "Frame Source: Captured (Interp Off)" # Or use interpolation_status if more detailed
+                    elif show_interp_time:
+                        overlay += f"Frame Source: {interpolation_status}\nInterp CPU Time: {interpolation_cpu_time_ms:.1f} ms"
+                    else:
+                        overlay += f"Frame Source: {interpolation_status}"
+                    self._overlay_str = overlay
 
-                # Update display windows based on current mode
-                if self.display_mode == "fullscreen" and self.fullscreen_display_window and self.fullscreen_display_window.isVisible():
-                    self.fullscreen_display_window.set_pixmap(pixmap)
-                    self.fullscreen_display_window.set_overlay(overlay)
-                elif self.display_mode == "corner" and self.corner_overlay_window and self.corner_overlay_window.isVisible():
-                    self.corner_overlay_window.set_pixmap(pixmap)
-                    self.corner_overlay_window.set_overlay(overlay)
+                    status_bar_text = _STATUS_TMPL.format(
+                        in_w, in_h, self.base_fps, out_w, out_h, self.fps, upscale_gpu_time_ms
+                    )
+                    if show_interp_time:
+                        status_bar_text += f" | Interp CPU: {interpolation_cpu_time_ms:.1f}ms ({interpolation_status})"
+                    elif interpolating:
+                        status_bar_text += f" | Interp: {interpolation_status}"
+
+                    if status_bar_text != self._status_str:
+                        self._status_str = status_bar_text
+                        self.status_bar.setText(status_bar_text)
+                # No-op unless the text changed or the display surface just switched
+                display.set_overlay(self._overlay_str)
 
             except Exception as e:
-                print(f"[ERROR] Failed to update output preview: {e}")
+                if self._should_report_error("present", type(e).__name__, str(e)):
+                    print(f"[ERROR] Failed to update output preview: {e}")
         # The timer will continue to fire at the set interval
 
     def on_upscale_error(self, error_msg):
-        print(f'[DEBUG] on_upscale_error: {id(self)}')
-        import traceback
-        print(f"[GUI] Error in upscaling: {error_msg}")
+        # The exception was raised on the worker thread, so there is no traceback to print here
+        if self._should_report_error("upscale", error_msg):
+            print(f"[GUI] Error in upscaling: {error_msg}")
         self.status_bar.setText(f"Error: {str(error_msg)}")
         self.upscaler = None
         self.upscaler_initialized = False
-        traceback.print_exc()
         # The timer will continue to fire at the set interval
 
+    def _should_report_error(self, where, *detail):
+        """Whether a per-frame error should be printed/logged. A failure that recurs every frame is reported
+        when it first appears and then at most once per ERROR_REPEAT_S, instead of flooding the console."""
+        sig = (where,) + tuple(str(d)[:80] for d in detail)
+        now = _perf_counter()
+        if sig == self._last_err_sig and now - self._last_err_at < self.ERROR_REPEAT_S:
+            return False
+        self._last_err_sig = sig
+        self._last_err_at = now
+        return True
+
     def toggle_start_stop(self):
         """Toggle start/stop capture via hotkey."""
         if self.start_btn.isEnabled():
@@ -1215,7 +1738,35 @@ class LiveFeedScreen(QWidget):
                 mode = "corner"
             else:  # "corner"
                 mode = "embedded"
-        
+
+        # Already showing this mode: re-running the switch would only hide/show the window again and push the
+        # same pixmaps through every surface. A window closed behind our back (stop_capture) is re-entered.
+        if mode == current_mode:
+            window = {"fullscreen": self.fullscreen_display_window, "corner": self.corner_overlay_window}.get(mode)
+            if mode == "embedded" or (window is not None and window.isVisible()):
+                return
+
+        # Create the target window up front so it can be batched with the others
+        if mode == "fullscreen" and not self.fullscreen_display_window:
+            self.fullscreen_display_window = FullScreenDisplayWindow()
+        elif mode == "corner" and not self.corner_overlay_window:
+            self.corner_overlay_window = CornerOverlayWindow()
+
+        # Suspend painting on every involved surface while the mode is switched, so each one repaints
+        # once when updates are re-enabled instead of after every hide/set_pixmap/set_overlay call
+        surfaces = [w for w in (self, self.fullscreen_display_window, self.corner_overlay_window) if w is not None]
+        for w in surfaces:
+            w.setUpdatesEnabled(False)
+        try:
+            self._switch_display_mode(current_mode, mode)
+        finally:
+            for w in surfaces:
+                w.setUpdatesEnabled(True)
+
+        print(f"[LiveFeedScreen] Display mode changed to: {mode}")
+        self.log_signal.emit(f"Display mode: {mode}")
+
+    def _switch_display_mode(self, current_mode, mode):
         # Exit current mode
         if current_mode == "fullscreen" and self.fullscreen_display_window and self.fullscreen_display_window.isVisible():
             self.fullscreen_display_window.hide()
@@ -1224,8 +1775,7 @@ class LiveFeedScreen(QWidget):
                 self.output_preview.set_overlay(self.fullscreen_display_window.get_current_overlay_text())
             if self.fullscreen_display_window.get_current_pixmap():
                 self.output_preview.set_pixmap(self.fullscreen_display_window.get_current_pixmap())
-            if hasattr(self.output_preview, '_original_text_when_fullscreen'):
-                del self.output_preview._original_text_when_fullscreen
+            self.output_preview._original_text_when_fullscreen = None
                 
         elif current_mode == "corner" and self.corner_overlay_window and self.corner_overlay_window.isVisible():
             self.corner_overlay_window.hide()
@@ -1234,8 +1784,7 @@ class LiveFeedScreen(QWidget):
                 self.output_preview.set_overlay(self.corner_overlay_window.get_current_overlay_text())
             if self.corner_overlay_window.get_current_pixmap():
                 self.output_preview.set_pixmap(self.corner_overlay_window.get_current_pixmap())
-            if hasattr(self.output_preview, '_original_text_when_corner'):
-                del self.output_preview._original_text_when_corner
+            self.output_preview._original_text_when_corner = None
         
         # Enter new mode
         self.display_mode = mode
@@ -1250,60 +1799,49 @@ class LiveFeedScreen(QWidget):
             
         elif mode == "fullscreen":
             self.display_btn.setText("Corner Mode")
-            
-            if not self.fullscreen_display_window:
-                self.fullscreen_display_window = FullScreenDisplayWindow()
-                
+
             # Get current content from embedded preview
-            current_pixmap = self.output_preview._pixmap
+            current_pixmap = self.output_preview.current_pixmap()
             current_overlay_text = self.output_preview._overlay_text
             
             if current_pixmap and not current_pixmap.isNull():
                 self.fullscreen_display_window.set_pixmap(current_pixmap)
             else:
-                self.fullscreen_display_window.set_pixmap(QPixmap())
+                self.fullscreen_display_window.set_pixmap(self._empty_pixmap)
                 
             self.fullscreen_display_window.set_overlay(current_overlay_text)
             self.fullscreen_display_window.showFullScreen()
             
             # Change embedded preview appearance
             self.output_preview._original_text_when_fullscreen = current_overlay_text
-            self.output_preview.set_pixmap(QPixmap())
+            self.output_preview.set_pixmap(self._empty_pixmap)
             self.output_preview.set_overlay("Output in fullscreen mode\n(Press Esc to exit)")
             
         elif mode == "corner":
             self.display_btn.setText("Embedded Mode")
-            
-            if not self.corner_overlay_window:
-                self.corner_overlay_window = CornerOverlayWindow()
-                
+
             # Get current content from embedded preview
-            current_pixmap = self.output_preview._pixmap
+            current_pixmap = self.output_preview.current_pixmap()
             current_overlay_text = self.output_preview._overlay_text
             
             if current_pixmap and not current_pixmap.isNull():
                 self.corner_overlay_window.set_pixmap(current_pixmap)
             else:
-                self.corner_overlay_window.set_pixmap(QPixmap())
+                self.corner_overlay_window.set_pixmap(self._empty_pixmap)
                 
             self.corner_overlay_window.set_overlay(current_overlay_text)
             self.corner_overlay_window.show()
             
             # Change embedded preview appearance
             self.output_preview._original_text_when_corner = current_overlay_text
-            self.output_preview.set_pixmap(QPixmap())
+            self.output_preview.set_pixmap(self._empty_pixmap)
             self.output_preview.set_overlay("Output in corner overlay mode\n(Press Esc to exit)")
-            
-        print(f"[LiveFeedScreen] Display mode changed to: {mode}")
-        if hasattr(self, 'log_signal') and self.log_signal is not None:
-            self.log_signal.emit(f"Display mode: {mode}")
-            
+
     def toggle_interpolation(self, checked):
         self.interpolation_enabled = checked
         self.prev_frame_data = None # Reset on toggle to ensure clean start
-        if hasattr(self, 'log_signal') and self.log_signal is not None:
-            status = "Enabled" if checked else "Disabled"
-            self.log_signal.emit(f"Frame Interpolation: {status}")
+        status = "Enabled" if checked else "Disabled"
+        self.log_signal.emit(f"Frame Interpolation: {status}")
         print(f"[LiveFeedScreen] Frame interpolation {status}")
 
 class SettingsScreen(QWidget):
@@ -1415,7 +1953,10 @@ class SettingsScreen(QWidget):
         # Example: trigger a single frame capture in LiveFeedScreen
         if self.live_feed_screen:
             self.live_feed_screen.start_capture()
-            self.live_feed_screen.timer.singleShot(100, self.live_feed_screen.stop_capture)
+            # Stop after the first upscaled frame is presented rather than after a fixed 100 ms, which could end
+            # the capture before a frame got through (or keep it running for several)
+            if self.live_feed_screen.capture is not None:
+                self.live_feed_screen._oneshot_frames_remaining = 1
 
     def refresh_devices(self):
         if self.live_feed_screen:
@@ -1427,7 +1968,6 @@ class SettingsScreen(QWidget):
 
     def pause_pipeline(self):
         # Placeholder: implement pause/resume logic
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.information(self, "Pause/Resume", "Pause/Resume not yet implemented.")
 
     def stop_pipeline(self):
@@ -1438,6 +1978,9 @@ class SettingsScreen(QWidget):
         self.scale_label.setText(f"{self.scale_slider.value()/10.0:.1f}×")
 
 class DebugScreen(QWidget):
+    LOG_LINES = 500 # Lines kept in log_view
+    LOG_FLUSH_MS = 250 # Log messages are batched and shown at most this often
+
     def __init__(self):
         super().__init__()
         layout = QVBoxLayout(self)
@@ -1445,9 +1988,11 @@ class DebugScreen(QWidget):
         self.log_group.setCheckable(True)
         self.log_group.setChecked(True)
         log_layout = QVBoxLayout(self.log_group)
-        self.log_view = QLabel("[Logs will appear here]")
+        # QPlainTextEdit appends and lays out only the new lines, and drops the oldest past LOG_LINES
+        self.log_view = QPlainTextEdit("[Logs will appear here]")
+        self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(self.LOG_LINES)
         self.log_view.setStyleSheet("background: #222; color: #f88; font-family: monospace; padding: 8px;")
-        self.log_view.setWordWrap(True)
         log_layout.addWidget(self.log_view)
         self.profiler_group = QGroupBox("Profiler")
         profiler_layout = QVBoxLayout(self.profiler_group)
@@ -1461,13 +2006,26 @@ class DebugScreen(QWidget):
         layout.addWidget(self.profiler_group)
         layout.addWidget(self.warning_label)
         layout.addStretch()
+        # log_signal can fire every frame (e.g. a recurring error), so messages are collected and appended
+        # in one batch per flush
+        self._log_pending = deque(maxlen=self.LOG_LINES) # Older unflushed lines would be trimmed from the view anyway
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(self.LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
     def append_log(self, msg):
-        prev = self.log_view.text()
-        self.log_view.setText(prev + "\n" + msg)
-        print(f"[GUI LOG] {msg}")
+        self._log_pending.append(msg)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    def _flush_log(self):
+        self.log_view.appendPlainText("\n".join(self._log_pending))
+        # Console copy goes through the module logger (silent unless DEBUG logging is configured), so a
+        # recurring error no longer writes to stdout on every flush
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n".join(f"[GUI LOG] {msg}" for msg in self._log_pending))
+        self._log_pending.clear()
     def update_profiler(self, frame_time, fps, in_w, in_h):
         self.profiler_label.setText(f"Frame: {frame_time:.1f} ms | FPS: {fps:.1f} | Input: {in_w}×{in_h}")
-        print(f"[PROFILER] Frame: {frame_time:.1f} ms | FPS: {fps:.1f} | Input: {in_w}×{in_h}")
     def show_warning(self, msg, show):
         self.warning_label.setText(msg)
         self.warning_label.setVisible(show)
@@ -1475,9 +2033,20 @@ class DebugScreen(QWidget):
             print(f"[GUI WARNING] {msg}")
 
 class AdvancedScreen(QWidget):
+    CONFIG_APPLY_MS = 250 # Spinbox/combo changes are collected this long before reaching the upscaler
+
     def __init__(self, live_feed_screen=None):
         super().__init__()
         self.live_feed_screen = live_feed_screen
+        # Holding a spinbox arrow steps it many times a second, and each setter reconfigures the backend,
+        # so changes are queued per setter and applied together once the value settles
+        self._pending_cfg = {} # setter name -> (dialog title, value)
+        self._applied_cfg = {} # setter name -> value last applied to _applied_upscaler
+        self._applied_upscaler = None
+        self._cfg_timer = QTimer(self)
+        self._cfg_timer.setSingleShot(True)
+        self._cfg_timer.setInterval(self.CONFIG_APPLY_MS)
+        self._cfg_timer.timeout.connect(self._apply_pending_cfg)
         layout = QVBoxLayout(self)
         shader_group = QGroupBox("Shader & Engine")
         shader_form = QFormLayout(shader_group)
@@ -1515,8 +2084,9 @@ class AdvancedScreen(QWidget):
         layout.addWidget(memory_group)
         layout.addStretch()
     def get_upscaler(self):
-        if self.live_feed_screen and self.live_feed_screen.upscaler:
-            return self.live_feed_screen.upscaler
+        # Callers reconfigure the upscaler, so the worker is drained first (see LiveFeedScreen.idle_upscaler)
+        if self.live_feed_screen:
+            return self.live_feed_screen.idle_upscaler()
         return None
     def reload_shader_backend(self):
         upscaler = self.get_upscaler()
@@ -1526,39 +2096,46 @@ class AdvancedScreen(QWidget):
             try:
                 upscaler.reload_shader(path)
             except Exception as e:
-                from PySide6.QtWidgets import QMessageBox
                 QMessageBox.warning(self, "Reload Shader", f"Error: {e}")
         else:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Reload Shader", "No upscaler instance available.")
     def update_threads(self, val):
-        upscaler = self.get_upscaler()
-        if upscaler:
-            try:
-                upscaler.set_thread_count(val)
-            except Exception as e:
-                from PySide6.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "Thread Count", f"Error: {e}")
+        self._queue_cfg("set_thread_count", "Thread Count", val)
     def update_buffer_pool(self, val):
-        upscaler = self.get_upscaler()
-        if upscaler:
-            try:
-                upscaler.set_buffer_pool_size(val)
-            except Exception as e:
-                from PySide6.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "Buffer Pool", f"Error: {e}")
+        self._queue_cfg("set_buffer_pool_size", "Buffer Pool", val)
     def update_gpu_allocator(self, val):
+        self._queue_cfg("set_gpu_allocator", "GPU Allocator", val)
+    def _queue_cfg(self, setter, title, val):
+        self._pending_cfg[setter] = (title, val)
+        self._cfg_timer.start() # Restarted by every change
+    def _apply_pending_cfg(self):
+        pending, self._pending_cfg = self._pending_cfg, {}
         upscaler = self.get_upscaler()
-        if upscaler:
+        if not upscaler:
+            return
+        if upscaler is not self._applied_upscaler: # New upscaler instance: nothing has been applied to it yet
+            self._applied_upscaler = upscaler
+            self._applied_cfg = {}
+        for setter, (title, val) in pending.items():
+            if self._applied_cfg.get(setter) == val: # Stepped away and back before the timer fired
+                continue
             try:
-                upscaler.set_gpu_allocator(val)
+                getattr(upscaler, setter)(val)
+                self._applied_cfg[setter] = val
             except Exception as e:
-                from PySide6.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "GPU Allocator", f"Error: {e}")
+                QMessageBox.warning(self, title, f"Error: {e}")
 
 class UIAccessibilityScreen(QWidget):
+    THEME_STYLESHEETS = {
+        "Dark": "QMainWindow { background: #181818; } QLabel { color: #ccc; }",
+        "Light": "QMainWindow { background: #f8f8f8; } QLabel { color: #222; }",
+    }
+    FONT_APPLY_MS = 50 # Debounce for font-scale slider drags; every app stylesheet change re-polishes all widgets
+
     def __init__(self):
         super().__init__()
+        self._base_stylesheet = "" # Stylesheet of the selected theme, without the font-size rule
+        self._font_px = None # Font size picked on the slider, None until it is moved
         layout = QVBoxLayout(self)
         theme_group = QGroupBox("Theme & Appearance")
         theme_form = QFormLayout(theme_group)
@@ -1571,6 +2148,10 @@ class UIAccessibilityScreen(QWidget):
         self.font_label = QLabel("14pt")
         self.font_scale.valueChanged.connect(lambda: self.font_label.setText(f"{self.font_scale.value()}pt"))
         self.font_scale.valueChanged.connect(self.apply_font_scale)
+        self._font_apply_timer = QTimer(self)
+        self._font_apply_timer.setSingleShot(True)
+        self._font_apply_timer.setInterval(self.FONT_APPLY_MS)
+        self._font_apply_timer.timeout.connect(self._apply_stylesheet)
         theme_form.addRow("Theme:", self.theme_select)
         theme_form.addRow("Font Scale:", self.font_scale)
         theme_form.addRow("", self.font_label)
@@ -1592,70 +2173,77 @@ class UIAccessibilityScreen(QWidget):
         layout.addStretch()
     def apply_theme(self, theme):
         # Apply theme globally
-        if theme == "Dark":
-            QApplication.instance().setStyleSheet("QMainWindow { background: #181818; } QLabel { color: #ccc; }")
-        elif theme == "Light":
-            QApplication.instance().setStyleSheet("QMainWindow { background: #f8f8f8; } QLabel { color: #222; }")
-        else:
-            QApplication.instance().setStyleSheet("")
+        self._base_stylesheet = self.THEME_STYLESHEETS.get(theme, "")
+        self._apply_stylesheet()
     def apply_font_scale(self, val):
-        QApplication.instance().setStyleSheet(QApplication.instance().styleSheet() + f" QLabel {{ font-size: {val}px; }}")
+        # Restarted on every slider step, so a drag sets the stylesheet once after it settles
+        self._font_px = val
+        self._font_apply_timer.start()
+    def _apply_stylesheet(self):
+        # The app stylesheet is always rebuilt from the theme and the current font size instead of appended to
+        sheet = self._base_stylesheet
+        if self._font_px is not None:
+            sheet += f" QLabel {{ font-size: {self._font_px}px; }}"
+        QApplication.instance().setStyleSheet(sheet)
     def save_config(self):
         # Placeholder: save config to file
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.information(self, "Save Config", "Config save not yet implemented.")
     def load_config(self):
         # Placeholder: load config from file
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.information(self, "Load Config", "Config load not yet implemented.")
 
-class BenchmarkWorker(QObject):
+class _BenchmarkSignals(QObject):
     progress = Signal(int)
     finished = Signal(list)
     error = Signal(str)
-    
-    def __init__(self, config):
+
+class BenchmarkWorker(QRunnable):
+    """Runs a single or comparison benchmark on the QThreadPool instead of a dedicated QThread per run.
+    The core benchmark functions release the GIL, so the GUI keeps running while they measure."""
+    def __init__(self, config, comparison=False):
         super().__init__()
         self.config = config
-    
+        self.comparison = comparison
+        self.signals = _BenchmarkSignals()
+
+    def run(self):
+        if self.comparison:
+            self.run_comparison()
+        else:
+            self.run_single_benchmark()
+
     def run_single_benchmark(self):
         try:
+            cfg = self.config
             result = run_benchmark(
-                technology=self.config['technology'],
-                quality=self.config['quality'],
-                input_width=self.config['input_width'],
-                input_height=self.config['input_height'],
-                scale_factor=self.config['scale_factor'],
-                frame_count=self.config['frame_count']
+                cfg['technology'], cfg['quality'], cfg['input_width'],
+                cfg['input_height'], cfg['scale_factor'], cfg['frame_count'],
             )
-            self.finished.emit([result] if result else [])
+            self.signals.finished.emit([result] if result else [])
         except Exception as e:
             traceback.print_exc()
-            self.error.emit(f"Benchmark error: {str(e)}")
+            self.signals.error.emit(f"Benchmark error: {str(e)}")
     
     def run_comparison(self):
         try:
             # Emit progress updates as we go
-            self.progress.emit(10)  # Started
+            self.signals.progress.emit(10)  # Started
             
+            cfg = self.config
             results = run_comparison_benchmark(
-                input_width=self.config['input_width'],
-                input_height=self.config['input_height'],
-                scale_factor=self.config['scale_factor'],
-                frame_count=self.config['frame_count']
+                cfg['input_width'], cfg['input_height'], cfg['scale_factor'], cfg['frame_count'],
             )
             
-            self.progress.emit(100)  # Completed
-            self.finished.emit(results)
+            self.signals.progress.emit(100)  # Completed
+            self.signals.finished.emit(results)
         except Exception as e:
             traceback.print_exc()
-            self.error.emit(f"Comparison benchmark error: {str(e)}")
+            self.signals.error.emit(f"Comparison benchmark error: {str(e)}")
 
 class BenchmarkScreen(QWidget):
     def __init__(self):
         super().__init__()
-        self.thread = None
-        self.worker = None
+        self._benchmark_signals = None # Signal holder of the running BenchmarkWorker, kept alive until it reports
         self.results = []
         
         # Main layout
@@ -1807,24 +2395,7 @@ class BenchmarkScreen(QWidget):
         self.results_text.setText("Running benchmark...")
         self.progress_bar.setValue(0)
         
-        # Create worker and thread
-        config = self.get_config()
-        self.worker = BenchmarkWorker(config)
-        self.thread = QThread()
-        
-        # Move worker to thread
-        self.worker.moveToThread(self.thread)
-        
-        # Connect signals
-        self.thread.started.connect(self.worker.run_single_benchmark)
-        self.worker.finished.connect(self.on_benchmark_finished)
-        self.worker.error.connect(self.on_benchmark_error)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-        
-        # Start the thread
-        self.thread.start()
+        self._start_benchmark(BenchmarkWorker(self.get_config()))
     
     def run_comparison_benchmark(self):
         """Run a comparison benchmark across technologies."""
@@ -1835,28 +2406,19 @@ class BenchmarkScreen(QWidget):
         self.results_text.setText("Running comparison benchmark across upscaling technologies...")
         self.progress_bar.setValue(0)
         
-        # Create worker and thread
-        config = self.get_config()
-        self.worker = BenchmarkWorker(config)
-        self.thread = QThread()
-        
-        # Move worker to thread
-        self.worker.moveToThread(self.thread)
-        
-        # Connect signals
-        self.thread.started.connect(self.worker.run_comparison)
-        self.worker.progress.connect(self.progress_bar.setValue)
-        self.worker.finished.connect(self.on_benchmark_finished)
-        self.worker.error.connect(self.on_benchmark_error)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-        
-        # Start the thread
-        self.thread.start()
+        self._start_benchmark(BenchmarkWorker(self.get_config(), comparison=True))
+
+    def _start_benchmark(self, worker):
+        """Run `worker` on the global thread pool; its results arrive queued on the GUI thread."""
+        worker.signals.progress.connect(self.progress_bar.setValue, Qt.QueuedConnection)
+        worker.signals.finished.connect(self.on_benchmark_finished, Qt.QueuedConnection)
+        worker.signals.error.connect(self.on_benchmark_error, Qt.QueuedConnection)
+        self._benchmark_signals = worker.signals
+        QThreadPool.globalInstance().start(worker)
     
     def on_benchmark_finished(self, results):
         """Handle benchmark completion."""
+        self._benchmark_signals = None
         self.results = results
         self.set_ui_running(False)
         
@@ -1875,6 +2437,7 @@ class BenchmarkScreen(QWidget):
     
     def on_benchmark_error(self, error_msg):
         """Handle benchmark errors."""
+        self._benchmark_signals = None
         self.set_ui_running(False)
         self.results_text.setText(f"ERROR: {error_msg}")
     
@@ -1898,7 +2461,6 @@ class BenchmarkScreen(QWidget):
         try:
             plot_benchmark_results(self.results, "Nu Scaler Benchmark Results")
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Plot Error", f"Error plotting results: {str(e)}")
     
     def export_results(self):
@@ -1907,8 +2469,6 @@ class BenchmarkScreen(QWidget):
             return
         
         try:
-            from PySide6.QtWidgets import QFileDialog
-            
             filename, _ = QFileDialog.getSaveFileName(
                 self, "Export Results", "", "CSV Files (*.csv);;Text Files (*.txt);;All Files (*)"
             )
@@ -1921,11 +2481,9 @@ class BenchmarkScreen(QWidget):
             else:
                 self.export_to_text(filename)
                 
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.information(self, "Export", f"Results exported to {filename}")
                 
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Export Error", f"Error exporting results: {str(e)}")
     
     def export_to_csv(self, filename):
@@ -2342,7 +2900,6 @@ class MainWindow(QMainWindow):
         """)
 
     def show_about_dialog(self):
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.information(self, "About Nu_Scaler", "Nu_Scaler is a high-performance upscaling application.")
 
 def run_gui():
@@ -21,7 +21,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import (
     Qt, QTimer, QSize, QThread, Signal, Slot, QEvent, QRect, QPoint, 
     QEasingCurve, QPropertyAnimation, QParallelAnimationGroup, QObject,
-    QFileInfo
+    QFileInfo, QRunnable, QThreadPool
 )
 from PySide6.QtGui import (
     QPixmap, QImage, QColor, QPalette, QIcon, QAction as QGuiAction, 
@@ -550,6 +550,24 @@ QStatusBar::item {{
 }}
 """
 
+class _ImageDecodeSignals(QObject):
+    """Signal holder for ImageDecodeJob (QRunnable is not a QObject)"""
+    done = Signal(str, QImage)  # file path, decoded image (null on failure)
+
+
+class ImageDecodeJob(QRunnable):
+    """Decode an image file on a QThreadPool worker so large files don't block the GUI thread"""
+    
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _ImageDecodeSignals()
+    
+    def run(self):
+        # QImage (unlike QPixmap) may be created outside the GUI thread
+        self.signals.done.emit(self.file_path, QImage(self.file_path))
+
+
 class PreviewPane(QFrame):
     """
     Enhanced widget for displaying original and processed image/video previews
@@ -564,6 +582,10 @@ class PreviewPane(QFrame):
         self.setObjectName("previewPane")
         self.setAcceptDrops(True)
         self.current_file_path = None
+        self._original_image = None  # QImage of the original pixmap, converted once on demand
+        self._scaled_pixmap = None  # Last preview-sized copy of the original pixmap
+        self._pending_decode = None  # (file path, signal to emit) while an image is decoding
+        self._decode_signals = None
         
         # Create layout
         layout = QVBoxLayout(self)
@@ -768,6 +790,8 @@ class PreviewPane(QFrame):
         if pixmap and not pixmap.isNull():
             # Store the original pixmap
             self._original_pixmap = pixmap
+            self._original_image = None
+            self._scaled_pixmap = None
             
             # Create the fade effect
             self.fade_effect = QGraphicsOpacityEffect(self.preview)
@@ -800,6 +824,16 @@ class PreviewPane(QFrame):
             self.info_label.setText("")
             self.export_btn.setEnabled(False)
             self._original_pixmap = None
+            self._original_image = None
+            self._scaled_pixmap = None
+    
+    def originalImage(self):
+        """Return the original pixmap as an ARGB32 QImage, converting it only once per loaded file"""
+        if getattr(self, '_original_pixmap', None) is None:
+            return None
+        if self._original_image is None:
+            self._original_image = self._original_pixmap.toImage().convertToFormat(QImage.Format_ARGB32)
+        return self._original_image
     
     def _restore_shadow(self):
         """Restore the shadow effect after animation completes"""
@@ -814,12 +848,21 @@ class PreviewPane(QFrame):
         if not hasattr(self, '_original_pixmap') or self._original_pixmap is None:
             return
             
-        # Scale pixmap to fit the label while maintaining aspect ratio
-        scaled_pixmap = self._original_pixmap.scaled(
-            self.preview.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        # Scale pixmap to fit the label while maintaining aspect ratio.
+        # Skip the smooth resample when the pixmap already fits exactly, and reuse the last
+        # scaled result while the target size is unchanged.
+        target_size = self._original_pixmap.size().scaled(self.preview.size(), Qt.KeepAspectRatio)
+        if target_size == self._original_pixmap.size():
+            scaled_pixmap = self._original_pixmap
+        elif self._scaled_pixmap is not None and self._scaled_pixmap.size() == target_size:
+            scaled_pixmap = self._scaled_pixmap
+        else:
+            scaled_pixmap = self._original_pixmap.scaled(
+                target_size,
+                Qt.IgnoreAspectRatio,
+                Qt.SmoothTransformation
+            )
+            self._scaled_pixmap = scaled_pixmap
         self.preview.setPixmap(scaled_pixmap)
         # Clear text once we have an image
         self.preview.setText("")
@@ -973,11 +1016,7 @@ class PreviewPane(QFrame):
             
             # Simple check for image files (could be expanded for videos)
             if file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp')):
-                pixmap = QPixmap(file_path)
-                if not pixmap.isNull():
-                    self.current_file_path = file_path
-                    self.setPixmap(pixmap)
-                    self.fileDropped.emit(file_path)
+                self._load_image_async(file_path, self.fileDropped)
             
             event.acceptProposedAction()
     
@@ -992,18 +1031,41 @@ class PreviewPane(QFrame):
         
         if file_path:
             if file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp')):
-                pixmap = QPixmap(file_path)
-                if not pixmap.isNull():
-                    self.current_file_path = file_path
-                    self.setPixmap(pixmap)
-                    self.fileSelected.emit(file_path)
+                self._load_image_async(file_path, self.fileSelected)
             # Video file handling can be added here
     
+    def _load_image_async(self, file_path, notify_signal):
+        """Decode file_path on the global thread pool, then display it and emit notify_signal"""
+        self._pending_decode = (file_path, notify_signal)
+        if getattr(self, '_original_pixmap', None) is None:
+            self.preview.setText(f"Loading {os.path.basename(file_path)}...")
+        job = ImageDecodeJob(file_path)
+        job.signals.done.connect(self._on_image_decoded, Qt.QueuedConnection)
+        self._decode_signals = job.signals  # keep the signal holder alive until delivery
+        QThreadPool.globalInstance().start(job)
+    
+    @Slot(str, QImage)
+    def _on_image_decoded(self, file_path, image):
+        """Show a decoded image on the GUI thread, ignoring results superseded by a newer load"""
+        if self._pending_decode is None or self._pending_decode[0] != file_path:
+            return
+        notify_signal = self._pending_decode[1]
+        self._pending_decode = None
+        self._decode_signals = None
+        if image.isNull():
+            print(f"Warning: could not load image {file_path}")
+            if getattr(self, '_original_pixmap', None) is None:
+                self.preview.setText("Drag & drop an image/video\nor click to select")
+            return
+        self.current_file_path = file_path
+        self.setPixmap(QPixmap.fromImage(image))
+        notify_signal.emit(file_path)
+    
     def mousePressEvent(self, event):
         """Handle mouse press events for file selection dialog"""
         if event.button() == Qt.LeftButton:
-            # Only open dialog if we don't already have an image
-            if not hasattr(self, '_original_pixmap') or self._original_pixmap is None:
+            # Only open dialog if we don't already have an image (or one being decoded)
+            if (not hasattr(self, '_original_pixmap') or self._original_pixmap is None) and self._pending_decode is None:
                 self.open_file_dialog()
         
         super().mousePressEvent(event)
@@ -2736,10 +2798,10 @@ class MainWindow(QMainWindow):
             if hasattr(self.original_pane, '_original_pixmap'):
                 # This is where actual processing would happen
                 # For demo, just create a modified copy of the original
-                processed_pixmap = self.original_pane._original_pixmap.copy()
+                # Start from the cached decoded image instead of copying and converting the pixmap again
+                image = self.original_pane.originalImage().copy()
                 
                 # Apply a simple brightness/contrast adjustment (just for demo)
-                image = processed_pixmap.toImage()
                 for y in range(image.height()):
                     for x in range(image.width()):
                         color = QColor(image.pixel(x, y))
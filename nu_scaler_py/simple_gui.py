@@ -7,7 +7,7 @@ import time
 import traceback
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QLabel, QComboBox, QSlider
+    QPushButton, QLabel, QComboBox, QSlider, QSizePolicy
 )
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPixmap, QImage
@@ -24,6 +24,8 @@ class SimpleNuScalerApp(QMainWindow):
         # Initialize variables
         self.upscaler = None
         self.capture = None
+        self._upscaler_cfg = None
+        self._upscaler_cache = {}
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_frame)
         self.frame_count = 0
@@ -86,6 +88,9 @@ class SimpleNuScalerApp(QMainWindow):
         self.preview_label = QLabel()
         self.preview_label.setAlignment(Qt.AlignCenter)
         self.preview_label.setText("No preview available")
+        # Ignore the pixmap's size hint so per-frame setPixmap calls don't trigger a relayout
+        self.preview_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self.preview_label.setMinimumSize(320, 180)
         
         # Status bar
         self.status_label = QLabel("Ready")
@@ -132,7 +137,13 @@ class SimpleNuScalerApp(QMainWindow):
             # Create upscaler
             quality = self.quality_combo.currentText()
             algorithm = self.algo_combo.currentText()
-            self.upscaler = self.nu_scaler_core.PyWgpuUpscaler(quality, algorithm)
+            # Reuse the upscaler (and its GPU device/pipelines) from a previous run with the same settings
+            key = (quality, algorithm)
+            self.upscaler = self._upscaler_cache.get(key)
+            if self.upscaler is None:
+                self.upscaler = self.nu_scaler_core.PyWgpuUpscaler(quality, algorithm)
+                self._upscaler_cache[key] = self.upscaler
+            self._upscaler_cfg = None
             
             # Create capture
             self.capture = self.nu_scaler_core.PyScreenCapture()
@@ -199,29 +210,25 @@ class SimpleNuScalerApp(QMainWindow):
             out_width = int(width * scale)
             out_height = int(height * scale)
             
-            # Check if we need to reinitialize the upscaler
-            if not hasattr(self, 'last_in_width') or not hasattr(self, 'last_in_height') or \
-               not hasattr(self, 'last_scale') or \
-               self.last_in_width != width or self.last_in_height != height or \
-               abs(self.last_scale - scale) > 0.01:
-                
+            # Only reinitialize the upscaler when the frame size or scale changes
+            cfg = (width, height, out_width, out_height)
+            if cfg != self._upscaler_cfg:
                 self.upscaler.initialize(width, height, out_width, out_height)
-                self.last_in_width = width
-                self.last_in_height = height
-                self.last_scale = scale
+                self._upscaler_cfg = cfg
             
             # Upscale frame
             output_bytes = self.upscaler.upscale(frame_bytes)
             
             # Convert to QImage and display
-            qimg = QImage(output_bytes, out_width, out_height, QImage.Format_RGBA8888)
-            pixmap = QPixmap.fromImage(qimg)
-            self.preview_label.setPixmap(pixmap.scaled(
+            # Wrap the bytes without copying and scale before converting, so only the
+            # preview-sized image is uploaded to a pixmap
+            qimg = QImage(output_bytes, out_width, out_height, 4 * out_width, QImage.Format_RGBA8888)
+            self.preview_label.setPixmap(QPixmap.fromImage(qimg.scaled(
                 self.preview_label.width(), 
                 self.preview_label.height(),
-                Qt.KeepAspectRatio, 
-                Qt.SmoothTransformation
-            ))
+                Qt.KeepAspectRatio,
+                Qt.FastTransformation
+            )))
             
             # Update FPS
             self.frame_count += 1
@@ -245,6 +252,12 @@ class SimpleNuScalerApp(QMainWindow):
             traceback.print_exc()
             self.stop_capture()
 
+    def closeEvent(self, event):
+        """Stop capture and release cached upscalers when the window closes."""
+        self.stop_capture()
+        self._upscaler_cache.clear()
+        super().closeEvent(event)
+
 def main():
     app = QApplication(sys.argv)
     window = SimpleNuScalerApp()
@@ -7,7 +7,7 @@ import time
 import traceback
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QLabel, QComboBox, QSlider, QSpinBox, QCheckBox
+    QPushButton, QLabel, QComboBox, QSlider, QSpinBox, QCheckBox, QSizePolicy
 )
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPixmap, QImage
@@ -105,6 +105,9 @@ class SimpleNuScalerApp(QMainWindow):
         self.preview_label = QLabel()
         self.preview_label.setAlignment(Qt.AlignCenter)
         self.preview_label.setText("No preview available")
+        # Ignore the pixmap's size hint so per-frame setPixmap calls don't trigger a relayout
+        self.preview_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self.preview_label.setMinimumSize(320, 180)
         
         # Status bar
         self.status_label = QLabel("Ready")
@@ -244,14 +247,15 @@ class SimpleNuScalerApp(QMainWindow):
             output_bytes = self.upscaler.upscale(frame_bytes)
             
             # Convert to QImage and display
-            qimg = QImage(output_bytes, out_width, out_height, QImage.Format_RGBA8888)
-            pixmap = QPixmap.fromImage(qimg)
-            self.preview_label.setPixmap(pixmap.scaled(
+            # Wrap the bytes without copying and scale before converting, so only the
+            # preview-sized image is uploaded to a pixmap
+            qimg = QImage(output_bytes, out_width, out_height, 4 * out_width, QImage.Format_RGBA8888)
+            self.preview_label.setPixmap(QPixmap.fromImage(qimg.scaled(
                 self.preview_label.width(), 
                 self.preview_label.height(),
-                Qt.KeepAspectRatio, 
-                Qt.SmoothTransformation
-            ))
+                Qt.KeepAspectRatio,
+                Qt.FastTransformation
+            )))
             
             # Update FPS
             self.frame_count += 1